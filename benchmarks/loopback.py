@@ -0,0 +1,113 @@
+"""
+Замер сетевой игры на локальном интерфейсе: сервер и несколько клиентов в одном процессе.
+
+Запуск из корня репозитория:
+
+    python -m benchmarks.loopback
+    python -m benchmarks.loopback --clients 8 --seconds 20 --asteroids 20 100
+
+Сервер (src/NetServer.py) слушает свободный порт на 127.0.0.1, клиенты (src/NetClient.py)
+управляют кораблями случайно. Для каждого количества астероидов печатаются:
+
+  - входящий и исходящий трафик на клиента (KB/s);
+  - средний размер снимка и размер полного снимка того же тика (сжатие относительно
+    подтвержденного снимка);
+  - время от отправки команды до снимка, в котором она применена (p50/p95, мс);
+  - длительность тика сервера (p50/p95, мс);
+  - среднее расхождение предсказанного клиентом корабля с сервером (пиксели).
+
+Задержки на локальном интерфейсе определяются частотой тиков и снимков, а не сетью.
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from src.NetClient import connect, random_client_policy
+from src.NetServer import start_server
+from src.config import *
+
+
+def percentile(values, fraction):
+    """Возвращает перцентиль списка значений (0, если значений нет)."""
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+async def measure(clients, seconds, asteroids, seed):
+    """
+    Запускает сервер и clients клиентов на seconds секунд.
+
+    Возвращает:
+        dict: Сводка замеров.
+    """
+    params = {"MIN_ASTEROIDS": asteroids, "MAX_ASTEROIDS": asteroids}
+    server = await start_server(NET_HOST, 0, seed=seed, params=params, max_players=max(clients, 1),
+                                compare_full=True)
+    port = server.transport.get_extra_info("sockname")[1]
+    server_task = asyncio.create_task(server.run())
+    players = [await connect(NET_HOST, port, policy=random_client_policy(random.Random(seed + index)))
+               for index in range(clients)]
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await asyncio.gather(*(client.run(seconds) for client in players))
+    elapsed = loop.time() - started
+    snapshots = sum(client.snapshots for client in server.clients.values())
+    sent = sum(client.bytes_sent for client in server.clients.values())
+    server_task.cancel()
+    try:
+        await server_task
+    except asyncio.CancelledError:
+        pass
+    for client in players:
+        client.close()
+    server.close()
+
+    latencies = [latency for client in players for latency in client.latencies]
+    errors = [error for client in players for error in client.prediction_errors]
+    tick_times = list(server.tick_times)
+    return {
+        "down": statistics.mean(client.bytes_received for client in players) / elapsed / 1024,
+        "up": statistics.mean(client.bytes_sent for client in players) / elapsed / 1024,
+        "snapshot": sent / snapshots if snapshots else 0.0,
+        "full": server.full_bytes / snapshots if snapshots else 0.0,
+        "latency_p50": percentile(latencies, 0.5) * 1000,
+        "latency_p95": percentile(latencies, 0.95) * 1000,
+        "tick_p50": percentile(tick_times, 0.5) * 1000,
+        "tick_p95": percentile(tick_times, 0.95) * 1000,
+        "error": statistics.mean(errors) if errors else 0.0,
+        "undecodable": sum(client.undecodable for client in players),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Замер сетевой игры на локальном интерфейсе")
+    parser.add_argument("--clients", type=int, default=4, help="Количество клиентов")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Длительность замера (секунды)")
+    parser.add_argument("--asteroids", type=int, nargs="+", default=[20, 100], help="Количество астероидов")
+    parser.add_argument("--seed", type=int, default=12345, help="Начальное значение генераторов")
+    args = parser.parse_args(argv)
+
+    print(f"{args.clients} client(s), {args.seconds:g} s, snapshot every {NET_SNAPSHOT_INTERVAL} tick(s)")
+    print(f"{'asteroids':>10}{'down KB/s':>11}{'up KB/s':>9}{'snap B':>8}{'full B':>8}"
+          f"{'ack p50':>9}{'ack p95':>9}{'tick p50':>10}{'tick p95':>10}{'error px':>10}")
+    for asteroids in args.asteroids:
+        result = asyncio.run(measure(args.clients, args.seconds, asteroids, args.seed))
+        print(f"{asteroids:>10}{result['down']:>11.1f}{result['up']:>9.2f}{result['snapshot']:>8.0f}"
+              f"{result['full']:>8.0f}{result['latency_p50']:>9.1f}{result['latency_p95']:>9.1f}"
+              f"{result['tick_p50']:>10.2f}{result['tick_p95']:>10.2f}{result['error']:>10.2f}")
+        if result["undecodable"]:
+            print(f"  {result['undecodable']} snapshot(s) dropped: base snapshot missing")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
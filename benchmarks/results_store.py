@@ -0,0 +1,84 @@
+"""
+Замер хранилища результатов игр (src/ResultsStore.py) на большом файле.
+
+Запуск из корня репозитория:
+
+    python -m benchmarks.results_store
+    python -m benchmarks.results_store --games 5000000 --configs 50
+
+Файл заполняется случайными результатами во временной папке, затем измеряются:
+построение индекса просмотром всего файла, открытие хранилища с готовым индексом,
+таблица лучших результатов из индекса и просмотром файла, итоги по параметрам
+и дописывание результата с сохранением индекса.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from src.ResultsStore import HEADER, RECORD, RESULTS_MAGIC, RESULTS_VERSION, GameResult, ResultsStore
+from src.config import *
+
+
+def fill(path, games, configs, seed):
+    """Записывает games случайных результатов с configs наборами параметров напрямую в файл."""
+    rng = random.Random(seed)
+    keys = [rng.getrandbits(32) for _ in range(configs)]
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(RESULTS_MAGIC, RESULTS_VERSION, RECORD.size))
+        for first in range(0, games, 100000):
+            file.write(b"".join(
+                RECORD.pack(1.7e9 + number, number, rng.choice(keys), int(rng.expovariate(1 / 40)),
+                            rng.randint(60, 36000), rng.randint(0, 200), rng.randint(0, LIVES))
+                for number in range(first, min(first + 100000, games))
+            ))
+
+
+def timed(function, repeat=1):
+    """Выполняет функцию repeat раз и возвращает результат последнего вызова и среднее время (секунды)."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return result, (time.perf_counter() - started) / repeat
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Замер хранилища результатов игр")
+    parser.add_argument("--games", type=int, default=1000000, help="Количество записей")
+    parser.add_argument("--configs", type=int, default=20, help="Количество наборов параметров")
+    parser.add_argument("--seed", type=int, default=12345, help="Начальное значение генератора")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "results.dat")
+        _, elapsed = timed(lambda: fill(path, args.games, args.configs, args.seed))
+        print(f"{args.games} records, {os.path.getsize(path) / 1e6:.1f} MB, written in {elapsed:.2f} s")
+
+        store, elapsed = timed(lambda: ResultsStore(path))
+        print(f"index build (full scan):   {elapsed * 1000:10.1f} ms")
+        store.close()
+        store, elapsed = timed(lambda: ResultsStore(path), repeat=20)
+        print(f"open with index:           {elapsed * 1000:10.3f} ms")
+        leaders, elapsed = timed(lambda: store.top_results(RESULTS_LEADERBOARD_SIZE), repeat=1000)
+        print(f"top {RESULTS_LEADERBOARD_SIZE} from index:         {elapsed * 1000:10.3f} ms")
+        scanned, elapsed = timed(lambda: store.top_results(store.top_size + 1))
+        print(f"top {store.top_size + 1} by full scan:      {elapsed * 1000:10.1f} ms")
+        if [result.seed for result in scanned[:len(leaders)]] != [result.seed for result in leaders]:
+            raise SystemExit("index and full scan disagree")
+        stats, elapsed = timed(lambda: store.stats(), repeat=1000)
+        print(f"per-config stats ({len(stats)}):     {elapsed * 1000:10.3f} ms")
+        result = GameResult(time.time(), 0, 0, 10 ** 6, 600, 10, 3)
+        _, elapsed = timed(lambda: (store.append(result), store.save_index()), repeat=100)
+        print(f"append + save index:       {elapsed * 1000:10.3f} ms")
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
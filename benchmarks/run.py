@@ -0,0 +1,444 @@
+"""
+Воспроизводимые бенчмарки обновления объектов, столкновений и отрисовки.
+
+Запуск из корня репозитория:
+
+    python -m benchmarks.run list
+    python -m benchmarks.run run --out baseline.json
+    python -m benchmarks.run run --scenario entities_200x50 --out current.json
+    python -m benchmarks.run compare baseline.json current.json
+
+Каждый сценарий выполняется в отдельном процессе с фиксированным начальным значением
+генератора и измеряется тремя проходами: пропускная способность (тиков в секунду),
+длительности фаз (FrameProfiler) и выделения памяти (tracemalloc). Отрисовка по
+умолчанию идет в заглушку холста; с флагом --tk используется настоящий Tk
+(например, под Xvfb: xvfb-run python -m benchmarks.run run --tk).
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from src.Profiler import FrameProfiler
+from src.SaveState import load_state, save_state
+from src.Simulation import Simulation, INPUT_LEFT, INPUT_RIGHT, INPUT_SHOOT, INPUT_THRUST
+from src.config import *
+
+DEFAULT_TICKS = 600
+DEFAULT_SEED = 12345
+WARMUP_TICKS = 30
+
+
+class EntityScenario:
+    """
+    Сценарий с постоянным количеством объектов: N астероидов и M ракет.
+
+    Корабль вращается и стреляет веером, поддерживая около M ракет; симуляция
+    сама поддерживает N астероидов. Жизни восстанавливаются перед каждым тиком.
+    """
+
+    def __init__(self, asteroids, rockets, brute_force=False, use_store=False):
+        self.asteroids = asteroids
+        self.rockets = rockets
+        self.brute_force = brute_force
+        self.use_store = use_store
+        self.sim = None
+
+    def setup(self, seed):
+        self.sim = Simulation(seed=seed, use_store=self.use_store, rocket_capacity=self.rockets)
+        self.sim.brute_force = self.brute_force
+        self.sim.fire_cooldown = 0
+        self.sim.min_asteroids = self.sim.max_asteroids = self.asteroids
+        self.sim.start()
+
+    def maintain(self):
+        """Подготавливает тик вне измеряемого участка: восстанавливает жизни и доливает ракеты."""
+        sim = self.sim
+        # При сотнях астероидов корабль сталкивается с несколькими за тик: запас жизней растет с их числом
+        sim.lives = max(LIVES, self.asteroids // 50)
+        if sim.ship is None:
+            return
+        sim.ship.rotate(7)
+        burst = -(-self.rockets // ROCKET_LIFETIME)  # Ракет за тик, чтобы держать около M в полете
+        for _ in range(min(burst, self.rockets - len(sim.rockets))):
+            sim.shoot_rocket()
+
+    def tick(self):
+        self.sim.step(0)
+
+    def counters(self):
+        return {"asteroids": len(self.sim.asteroids), "rockets": len(self.sim.rockets)}
+
+
+class SaveStateScenario(EntityScenario):
+    """
+    Сценарий сохранения и загрузки состояния: EntityScenario, в котором измеряемый тик —
+    сохранение состояния (src/SaveState.py) и его загрузка обратно в ту же симуляцию.
+    Сама симуляция продвигается вне измеряемого участка.
+    """
+
+    def maintain(self):
+        super().maintain()
+        self.sim.step(0)
+
+    def tick(self):
+        load_state(save_state(self.sim), self.sim)
+
+
+class ChurnScenario:
+    """
+    Сценарий полной игры: случайное управление со стрельбой, появление, взрывы и удаление
+    объектов. После окончания игры сразу начинается новая.
+    """
+
+    def __init__(self):
+        self.sim = None
+        self.seed = None
+        self.games = 0
+        self.rng = None
+
+    def setup(self, seed):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.games = 0
+        self.new_game()
+
+    def new_game(self):
+        profiler = self.sim.profiler if self.sim else None
+        self.sim = Simulation(seed=self.seed + self.games)
+        self.sim.profiler = profiler
+        self.sim.start()
+        self.games += 1
+
+    def maintain(self):
+        if not self.sim.running:
+            self.new_game()
+
+    def tick(self):
+        inputs = self.rng.choice((0, INPUT_LEFT, INPUT_RIGHT, INPUT_THRUST)) | INPUT_SHOOT
+        self.sim.step(inputs)
+
+    def counters(self):
+        return {"games": self.games}
+
+
+class RenderScenario(EntityScenario):
+    """
+    Сценарий отрисовки: EntityScenario плюс отрисовка через Game.render выбранным
+    способом (см. src/Renderer.py) на заданном уровне качества (без автоматической смены).
+    В заглушке холста изображения не выводятся, поэтому без --tk измеряется подготовка
+    кадра, но не рисование средствами Tk.
+    """
+
+    def __init__(self, asteroids, rockets, use_tk=False, renderer="canvas", quality=QUALITY_LEVEL, tcl=False,
+                 batch=CANVAS_BATCH_COMMANDS):
+        super().__init__(asteroids, rockets)
+        self.use_tk = use_tk
+        self.renderer = renderer
+        self.quality = quality
+        self.tcl = tcl
+        self.batch = batch
+        self.game = None
+        self.root = None
+
+    def setup(self, seed):
+        from src.RotationCache import rotation_cache
+        from src.Game import Game
+        from src.Renderer import CanvasRenderer, create_renderer
+        from benchmarks.stubs import StubCanvas, StubPhotoImage, StubRoot, TclCanvas
+
+        rotation_cache.clear()
+        if self.use_tk:
+            import tkinter as tk
+            self.root = tk.Tk()
+            self.game = Game(self.root, background_loading=False)
+        else:
+            from PIL import ImageTk
+            ImageTk.PhotoImage = StubPhotoImage  # Процесс сценария отдельный, подмена не утекает
+            self.root = StubRoot()
+            canvas = TclCanvas() if self.tcl else StubCanvas()
+            self.game = Game(self.root, canvas=canvas, background_loading=False)
+        super().setup(seed)
+        self.game.sim = self.sim
+        if self.renderer == "canvas":
+            self.game.renderer = CanvasRenderer(self.game.canvas, self.game.hud, batch=self.batch)
+        else:
+            self.game.renderer = create_renderer(self.renderer, self.game.canvas, self.game.hud)
+        self.game.governor.set_level(self.quality)
+        self.game.governor.adaptive = False
+
+    def tick(self):
+        self.sim.step(0)
+        profiler = self.sim.profiler
+        if profiler:
+            profiler.restart()
+        self.game.render()
+        if self.use_tk:
+            self.root.update_idletasks()
+        if profiler:
+            profiler.mark("render")
+
+    def counters(self):
+        counters = super().counters()
+        counters["canvas_items"] = len(self.game.canvas.find_all())
+        if not self.use_tk:
+            counters["canvas_calls"] = self.game.canvas.calls  # Для TclCanvas — команды, дошедшие до Tcl
+        return counters
+
+
+def build_scenarios(use_tk=False):
+    """
+    Возвращает словарь сценариев по имени.
+
+    Аргументы:
+        use_tk (bool): Отрисовывать в настоящий Tk вместо заглушки холста.
+    """
+    scenarios = {}
+    for asteroids, rockets in ((10, 0), (100, 20), (200, 50), (500, 100)):
+        scenarios[f"entities_{asteroids}x{rockets}"] = lambda a=asteroids, r=rockets: EntityScenario(a, r)
+    scenarios["entities_brute_200x50"] = lambda: EntityScenario(200, 50, brute_force=True)
+    scenarios["entities_store_200x50"] = lambda: EntityScenario(200, 50, use_store=True)
+    scenarios["churn"] = ChurnScenario
+    for asteroids, rockets in ((100, 20), (500, 100)):
+        scenarios[f"state_{asteroids}x{rockets}"] = lambda a=asteroids, r=rockets: SaveStateScenario(a, r)
+    for asteroids in (10, 100, 1000):
+        scenarios[f"render_{asteroids}x20"] = lambda a=asteroids: RenderScenario(a, 20, use_tk=use_tk)
+        for renderer in ("framebuffer", "null"):
+            scenarios[f"render_{renderer}_{asteroids}x20"] = (
+                lambda a=asteroids, r=renderer: RenderScenario(a, 20, use_tk=use_tk, renderer=r)
+            )
+        scenarios[f"render_direct_{asteroids}x20"] = lambda a=asteroids: RenderScenario(a, 20, use_tk=use_tk, batch=False)
+        if not use_tk:
+            # Обращения к Tcl без дисплея: команды холста одним вызовом за кадр и по одной
+            scenarios[f"render_tcl_{asteroids}x20"] = lambda a=asteroids: RenderScenario(a, 20, tcl=True)
+            scenarios[f"render_tcl_direct_{asteroids}x20"] = (
+                lambda a=asteroids: RenderScenario(a, 20, tcl=True, batch=False)
+            )
+        for quality in ("medium", "low"):
+            scenarios[f"render_{quality}_{asteroids}x20"] = (
+                lambda a=asteroids, q=quality: RenderScenario(a, 20, use_tk=use_tk, quality=q)
+            )
+    return scenarios
+
+
+def peak_rss_kb():
+    """Возвращает пиковый объем резидентной памяти процесса в КБ (None, если недоступно)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # macOS возвращает байты
+
+
+def run_ticks(scenario, ticks, profiler=None):
+    """
+    Выполняет тики сценария и возвращает суммарное время самих тиков в секундах.
+    """
+    elapsed = 0.0
+    for _ in range(ticks):
+        scenario.maintain()
+        if profiler:
+            profiler.begin_frame()
+        started = time.perf_counter()
+        scenario.tick()
+        elapsed += time.perf_counter() - started
+        if profiler:
+            profiler.end_frame()
+    return elapsed
+
+
+def measure(name, ticks, seed, use_tk=False):
+    """
+    Измеряет один сценарий тремя проходами с одинаковым начальным значением генератора.
+
+    Возвращает:
+        dict: Результаты сценария.
+    """
+    make = build_scenarios(use_tk)[name]
+    # Проход 1: пропускная способность
+    scenario = make()
+    scenario.setup(seed)
+    run_ticks(scenario, WARMUP_TICKS)
+    elapsed = run_ticks(scenario, ticks)
+    counters = scenario.counters()
+
+    # Проход 2: длительности фаз
+    scenario = make()
+    scenario.setup(seed)
+    profiler = FrameProfiler(window=ticks)
+    profiler.enabled = True
+    scenario.sim.profiler = profiler
+    run_ticks(scenario, WARMUP_TICKS)
+    profiler = FrameProfiler(window=ticks)
+    profiler.enabled = True
+    scenario.sim.profiler = profiler
+    run_ticks(scenario, ticks, profiler)
+
+    # Проход 3: выделения памяти
+    tracemalloc.start()
+    scenario = make()
+    scenario.setup(seed)
+    baseline, _ = tracemalloc.get_traced_memory()
+    run_ticks(scenario, ticks)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    phases = {}
+    for phase in profiler.PHASES:
+        p50, p95, p99 = profiler.percentiles(phase)
+        if p99 > 0:
+            phases[phase] = {"p50": round(p50, 4), "p95": round(p95, 4), "p99": round(p99, 4)}
+
+    return {
+        "ticks": ticks,
+        "seed": seed,
+        "ticks_per_sec": round(ticks / elapsed, 1) if elapsed else None,
+        "phases_ms": phases,
+        "tracemalloc": {"net_bytes": current - baseline, "peak_bytes": peak - baseline},
+        "peak_rss_kb": peak_rss_kb(),
+        "final_counters": counters,
+    }
+
+
+def _measure_task(args):
+    return measure(*args)
+
+
+def run(names, ticks, seed, use_tk=False, in_process=False):
+    """
+    Выполняет сценарии, каждый в отдельном процессе, чтобы пиковая память не смешивалась.
+
+    Возвращает:
+        dict: Результаты с метаданными запуска.
+    """
+    results = {}
+    for name in names:
+        print(f"{name}...", file=sys.stderr, flush=True)
+        task = (name, ticks, seed, use_tk)
+        if in_process:
+            results[name] = measure(*task)
+        else:
+            context = multiprocessing.get_context("spawn")
+            with context.Pool(1, maxtasksperchild=1) as pool:
+                results[name] = pool.apply(_measure_task, (task,))
+        print(f"  {results[name]['ticks_per_sec']} ticks/sec", file=sys.stderr)
+
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "numpy": numpy_version,
+            "renderer": "tk" if use_tk else "stub",
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "scenarios": results,
+    }
+
+
+def compare(baseline, current, threshold):
+    """
+    Сравнивает результаты с базовыми и возвращает список регрессий.
+
+    Регрессией считается падение ticks_per_sec, рост p95 любой фазы или рост пика
+    tracemalloc больше чем на долю threshold.
+    """
+    regressions = []
+    rows = []
+    for name, base in baseline["scenarios"].items():
+        cur = current["scenarios"].get(name)
+        if cur is None:
+            continue
+        checks = [("ticks_per_sec", base["ticks_per_sec"], cur["ticks_per_sec"], False)]
+        for phase, stats in base["phases_ms"].items():
+            if phase in cur["phases_ms"]:
+                checks.append((f"{phase}.p95_ms", stats["p95"], cur["phases_ms"][phase]["p95"], True))
+        checks.append(("tracemalloc.peak_bytes", base["tracemalloc"]["peak_bytes"],
+                       cur["tracemalloc"]["peak_bytes"], True))
+
+        for metric, old, new, higher_is_worse in checks:
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            worse = change > threshold if higher_is_worse else change < -threshold
+            rows.append((name, metric, old, new, change, worse))
+            if worse:
+                regressions.append((name, metric, old, new, change))
+
+    for name, metric, old, new, change, worse in rows:
+        flag = "REGRESSION" if worse else ""
+        print(f"{name:<24}{metric:<26}{old:>14.4g}{new:>14.4g}{change:>+9.1%}  {flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарки Asteroids")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="Показать доступные сценарии")
+    list_parser.add_argument("--tk", action="store_true", help="Сценарии для настоящего Tk")
+
+    run_parser = commands.add_parser("run", help="Выполнить сценарии и записать результаты в JSON")
+    run_parser.add_argument("--scenario", action="append", help="Имя сценария (можно повторять)")
+    run_parser.add_argument("--ticks", type=int, default=DEFAULT_TICKS, help="Количество измеряемых тиков")
+    run_parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Начальное значение генератора")
+    run_parser.add_argument("--out", help="Файл для результатов (по умолчанию stdout)")
+    run_parser.add_argument("--tk", action="store_true", help="Отрисовывать в настоящий Tk (нужен дисплей)")
+    run_parser.add_argument("--in-process", action="store_true", help="Не запускать сценарии в отдельных процессах")
+
+    compare_parser = commands.add_parser("compare", help="Сравнить результаты с базовыми")
+    compare_parser.add_argument("baseline", help="JSON с базовыми результатами")
+    compare_parser.add_argument("current", help="JSON с текущими результатами")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="Допустимое ухудшение (доля)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for name in build_scenarios(args.tk):
+            print(name)
+        return 0
+
+    if args.command == "run":
+        scenarios = build_scenarios(args.tk)
+        names = args.scenario or list(scenarios)
+        unknown = [name for name in names if name not in scenarios]
+        if unknown:
+            parser.error(f"unknown scenario: {', '.join(unknown)}")
+        results = run(names, args.ticks, args.seed, args.tk, args.in_process)
+        text = json.dumps(results, indent=2, ensure_ascii=False)
+        if args.out:
+            with open(args.out, "w") as file:
+                file.write(text + "\n")
+        else:
+            print(text)
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.current) as file:
+        current = json.load(file)
+    regressions = compare(baseline, current, args.threshold)
+    print(f"{len(regressions)} regression(s)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
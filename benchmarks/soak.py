@@ -0,0 +1,113 @@
+"""
+Проверка длительной игрой: память не должна расти без предела.
+
+Запуск из корня репозитория:
+
+    python -m benchmarks.soak
+    python -m benchmarks.soak --frames 100000 --renderer framebuffer --trace-memory --out soak.json
+
+Игра отрисовывается в заглушку холста (benchmarks/stubs.py) без дисплея. Корабль управляется
+случайно и стреляет, после окончания игры сразу начинается новая, поэтому объекты постоянно
+появляются, взрываются и удаляются. Каждые MEMORY_SAMPLE_INTERVAL кадров MemoryMonitor
+записывает живые изображения, элементы холста, спрайты способа отрисовки и объекты
+интерпретатора; рост относительно базового замера сравнивается с MEMORY_SOAK_LIMITS.
+
+Завершается с кодом 1, если хотя бы один счетчик вырос больше допустимого.
+"""
+import argparse
+import os
+import random
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from src.MemoryMonitor import MemoryMonitor
+from src.Simulation import Simulation, INPUT_LEFT, INPUT_RIGHT, INPUT_SHOOT, INPUT_THRUST
+from src.config import *
+
+DEFAULT_FRAMES = 36000  # Десять минут игры при 60 кадрах в секунду
+DEFAULT_SEED = 12345
+
+
+def create_game(renderer):
+    """
+    Создает игру на заглушках tkinter с загруженными спрайтами и выбранным способом отрисовки.
+
+    Аргументы:
+        renderer (str): Способ отрисовки (RENDERER в config.py).
+
+    Возвращает:
+        Game: Игра, готовая к отрисовке.
+    """
+    from PIL import ImageTk
+    from benchmarks.stubs import StubCanvas, StubPhotoImage, StubRoot
+    from src.Renderer import create_renderer
+
+    ImageTk.PhotoImage = StubPhotoImage  # Скрипт запускается отдельным процессом, подмена не утекает
+    from src.Game import Game
+
+    game = Game(StubRoot(), canvas=StubCanvas(), background_loading=False)
+    game.renderer = create_renderer(renderer, game.canvas, game.hud)
+    if game.renderer.opaque:
+        game.starfield.remove()
+    return game
+
+
+def soak(frames, seed, renderer="canvas", trace=False, out=None):
+    """
+    Играет случайными нажатиями frames кадров (по тику на кадр) и следит за памятью.
+
+    Возвращает:
+        MemoryMonitor: Монитор с замерами и превышениями.
+    """
+    game = create_game(renderer)
+    if trace:
+        MemoryMonitor.start_tracing()
+    game.memory = MemoryMonitor(strict=True)
+    game.memory_dump_path = out
+    game.enable_memory_sampling()
+
+    rng = random.Random(seed)
+    games = 0
+    for _ in range(frames):
+        if not game.sim.running:
+            games += 1
+            game.sim = Simulation(seed=seed + games)
+            game.sim.start()
+        inputs = rng.choice((0, INPUT_LEFT, INPUT_RIGHT, INPUT_THRUST)) | INPUT_SHOOT
+        game.sim.step(inputs)
+        game.render()
+        if game.memory.due(game.frame_number):
+            game.sample_memory()
+    if out:
+        game.memory.dump(out)
+    print(f"{frames} frames, {games} games, {game.memory.recorded} samples")
+    return game.memory
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Проверка роста памяти длительной игрой")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="Количество кадров")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Начальное значение генераторов")
+    parser.add_argument("--renderer", default=RENDERER, help="Способ отрисовки: canvas, framebuffer, null")
+    parser.add_argument("--trace-memory", action="store_true", help="Включить tracemalloc (медленнее)")
+    parser.add_argument("--out", help="JSON-файл для замеров")
+    args = parser.parse_args(argv)
+
+    memory = soak(args.frames, args.seed, args.renderer, args.trace_memory, args.out)
+    growth = memory.growth()
+    for name in sorted(growth):
+        print(f"  {name:<18}{memory.baseline[name]:>10}{growth[name]:>+10}  peak {memory.peaks[name]}")
+    for allocation in memory.top_allocations:
+        print(f"  {allocation['kb']:10.1f} KB {allocation['blocks']:8}  {allocation['where']}")
+    if memory.failed:
+        for violation in memory.violations:
+            print(f"FAILED: {violation}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+Заглушки tkinter для бенчмарков отрисовки без дисплея.
+
+StubCanvas повторяет методы tk.Canvas, которые использует игра, и считает вызовы,
+чтобы путь отрисовки можно было измерить на сервере без X. TclCanvas выполняет
+настоящие методы tk.Canvas в интерпретаторе Tcl без Tk, чтобы измерить переходы
+из Python в Tcl. StubPhotoImage подменяет ImageTk.PhotoImage, которому для работы
+нужен интерпретатор Tk.
+"""
+import tkinter
+import weakref
+
+
+class StubPhotoImage:
+    """
+    Заглушка ImageTk.PhotoImage: хранит исходное изображение и выдает уникальное имя.
+    Живые заглушки перечисляет StubCanvas.image_names, как Tk — свои изображения.
+    """
+
+    created = 0
+    live = weakref.WeakSet()
+
+    def __init__(self, image=None, **kwargs):
+        StubPhotoImage.created += 1
+        StubPhotoImage.live.add(self)
+        self.image = image
+        self.name = f"pyimage{StubPhotoImage.created}"
+
+    def __str__(self):
+        return self.name
+
+    def paste(self, image, box=None):
+        self.image = image
+
+    def width(self):
+        return self.image.size[0] if self.image is not None else 0
+
+    def height(self):
+        return self.image.size[1] if self.image is not None else 0
+
+
+class StubCanvas:
+    """
+    Заглушка tk.Canvas.
+
+    Атрибуты:
+        items (dict): Параметры элементов по идентификатору.
+        calls (int): Количество вызовов методов холста (аналог обращений к Tcl).
+        tk: Заглушка интерпретатора: call считается одним вызовом (см. CommandBuffer).
+    """
+
+    def __init__(self):
+        self.items = {}
+        self.calls = 0
+        self.next_id = 0
+        self.tk = self
+
+    def __str__(self):
+        return ".stub"
+
+    def eval(self, script):
+        pass
+
+    def call(self, *args):
+        self.calls += 1
+
+    def _create(self, kind, *coords, **options):
+        self.calls += 1
+        self.next_id += 1
+        self.items[self.next_id] = dict(options, kind=kind, coords=coords)
+        return self.next_id
+
+    def create_image(self, *coords, **options):
+        return self._create("image", *coords, **options)
+
+    def create_text(self, *coords, **options):
+        return self._create("text", *coords, **options)
+
+    def create_rectangle(self, *coords, **options):
+        return self._create("rectangle", *coords, **options)
+
+    def create_oval(self, *coords, **options):
+        return self._create("oval", *coords, **options)
+
+    def itemconfig(self, item, **options):
+        self.calls += 1
+        if item in self.items:
+            self.items[item].update(options)
+
+    itemconfigure = itemconfig
+
+    def coords(self, item, *coords):
+        self.calls += 1
+        if coords and item in self.items:
+            self.items[item]["coords"] = coords
+
+    def move(self, tag, dx, dy):
+        self.calls += 1
+
+    def delete(self, *items):
+        self.calls += 1
+        for item in items:
+            self.items.pop(item, None)
+
+    def tag_raise(self, *args):
+        self.calls += 1
+
+    def tag_lower(self, *args):
+        self.calls += 1
+
+    def tag_bind(self, *args, **kwargs):
+        pass
+
+    def find_all(self):
+        return tuple(self.items)
+
+    def image_names(self):
+        return tuple(str(photo) for photo in StubPhotoImage.live)
+
+    def pack(self, **kwargs):
+        pass
+
+
+class TclCanvas(tkinter.Canvas):
+    """
+    Холст без дисплея, на котором методы tk.Canvas выполняются без изменений: с разбором
+    аргументов в Python и переходом в интерпретатор Tcl. Команду виджета заменяет процедура
+    Tcl, которая только выдает идентификаторы новых элементов, поэтому измеряются
+    затраты на обращения из Python в Tcl, но не работа самого Tk.
+
+    Атрибуты:
+        calls (int): Количество команд, дошедших до виджета (в том числе из процедур Tcl).
+    """
+
+    def __init__(self):
+        # Canvas.__init__ не вызывается: ему нужно окно Tk
+        self.tk = tkinter.Tcl().tk
+        self._w = ".canvas"
+        self.tk.eval("""
+            set ::calls 0
+            set ::items {}
+            proc .canvas {command args} {
+                incr ::calls
+                switch -- $command {
+                    create { lappend ::items [llength $::items]; return [llength $::items] }
+                    find { return $::items }
+                }
+            }
+        """)
+
+    @property
+    def calls(self):
+        return int(self.tk.eval("set ::calls"))
+
+    def pack(self, **kwargs):
+        pass
+
+
+class StubRoot:
+    """Заглушка корневого окна: принимает привязки клавиш и таймеры, но не выполняет их."""
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def after(self, delay, callback=None, *args):
+        return "after#stub"
+
+    def after_cancel(self, *args):
+        pass
@@ -0,0 +1,109 @@
+import os
+
+from src.config import *
+
+# Папка модулей игры: относительная папка спрайтов отсчитывается от нее, а не от текущей папки
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class AssetManager:
+    """
+    Класс AssetManager загружает спрайты игры и раздает их общие копии всем объектам.
+
+    Каждый файл декодируется с диска один раз, а масштабированные варианты и
+    PhotoImage создаются один раз для каждой пары (файл, размер). Загрузка и
+    масштабирование не обращаются к Tk и могут выполняться в фоновом потоке
+    (см. Preloader); PhotoImage создаются только в потоке Tk. PIL импортируется
+    при первой загрузке, а не при импорте модуля.
+
+    Атрибуты:
+        folder (str): Полный путь к папке, где хранятся файлы спрайтов.
+        images (dict): Декодированные исходные изображения по имени файла.
+        scaled (dict): Масштабированные изображения по ключу (файл, размер).
+        photos (dict): Изображения PhotoImage по ключу (файл, размер).
+    """
+
+    def __init__(self, folder=SPRITE_FOLDER):
+        """
+        Инициализация объекта AssetManager.
+
+        Аргументы:
+            folder (str): Папка, где хранятся файлы спрайтов (относительный путь — от папки src).
+        """
+        self.folder = os.path.join(SRC_DIR, folder)
+        self.images = {}
+        self.scaled = {}
+        self.photos = {}
+
+    def load(self, filename):
+        """
+        Возвращает декодированное изображение из файла, читая его с диска только один раз.
+
+        Аргументы:
+            filename (str): Имя файла спрайта.
+
+        Возвращает:
+            PIL.Image: Исходное изображение.
+        """
+        image = self.images.get(filename)
+        if image is None:
+            from PIL import Image
+
+            image = Image.open(os.path.join(self.folder, filename))
+            image.load()  # Декодируем сразу, а не при первом обращении к пикселям
+            self.images[filename] = image
+        return image
+
+    def preload(self, filenames):
+        """
+        Заранее декодирует перечисленные файлы.
+
+        Аргументы:
+            filenames (iterable): Имена файлов спрайтов.
+        """
+        for filename in filenames:
+            self.load(filename)
+
+    def get_scaled(self, filename, size):
+        """
+        Возвращает общее масштабированное изображение.
+
+        Аргументы:
+            filename (str): Имя файла спрайта.
+            size (tuple): Размер (ширина, высота) в пикселях.
+
+        Возвращает:
+            PIL.Image: Масштабированное изображение.
+        """
+        key = (filename, size)
+        image = self.scaled.get(key)
+        if image is None:
+            from PIL import Image
+
+            image = self.load(filename).resize(size, Image.Resampling.LANCZOS)
+            self.scaled[key] = image
+        return image
+
+    def get_photo(self, filename, size):
+        """
+        Возвращает общий PhotoImage масштабированного изображения.
+
+        Аргументы:
+            filename (str): Имя файла спрайта.
+            size (tuple): Размер (ширина, высота) в пикселях.
+
+        Возвращает:
+            ImageTk.PhotoImage: Изображение для отображения на холсте.
+        """
+        key = (filename, size)
+        photo = self.photos.get(key)
+        if photo is None:
+            from PIL import ImageTk
+
+            photo = ImageTk.PhotoImage(self.get_scaled(filename, size))
+            self.photos[key] = photo
+        return photo
+
+
+# Общий менеджер спрайтов для всех объектов игры
+assets = AssetManager()
@@ -1,16 +1,20 @@
 import random
-from PIL import Image, ImageTk
-import os
+
+from src.EntityStore import FLAG_DESTROYED, FLAG_EXPLODING, store_view
+from src.Log import DEBUG, log
 from src.config import *
 
+explosion_log = log.channel("explosion")
+
 
 class Asteroid:
     """
     Класс Asteroid представляет игровой астероид с возможностью перемещения, вращения
-    и отображения анимации взрыва.
+    и анимации взрыва. Класс хранит только состояние симуляции; отрисовкой
+    занимается Game.
 
     Атрибуты:
-        canvas (Canvas): Холст для отображения астероида.
+        id (int): Идентификатор астероида, назначаемый симуляцией.
         x (float): Текущая координата x астероида.
         y (float): Текущая координата y астероида.
         velocity_x (float): Скорость по оси x.
@@ -19,83 +23,105 @@ class Asteroid:
         destroyed (bool): Флаг уничтожения астероида.
         angular_speed (float): Скорость вращения астероида.
         angle (float): Текущий угол поворота астероида.
-        original_image (PIL.Image): Оригинальное изображение астероида.
-        image (ImageTk.PhotoImage): Текущее изображение для отображения на холсте.
-        sprite_id (int): Идентификатор спрайта на холсте.
-        explosion_images (list): Список изображений для анимации взрыва.
         exploding (bool): Флаг начала анимации взрыва.
         explosion_timer (int): Таймер для управления анимацией взрыва.
+        store (EntityStore): Хранилище, в строке которого лежит состояние (None — в самом объекте).
+        row (int): Номер строки в хранилище.
     """
 
-    def __init__(self, canvas, x, y, dx, dy):
+    store = None
+    row = None
+
+    def __init__(self, x, y, dx, dy, rng=random):
         """
         Инициализация объекта Asteroid.
 
         Аргументы:
-            canvas (Canvas): Холст для отрисовки астероида.
             x (float): Начальная координата x.
             y (float): Начальная координата y.
             dx (float): Скорость по оси x.
             dy (float): Скорость по оси y.
+            rng (random.Random): Генератор случайных чисел для размера и вращения.
+        """
+        self.id = None
+        self.reset(x, y, dx, dy, rng)
+
+    def reset(self, x, y, dx, dy, rng=random):
+        """
+        Заново инициализирует астероид для повторного использования (см. ObjectPool).
+
+        Аргументы:
+            x (float): Начальная координата x.
+            y (float): Начальная координата y.
+            dx (float): Скорость по оси x.
+            dy (float): Скорость по оси y.
+            rng (random.Random): Генератор случайных чисел для размера и вращения.
         """
-        self.canvas = canvas
         self.x = x
         self.y = y
         self.velocity_x = dx
         self.velocity_y = dy
-        self.radius = random.randint(20, 40)
+        self.radius = rng.randint(20, 40)
         self.destroyed = False
 
         # Скорость вращения и начальный угол
-        self.angular_speed = random.uniform(-2, 2)
-        self.angle = random.uniform(0, 360)
-
-        # Загрузка изображения астероида
-        original_asteroid_image = Image.open(os.path.join(SPRITE_FOLDER, "asteroid_old.png"))
-        scaled_image = original_asteroid_image.resize(
-            (self.radius * 2, self.radius * 2), Image.Resampling.LANCZOS
-        )
-        self.original_image = scaled_image
-        self.image = ImageTk.PhotoImage(self.original_image)
-        self.sprite_id = self.canvas.create_image(self.x, self.y, image=self.image)
-
-        # Загрузка изображений для анимации взрыва
-        explosion_1_path = os.path.join(SPRITE_FOLDER, "explosion1.png")
-        explosion_2_path = os.path.join(SPRITE_FOLDER, "explosion2.png")
-        self.explosion_images = [
-            ImageTk.PhotoImage(Image.open(explosion_1_path).resize((self.radius * 2, self.radius * 2))),
-            ImageTk.PhotoImage(Image.open(explosion_2_path).resize((self.radius * 2, self.radius * 2))),
-        ]
+        self.angular_speed = rng.uniform(-2, 2)
+        self.angle = rng.uniform(0, 360)
 
         self.exploding = False
         self.explosion_timer = 0
 
-    def update(self):
+    @staticmethod
+    def bucket_radius(radius, bucket=ASTEROID_RADIUS_BUCKET):
+        """
+        Привязывает радиус спрайта к ближайшему кратному шагу значению, чтобы астероиды
+        близких размеров использовали один и тот же вариант спрайта. Радиус астероида
+        для столкновений не привязывается.
+
+        Аргументы:
+            radius (int): Исходный радиус.
+            bucket (int): Шаг привязки; 0 или 1 отключают привязку.
+
+        Возвращает:
+            int: Радиус после привязки.
+        """
+        if bucket <= 1:
+            return radius
+        return max(bucket, int(round(radius / bucket)) * bucket)
+
+    def update(self, dt=1):
         """
         Обновляет состояние астероида: либо выполняет анимацию взрыва,
         либо обновляет его позицию и вращение.
+
+        Аргументы:
+            dt (int): Длительность шага в тиках.
         """
         if self.exploding:
-            self.handle_explosion()
+            self.handle_explosion(dt)
         elif not self.destroyed:
-            self.update_position_and_rotation()
+            self.update_position_and_rotation(dt)
 
-    def update_position_and_rotation(self):
-        """
-        Обновляет позицию и угол поворота астероида, а также перерисовывает его.
+    def update_position_and_rotation(self, dt=1):
         """
-        # Обновление позиции
-        self.x = (self.x + self.velocity_x) % SCREEN_WIDTH
-        self.y = (self.y + self.velocity_y) % SCREEN_HEIGHT
+        Обновляет позицию и угол поворота астероида. Шаг в несколько тиков выполняется
+        по тикам, чтобы координаты точно совпадали с пошаговым прогоном.
 
-        # Обновление угла вращения
-        self.angle = (self.angle + self.angular_speed) % 360
-        rotated_image = self.original_image.rotate(self.angle, resample=Image.Resampling.BICUBIC)
-        self.image = ImageTk.PhotoImage(rotated_image)
-        self.canvas.itemconfig(self.sprite_id, image=self.image)
+        Если астероид привязан к EntityStore, позиция и угол уже обновлены хранилищем.
 
-        # Перемещение на холсте
-        self.canvas.coords(self.sprite_id, self.x, self.y)
+        Аргументы:
+            dt (int): Длительность шага в тиках.
+        """
+        if self.store is None:
+            x, y, angle = self.x, self.y, self.angle
+            for _ in range(dt):
+                # Обновление позиции
+                x = (x + self.velocity_x) % SCREEN_WIDTH
+                y = (y + self.velocity_y) % SCREEN_HEIGHT
+
+                # Обновление угла вращения
+                angle = (angle + self.angular_speed) % 360
+            self.x, self.y, self.angle = x, y, angle
 
     def start_explosion(self, mark_as_killer=False):
         """
@@ -105,26 +131,38 @@ class Asteroid:
             mark_as_killer (bool): Если True, астероид остается "живым" для других проверок
                                    во время анимации взрыва.
         """
-        print(f"Asteroid {self.sprite_id} starting explosion.")
+        if explosion_log.level <= DEBUG:
+            explosion_log.debug("Asteroid %s starting explosion.", self.id)
         self.exploding = True
         self.explosion_timer = 0
-        self.canvas.itemconfig(self.sprite_id, image=self.explosion_images[0])
 
         if not mark_as_killer:
             self.destroyed = True
 
-    def handle_explosion(self):
+    def handle_explosion(self, dt=1):
         """
         Управляет анимацией взрыва астероида.
+
+        Аргументы:
+            dt (int): Длительность шага в тиках.
         """
-        print(f"Asteroid {self.sprite_id} exploding. Timer: {self.explosion_timer}")
-        self.explosion_timer += 1
-
-        if self.explosion_timer == 10:
-            print(f"Asteroid {self.sprite_id} switching to second explosion frame.")
-            self.canvas.itemconfig(self.sprite_id, image=self.explosion_images[1])
-        elif self.explosion_timer >= 20:
-            print(f"Asteroid {self.sprite_id} explosion complete.")
+        if explosion_log.level <= DEBUG:
+            explosion_log.debug("Asteroid %s exploding. Timer: %s", self.id, self.explosion_timer)
+        self.explosion_timer += dt
+
+        if self.explosion_timer - dt < 10 <= self.explosion_timer < ASTEROID_EXPLOSION_TICKS:
+            if explosion_log.level <= DEBUG:
+                explosion_log.debug("Asteroid %s switching to second explosion frame.", self.id)
+        elif self.explosion_timer >= ASTEROID_EXPLOSION_TICKS:
+            if explosion_log.level <= DEBUG:
+                explosion_log.debug("Asteroid %s explosion complete.", self.id)
             self.exploding = False
             self.destroyed = True
 
+
+# Астероид, состояние которого хранится в строке EntityStore
+AsteroidView = store_view(
+    Asteroid,
+    ("x", "y", "velocity_x", "velocity_y", "angle", "angular_speed", "radius", "explosion_timer"),
+    {"destroyed": FLAG_DESTROYED, "exploding": FLAG_EXPLODING},
+)
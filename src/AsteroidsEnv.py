@@ -0,0 +1,506 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен для игры, но нужен для сред обучения
+    np = None
+
+from src.Simulation import Simulation, INPUT_LEFT, INPUT_RIGHT, INPUT_SHOOT, INPUT_THRUST
+from src.config import *
+
+ACTION_COUNT = 16  # Действие — битовая маска INPUT_* (0..15)
+SHIP_FEATURES = 8  # Признаки корабля в начале наблюдения
+ASTEROID_FEATURES = 6  # Признаки каждого из ближайших астероидов
+
+
+def observation_size(observation=ENV_OBSERVATION):
+    """
+    Возвращает длину вектора наблюдения.
+
+    Аргументы:
+        observation (str): Вид наблюдения: "nearest" или "grid".
+    """
+    if observation == "nearest":
+        return SHIP_FEATURES + ENV_NEAREST_ASTEROIDS * ASTEROID_FEATURES
+    if observation == "grid":
+        return SHIP_FEATURES + ENV_GRID_SIZE[0] * ENV_GRID_SIZE[1]
+    raise ValueError(f"unknown observation: {observation}")
+
+
+def observe(observation, ship, asteroids, valid, out=None):
+    """
+    Строит наблюдения фиксированного размера для пачки игр.
+
+    Наблюдение начинается с признаков корабля: координаты, косинус и синус курса,
+    скорость, доля оставшихся жизней и готовность к выстрелу. Дальше идут либо признаки
+    ENV_NEAREST_ASTEROIDS ближайших астероидов (смещение с учетом перехода через края,
+    скорость, радиус, признак наличия), либо сетка ENV_GRID_SIZE с числом астероидов в ячейке.
+
+    Аргументы:
+        observation (str): Вид наблюдения: "nearest" или "grid".
+        ship (tuple): Массивы (K,) корабля: x, y, angle, velocity_x, velocity_y, lives, ready.
+        asteroids (tuple): Массивы (K, A) астероидов: x, y, velocity_x, velocity_y, radius.
+        valid (numpy.ndarray): Маска (K, A) существующих невзрывающихся астероидов.
+        out (numpy.ndarray): Массив (K, observation_size) типа float32 для результата
+                             (по умолчанию создается новый).
+
+    Возвращает:
+        numpy.ndarray: Наблюдения (K, observation_size) типа float32.
+    """
+    x, y, angle, velocity_x, velocity_y, lives, ready = ship
+    games = len(x)
+    if out is None:
+        out = np.empty((games, observation_size(observation)), dtype=np.float32)
+    radians = np.radians(angle)
+    np.divide(x, SCREEN_WIDTH, out=out[:, 0])
+    np.divide(y, SCREEN_HEIGHT, out=out[:, 1])
+    np.cos(radians, out=out[:, 2])
+    np.sin(radians, out=out[:, 3])
+    np.divide(velocity_x, ROCKET_SPEED, out=out[:, 4])
+    np.divide(velocity_y, ROCKET_SPEED, out=out[:, 5])
+    np.divide(lives, LIVES, out=out[:, 6])
+    out[:, 7] = ready
+    ax, ay, avx, avy, radius = asteroids
+
+    if observation == "grid":
+        rows, cols = ENV_GRID_SIZE
+        cell = (np.minimum((ay * rows // SCREEN_HEIGHT).astype(np.intp), rows - 1) * cols
+                + np.minimum((ax * cols // SCREEN_WIDTH).astype(np.intp), cols - 1))
+        index = (np.arange(games)[:, None] * rows * cols + cell)[valid]
+        out[:, SHIP_FEATURES:] = np.bincount(index, minlength=games * rows * cols).reshape(games, rows * cols)
+        return out
+
+    count = ENV_NEAREST_ASTEROIDS
+    dx = wrap_coordinates(ax - x[:, None] + SCREEN_WIDTH / 2, SCREEN_WIDTH) - SCREEN_WIDTH / 2
+    dy = wrap_coordinates(ay - y[:, None] + SCREEN_HEIGHT / 2, SCREEN_HEIGHT) - SCREEN_HEIGHT / 2
+    distance = np.where(valid, dx * dx + dy * dy, np.inf)
+    if distance.shape[1] < count:
+        # Астероидов меньше, чем мест в наблюдении: дополняем отсутствующими
+        pad = ((0, 0), (0, count - distance.shape[1]))
+        distance = np.pad(distance, pad, constant_values=np.inf)
+        dx, dy, avx, avy, radius = (np.pad(array, pad) for array in (dx, dy, avx, avy, radius))
+    if distance.shape[1] > count:
+        # Отбираем count ближайших без полной сортировки и сортируем только их
+        order = np.argpartition(distance, count - 1, axis=1)[:, :count]
+        order = np.take_along_axis(order, np.take_along_axis(distance, order, axis=1).argsort(axis=1), axis=1)
+    else:
+        order = distance.argsort(axis=1)
+
+    # Признаки астероида i занимают столбцы SHIP_FEATURES + i * ASTEROID_FEATURES + номер признака
+    rows = np.arange(games)[:, None]
+    features = out[:, SHIP_FEATURES:].reshape(games, count, ASTEROID_FEATURES)
+    np.divide(dx[rows, order], SCREEN_WIDTH / 2, out=features[:, :, 0])
+    np.divide(dy[rows, order], SCREEN_HEIGHT / 2, out=features[:, :, 1])
+    np.divide(avx[rows, order], ASTEROID_SPEED, out=features[:, :, 2])
+    np.divide(avy[rows, order], ASTEROID_SPEED, out=features[:, :, 3])
+    np.divide(radius[rows, order], 40, out=features[:, :, 4])
+    present = np.isfinite(distance[rows, order])
+    features[:, :, 5] = present
+    features[~present] = 0.0
+    return out
+
+
+def wrap_coordinates(values, size):
+    """
+    Приводит координаты к диапазону [0, size) на месте. Результат совпадает с np.mod,
+    но вычисляется в несколько раз быстрее, если значения лежат в пределах (-size, 2 * size),
+    то есть объект за тик сдвигается меньше чем на размер экрана.
+
+    Аргументы:
+        values (numpy.ndarray): Координаты; массив перезаписывается.
+        size (int): Размер экрана по оси.
+
+    Возвращает:
+        numpy.ndarray: Тот же массив values.
+    """
+    values[values >= size] -= size
+    values[values < 0] += size
+    return values
+
+
+def wrapped_distance(delta, size):
+    """
+    Возвращает расстояние по оси с учетом перехода через края экрана.
+
+    Аргументы:
+        delta (numpy.ndarray): Разности координат в пределах (-size, size); массив перезаписывается.
+        size (int): Размер экрана по оси.
+    """
+    delta = np.abs(delta, out=delta)
+    return np.minimum(delta, size - delta, out=delta)
+
+
+class AsteroidsEnv:
+    """
+    Класс AsteroidsEnv — среда в стиле Gym для одной игры поверх Simulation.
+
+    Действие — битовая маска управления (INPUT_LEFT, INPUT_RIGHT, INPUT_THRUST,
+    INPUT_SHOOT), наблюдение — вектор фиксированной длины (см. observe), награда —
+    приращение счета минус ENV_LIFE_PENALTY за каждую потерянную жизнь. Эпизод
+    заканчивается с последней жизнью или через max_ticks тиков.
+
+    Атрибуты:
+        simulation (Simulation): Текущая игра.
+        observation (str): Вид наблюдения: "nearest" или "grid".
+        max_ticks (int): Максимальная длительность эпизода (тики).
+    """
+
+    def __init__(self, observation=ENV_OBSERVATION, max_ticks=ENV_MAX_TICKS, params=None):
+        """
+        Инициализация объекта AsteroidsEnv.
+
+        Аргументы:
+            observation (str): Вид наблюдения: "nearest" или "grid".
+            max_ticks (int): Максимальная длительность эпизода (тики).
+            params (dict): Переопределения параметров config.py (см. Simulation.PARAMETERS).
+        """
+        if np is None:
+            raise RuntimeError("AsteroidsEnv requires NumPy")
+        observation_size(observation)  # Проверка вида наблюдения
+        self.observation = observation
+        self.max_ticks = max_ticks
+        self.params = params or {}
+        self.simulation = None
+
+    def reset(self, seed=None):
+        """
+        Начинает новую игру.
+
+        Аргументы:
+            seed (int): Начальное значение генератора случайных чисел игры.
+
+        Возвращает:
+            numpy.ndarray: Первое наблюдение.
+        """
+        self.simulation = Simulation(seed=seed)
+        self.simulation.set_params(self.params)
+        self.simulation.start()
+        return self.observe()
+
+    def step(self, action):
+        """
+        Выполняет один тик игры.
+
+        Аргументы:
+            action (int): Битовая маска управления.
+
+        Возвращает:
+            tuple: Наблюдение, награда, признак конца эпизода и словарь со счетом и тиком.
+        """
+        simulation = self.simulation
+        score, lives = simulation.score, simulation.lives
+        simulation.step(int(action))
+        reward = simulation.score - score - ENV_LIFE_PENALTY * (lives - simulation.lives)
+        done = simulation.lives <= 0 or not simulation.running or simulation.tick >= self.max_ticks
+        return self.observe(), float(reward), done, {"score": simulation.score, "tick": simulation.tick}
+
+    def observe(self):
+        """Возвращает наблюдение текущего состояния (вектор длины observation_size)."""
+        simulation = self.simulation
+        ship = simulation.ship
+        if ship is None:
+            ship_state = (0.0, 0.0, 0.0, 0.0, 0.0)
+        else:
+            ship_state = (ship.x, ship.y, ship.angle, ship.velocity_x, ship.velocity_y)
+        ready = simulation.last_shot_tick is None or simulation.tick - simulation.last_shot_tick >= simulation.fire_cooldown
+        ship_arrays = tuple(np.array([value], dtype=float) for value in ship_state + (simulation.lives, ready))
+
+        asteroids = simulation.asteroids
+        fields = [[getattr(asteroid, name) for asteroid in asteroids]
+                  for name in ("x", "y", "velocity_x", "velocity_y", "radius")]
+        asteroid_arrays = tuple(np.array([values], dtype=float).reshape(1, len(asteroids)) for values in fields)
+        valid = np.array([[not asteroid.exploding for asteroid in asteroids]], dtype=bool).reshape(1, len(asteroids))
+        return observe(self.observation, ship_arrays, asteroid_arrays, valid)[0]
+
+
+class BatchedAsteroidsEnv:
+    """
+    Класс BatchedAsteroidsEnv ведет K независимых игр в массивах NumPy и продвигает
+    их все одним вызовом step.
+
+    Правила повторяют Simulation (Ship, Asteroid, Rocket и check_collisions) теми же
+    константами config.py: выстрел из носа корабля с интервалом ROCKET_FIRE_COOLDOWN
+    и кольцевым буфером ROCKET_CAPACITY ракет, поворот, тяга и трение, переход через края,
+    попадание ракеты в первый по порядку астероид (в том числе взрывающийся), взрыв длиной
+    ASTEROID_EXPLOSION_TICKS тиков, столкновение корабля с невзрывающимся астероидом и возрождение
+    в центре, поддержание MIN_ASTEROIDS астероидов. Отличия от Simulation: астероиды занимают
+    фиксированные слоты (порядок проверки — порядок слотов), за тик учитывается не больше
+    одного столкновения корабля, а игра заканчивается сразу с последней жизнью, без
+    доигрывания взрывов. Закончившиеся игры сразу начинаются заново (как в векторных
+    средах Gym); итоговый счет передается в info.
+
+    Атрибуты:
+        games (int): Количество игр K.
+        observation (str): Вид наблюдения: "nearest" или "grid".
+        max_ticks (int): Максимальная длительность эпизода (тики).
+        rng (numpy.random.Generator): Генератор случайных чисел всех игр.
+        observations (numpy.ndarray): Массив наблюдений, который заполняется заново каждым
+                                      вызовом reset и step (для хранения наблюдения нужно копировать).
+    """
+
+    EXPLOSION_TICKS = ASTEROID_EXPLOSION_TICKS  # Длительность взрыва астероида (см. Asteroid.handle_explosion)
+    EMPTY, ALIVE, EXPLODING = 0, 1, 2  # Состояния слота астероида
+
+    def __init__(self, games, observation=ENV_OBSERVATION, max_ticks=ENV_MAX_TICKS, seed=None):
+        """
+        Инициализация объекта BatchedAsteroidsEnv.
+
+        Аргументы:
+            games (int): Количество одновременно идущих игр.
+            observation (str): Вид наблюдения: "nearest" или "grid".
+            max_ticks (int): Максимальная длительность эпизода (тики).
+            seed (int): Начальное значение генератора случайных чисел.
+        """
+        if np is None:
+            raise RuntimeError("BatchedAsteroidsEnv requires NumPy")
+        observation_size(observation)  # Проверка вида наблюдения
+        self.games = games
+        self.observation = observation
+        self.max_ticks = max_ticks
+        self.rng = np.random.default_rng(seed)
+        self.min_asteroids = MIN_ASTEROIDS
+        self.fire_cooldown = ROCKET_FIRE_COOLDOWN
+        slots = max(MIN_ASTEROIDS, MAX_ASTEROIDS)
+        rockets = ROCKET_CAPACITY
+
+        # Корабли
+        self.ship_x = np.zeros(games)
+        self.ship_y = np.zeros(games)
+        self.ship_angle = np.zeros(games)
+        self.ship_vx = np.zeros(games)
+        self.ship_vy = np.zeros(games)
+        self.lives = np.zeros(games, dtype=np.int64)
+        self.score = np.zeros(games, dtype=np.int64)
+        self.tick = np.zeros(games, dtype=np.int64)
+        self.last_shot = np.zeros(games, dtype=np.int64)
+
+        # Астероиды: слоты (K, A)
+        self.ast_x = np.zeros((games, slots))
+        self.ast_y = np.zeros((games, slots))
+        self.ast_vx = np.zeros((games, slots))
+        self.ast_vy = np.zeros((games, slots))
+        self.ast_radius = np.zeros((games, slots))
+        self.ast_state = np.zeros((games, slots), dtype=np.int8)
+        self.ast_timer = np.zeros((games, slots), dtype=np.int64)
+
+        # Ракеты: кольцевой буфер (K, R)
+        self.rkt_x = np.zeros((games, rockets))
+        self.rkt_y = np.zeros((games, rockets))
+        self.rkt_vx = np.zeros((games, rockets))
+        self.rkt_vy = np.zeros((games, rockets))
+        self.rkt_life = np.zeros((games, rockets), dtype=np.int64)
+        self.rkt_alive = np.zeros((games, rockets), dtype=bool)
+        self.rkt_head = np.zeros(games, dtype=np.intp)
+
+        self.rows = np.arange(games)
+        self.observations = np.zeros((games, observation_size(observation)), dtype=np.float32)
+
+    def reset(self):
+        """
+        Начинает все игры заново.
+
+        Возвращает:
+            numpy.ndarray: Наблюдения (K, observation_size).
+        """
+        self.reset_games(np.ones(self.games, dtype=bool))
+        return self.observe()
+
+    def reset_games(self, mask):
+        """
+        Начинает заново игры, отмеченные маской.
+
+        Аргументы:
+            mask (numpy.ndarray): Логическая маска игр (K,).
+        """
+        self.ship_x[mask] = SCREEN_WIDTH // 2
+        self.ship_y[mask] = SCREEN_HEIGHT // 2
+        self.ship_angle[mask] = 270
+        self.ship_vx[mask] = 0.0
+        self.ship_vy[mask] = 0.0
+        self.lives[mask] = LIVES
+        self.score[mask] = INITIAL_SCORE
+        self.tick[mask] = 0
+        self.last_shot[mask] = -self.fire_cooldown
+        self.ast_state[mask] = self.EMPTY
+        self.rkt_alive[mask] = False
+        self.rkt_head[mask] = 0
+        self.spawn_asteroids()
+
+    def step(self, actions):
+        """
+        Выполняет один тик во всех играх.
+
+        Аргументы:
+            actions (numpy.ndarray): Битовые маски управления (K,).
+
+        Возвращает:
+            tuple: Наблюдения (K, D) в массиве observations, награды (K,), признаки конца
+                   эпизода (K,) и словарь с итоговым счетом закончившихся игр ("final_score",
+                   -1 для идущих).
+        """
+        actions = np.asarray(actions)
+        score_before = self.score.copy()
+        lives_before = self.lives.copy()
+        self.tick += 1
+
+        self.shoot(actions & INPUT_SHOOT != 0)
+        self.move_ship(actions)
+        self.move_rockets()
+        self.move_asteroids()
+        self.check_collisions()
+        self.spawn_asteroids()
+
+        rewards = (self.score - score_before) - ENV_LIFE_PENALTY * (lives_before - self.lives)
+        dones = (self.lives <= 0) | (self.tick >= self.max_ticks)
+        final_score = np.where(dones, self.score, -1)
+        if dones.any():
+            self.reset_games(dones)
+        return self.observe(), rewards.astype(np.float32), dones, {"final_score": final_score}
+
+    def shoot(self, wants):
+        """Выпускает ракеты в играх, где нажат выстрел, прошел интервал и свободен слот буфера."""
+        head = self.rkt_head
+        fire = wants & (self.tick - self.last_shot >= self.fire_cooldown) & ~self.rkt_alive[self.rows, head]
+        if not fire.any():
+            return
+        games = self.rows[fire]
+        slots = head[fire]
+        radians = np.radians(self.ship_angle[fire])
+        cos, sin = np.cos(radians), np.sin(radians)
+        self.rkt_x[games, slots] = self.ship_x[fire] + 30 * cos  # Нос корабля (радиус Ship)
+        self.rkt_y[games, slots] = self.ship_y[fire] + 30 * sin
+        self.rkt_vx[games, slots] = ROCKET_SPEED * cos
+        self.rkt_vy[games, slots] = ROCKET_SPEED * sin
+        self.rkt_life[games, slots] = ROCKET_LIFETIME
+        self.rkt_alive[games, slots] = True
+        head[fire] = (slots + 1) % self.rkt_alive.shape[1]
+        self.last_shot[fire] = self.tick[fire]
+
+    def move_ship(self, actions):
+        """Поворачивает корабли, применяет тягу или трение и перемещает их."""
+        turn = np.where(actions & INPUT_LEFT != 0, -SHIP_ROTATION_SPEED, 0)
+        turn = turn + np.where(actions & INPUT_RIGHT != 0, SHIP_ROTATION_SPEED, 0)
+        self.ship_angle = np.mod(self.ship_angle + turn, 360)
+
+        thrust = actions & INPUT_THRUST != 0
+        radians = np.radians(self.ship_angle)
+        self.ship_vx = np.where(thrust, self.ship_vx + SHIP_THRUST * np.cos(radians), self.ship_vx * 0.99)
+        self.ship_vy = np.where(thrust, self.ship_vy + SHIP_THRUST * np.sin(radians), self.ship_vy * 0.99)
+        self.ship_x = np.mod(self.ship_x + self.ship_vx, SCREEN_WIDTH)
+        self.ship_y = np.mod(self.ship_y + self.ship_vy, SCREEN_HEIGHT)
+
+    def move_rockets(self):
+        """Перемещает ракеты и гасит ракеты с истекшим временем жизни."""
+        # Погасшие ракеты тоже перемещаются: их координаты не используются, а ветвление дороже
+        self.rkt_x += self.rkt_vx
+        self.rkt_y += self.rkt_vy
+        wrap_coordinates(self.rkt_x, SCREEN_WIDTH)
+        wrap_coordinates(self.rkt_y, SCREEN_HEIGHT)
+        self.rkt_life -= 1
+        self.rkt_alive &= self.rkt_life > 0
+
+    def move_asteroids(self):
+        """Перемещает астероиды и продвигает взрывы, убирая завершившиеся."""
+        moving = self.ast_state == self.ALIVE  # Взрывающиеся астероиды стоят на месте
+        self.ast_x += self.ast_vx * moving
+        self.ast_y += self.ast_vy * moving
+        wrap_coordinates(self.ast_x, SCREEN_WIDTH)
+        wrap_coordinates(self.ast_y, SCREEN_HEIGHT)
+
+        exploding = self.ast_state == self.EXPLODING
+        self.ast_timer += exploding
+        self.ast_state[exploding & (self.ast_timer >= self.EXPLOSION_TICKS)] = self.EMPTY
+
+    def check_collisions(self):
+        """Проверяет попадания ракет в астероиды и столкновения кораблей с астероидами."""
+        present = self.ast_state != self.EMPTY
+        radius_sq = self.ast_radius ** 2
+
+        # Ракета-астероид: пары (живая ракета, слот), каждая ракета попадает в первый астероид по порядку слотов
+        games, rockets = np.nonzero(self.rkt_alive)
+        if len(games):
+            dx = wrapped_distance(self.rkt_x[games, rockets][:, None] - self.ast_x[games], SCREEN_WIDTH)
+            dy = wrapped_distance(self.rkt_y[games, rockets][:, None] - self.ast_y[games], SCREEN_HEIGHT)
+            inside = (dx * dx + dy * dy < radius_sq[games]) & present[games]
+            hits = inside.any(axis=1)
+            if hits.any():
+                games, rockets = games[hits], rockets[hits]
+                targets = inside[hits].argmax(axis=1)
+                self.rkt_alive[games, rockets] = False
+                self.score += np.bincount(games, minlength=self.games)
+                starts = self.ast_state[games, targets] == self.ALIVE
+                self.ast_state[games[starts], targets[starts]] = self.EXPLODING
+                self.ast_timer[games[starts], targets[starts]] = 0
+
+        # Корабль-астероид: первый невзрывающийся астероид, содержащий корабль
+        dx = wrapped_distance(self.ship_x[:, None] - self.ast_x, SCREEN_WIDTH)
+        dy = wrapped_distance(self.ship_y[:, None] - self.ast_y, SCREEN_HEIGHT)
+        inside = (dx * dx + dy * dy < radius_sq) & (self.ast_state == self.ALIVE)
+        crashed = inside.any(axis=1)
+        if crashed.any():
+            games = self.rows[crashed]
+            targets = inside.argmax(axis=1)[crashed]
+            self.ast_state[games, targets] = self.EXPLODING
+            self.ast_timer[games, targets] = 0
+            self.lives[crashed] -= 1
+            self.ship_x[crashed] = SCREEN_WIDTH // 2
+            self.ship_y[crashed] = SCREEN_HEIGHT // 2
+            self.ship_vx[crashed] = 0.0
+            self.ship_vy[crashed] = 0.0
+
+    def spawn_asteroids(self):
+        """Заполняет свободные слоты новыми астероидами, пока их не станет MIN_ASTEROIDS."""
+        empty = self.ast_state == self.EMPTY
+        need = self.min_asteroids - (~empty).sum(axis=1)
+        spawn = empty & (np.cumsum(empty, axis=1) <= need[:, None])
+        count = int(spawn.sum())
+        if not count:
+            return
+        rng = self.rng
+        self.ast_x[spawn] = rng.integers(0, SCREEN_WIDTH, count, endpoint=True)
+        self.ast_y[spawn] = rng.integers(0, SCREEN_HEIGHT, count, endpoint=True)
+        self.ast_vx[spawn] = rng.uniform(-ASTEROID_SPEED, ASTEROID_SPEED, count)
+        self.ast_vy[spawn] = rng.uniform(-ASTEROID_SPEED, ASTEROID_SPEED, count)
+        self.ast_radius[spawn] = rng.integers(20, 40, count, endpoint=True)
+        self.ast_state[spawn] = self.ALIVE
+        self.ast_timer[spawn] = 0
+
+    def observe(self):
+        """Возвращает наблюдения всех игр (K, observation_size)."""
+        ready = (self.tick - self.last_shot >= self.fire_cooldown).astype(float)
+        ship = (self.ship_x, self.ship_y, self.ship_angle, self.ship_vx, self.ship_vy, self.lives, ready)
+        asteroids = (self.ast_x, self.ast_y, self.ast_vx, self.ast_vy, self.ast_radius)
+        return observe(self.observation, ship, asteroids, self.ast_state == self.ALIVE, out=self.observations)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Замер скорости сред Asteroids со случайными действиями")
+    parser.add_argument("--games", type=int, default=4096, help="Количество игр в пакетной среде")
+    parser.add_argument("--steps", type=int, default=200, help="Количество шагов")
+    parser.add_argument("--observation", default=ENV_OBSERVATION, choices=("nearest", "grid"))
+    parser.add_argument("--seed", type=int, default=0, help="Начальное значение генератора")
+    args = parser.parse_args()
+
+    env = BatchedAsteroidsEnv(args.games, observation=args.observation, seed=args.seed)
+    rng = np.random.default_rng(args.seed)
+    env.reset()
+    actions = rng.integers(0, ACTION_COUNT, (args.steps, args.games))
+    episodes = 0
+    started = time.perf_counter()
+    for step in range(args.steps):
+        observations, rewards, dones, info = env.step(actions[step])
+        episodes += int(dones.sum())
+    elapsed = time.perf_counter() - started
+    print(f"Batched: {args.games} games x {args.steps} steps, {episodes} episodes, "
+          f"env-steps/sec: {args.games * args.steps / elapsed:.0f}")
+
+    single = AsteroidsEnv(observation=args.observation)
+    single.reset(seed=args.seed)
+    started = time.perf_counter()
+    for step in range(args.steps):
+        observation, reward, done, info = single.step(int(actions[step, 0]))
+        if done:
+            single.reset()
+    elapsed = time.perf_counter() - started
+    print(f"Single: env-steps/sec: {args.steps / elapsed:.0f}")
@@ -0,0 +1,221 @@
+import csv
+import itertools
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from src.Simulation import Simulation, INPUT_LEFT, INPUT_RIGHT, INPUT_SHOOT, random_policy
+from src.config import *
+
+# Столбцы файла результатов после столбцов параметров
+RESULT_COLUMNS = (
+    "seed", "policy", "survival_ticks", "finished", "score", "hits", "lives_lost",
+    "peak_asteroids", "peak_rockets", "ticks_per_sec",
+)
+
+
+def spin_policy(rng):
+    """Создает политику, которая вращает корабль и непрерывно стреляет."""
+    def policy(simulation):
+        return INPUT_RIGHT | INPUT_SHOOT
+    return policy
+
+
+def sweep_policy(rng):
+    """Создает политику, которая поворачивает корабль то влево, то вправо и непрерывно стреляет."""
+    def policy(simulation):
+        return (INPUT_LEFT if simulation.tick // 60 % 2 else INPUT_RIGHT) | INPUT_SHOOT
+    return policy
+
+
+def idle_policy(rng):
+    """Создает политику без управления."""
+    def policy(simulation):
+        return 0
+    return policy
+
+
+# Политики управления по имени: функция rng -> policy(simulation)
+POLICIES = {
+    "random": random_policy,
+    "spin": spin_policy,
+    "sweep": sweep_policy,
+    "idle": idle_policy,
+}
+
+
+def run_game(params, seed, policy_name, max_ticks):
+    """
+    Играет одну игру без дисплея и собирает ее показатели. Выполняется в рабочем процессе.
+
+    Аргументы:
+        params (dict): Переопределения параметров config.py (см. Simulation.PARAMETERS).
+        seed (int): Начальное значение генераторов симуляции и политики.
+        policy_name (str): Имя политики из POLICIES.
+        max_ticks (int): Максимальная длительность игры (тики).
+
+    Возвращает:
+        dict: Строка результатов.
+    """
+    simulation = Simulation(seed=seed)
+    simulation.set_params(params)
+    policy = POLICIES[policy_name](random.Random(seed))
+    peak_asteroids = peak_rockets = 0
+
+    started = time.perf_counter()
+    simulation.start()
+    while simulation.running and simulation.tick < max_ticks:
+        simulation.step(policy(simulation))
+        if len(simulation.asteroids) > peak_asteroids:
+            peak_asteroids = len(simulation.asteroids)
+        if len(simulation.rockets) > peak_rockets:
+            peak_rockets = len(simulation.rockets)
+    elapsed = time.perf_counter() - started
+
+    row = dict(params)
+    row.update(
+        seed=seed,
+        policy=policy_name,
+        survival_ticks=simulation.tick,
+        finished=int(simulation.finished),
+        score=simulation.score,
+        hits=simulation.hits,
+        lives_lost=LIVES - simulation.lives,
+        peak_asteroids=peak_asteroids,
+        peak_rockets=peak_rockets,
+        ticks_per_sec=round(simulation.tick / elapsed) if elapsed else 0,
+    )
+    return row
+
+
+def parse_grid(items):
+    """
+    Разбирает параметры сетки вида "ИМЯ=значение1,значение2,...".
+
+    Аргументы:
+        items (list): Строки параметров.
+
+    Возвращает:
+        dict: Списки значений по имени параметра.
+    """
+    grid = {}
+    for item in items:
+        name, _, values = item.partition("=")
+        if name not in Simulation.PARAMETERS or not values:
+            raise ValueError(f"bad grid parameter {item!r}; known: {', '.join(Simulation.PARAMETERS)}")
+        grid[name] = [parse_value(value) for value in values.split(",")]
+    return grid
+
+
+def parse_value(text):
+    """Преобразует строку в int или float."""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def iter_jobs(grid, seeds, policies, max_ticks):
+    """
+    Лениво перебирает все сочетания значений сетки, политик и начальных значений.
+
+    Возвращает:
+        iterator: Кортежи аргументов run_game.
+    """
+    names = list(grid)
+    for values in itertools.product(*(grid[name] for name in names)):
+        params = dict(zip(names, values))
+        for policy_name in policies:
+            for seed in seeds:
+                yield params, seed, policy_name, max_ticks
+
+
+def run_batch(jobs, out, workers=None, in_flight=None, progress=None):
+    """
+    Выполняет игры на всех ядрах и записывает результаты в CSV по мере завершения.
+
+    Задания берутся из итератора лениво, и одновременно в очереди пула держится
+    не больше in_flight заданий, поэтому память не зависит от общего числа игр.
+
+    Аргументы:
+        jobs (iterator): Кортежи аргументов run_game.
+        out (file): Открытый текстовый файл для CSV.
+        workers (int): Количество рабочих процессов (по умолчанию — число ядер).
+        in_flight (int): Максимум одновременно отправленных заданий (по умолчанию 4 на процесс).
+        progress (callable): Функция progress(done), вызываемая после каждой игры.
+
+    Возвращает:
+        int: Количество сыгранных игр.
+    """
+    workers = workers or os.cpu_count() or 1
+    in_flight = in_flight or workers * 4
+    writer = None
+    done = 0
+    jobs = iter(jobs)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < in_flight:
+                job = next(jobs, None)
+                if job is None:
+                    exhausted = True
+                    break
+                pending.add(executor.submit(run_game, *job))
+            if not pending:
+                break
+
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                row = future.result()
+                if writer is None:
+                    columns = [name for name in row if name not in RESULT_COLUMNS] + list(RESULT_COLUMNS)
+                    writer = csv.DictWriter(out, fieldnames=columns)
+                    writer.writeheader()
+                writer.writerow(row)
+                done += 1
+                if progress:
+                    progress(done)
+            out.flush()
+    return done
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Пакетный прогон игр Asteroids без дисплея")
+    parser.add_argument("--grid", action="append", default=[], metavar="NAME=V1,V2,...",
+                        help=f"Значения параметра config.py ({', '.join(Simulation.PARAMETERS)})")
+    parser.add_argument("--seeds", type=int, default=10, help="Количество начальных значений на сочетание")
+    parser.add_argument("--seed-start", type=int, default=0, help="Первое начальное значение")
+    parser.add_argument("--policy", action="append", choices=sorted(POLICIES), help="Политика управления")
+    parser.add_argument("--ticks", type=int, default=36000, help="Максимальная длительность игры (тики)")
+    parser.add_argument("--workers", type=int, help="Количество процессов (по умолчанию — число ядер)")
+    parser.add_argument("--out", default="-", help="CSV-файл результатов (по умолчанию stdout)")
+    args = parser.parse_args()
+
+    try:
+        grid = parse_grid(args.grid)
+    except ValueError as error:
+        parser.error(str(error))
+    policies = args.policy or ["random"]
+    seeds = range(args.seed_start, args.seed_start + args.seeds)
+    total = args.seeds * len(policies)
+    for values in grid.values():
+        total *= len(values)
+
+    def report(done):
+        if done % 50 == 0 or done == total:
+            print(f"\r{done}/{total} games", end="", file=sys.stderr, flush=True)
+
+    started = time.perf_counter()
+    out = sys.stdout if args.out == "-" else open(args.out, "w", newline="")
+    try:
+        games = run_batch(iter_jobs(grid, seeds, policies, args.ticks), out, args.workers, progress=report)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"\n{games} games in {time.perf_counter() - started:.1f}s", file=sys.stderr)
@@ -0,0 +1,106 @@
+# Процедура Tcl, которая применяет накопленные команды кадра. Команды передаются
+# списками, поэтому Tcl не разбирает текст скрипта, а тело процедуры компилируется один раз.
+FLUSH_PROC = "::commandbuffer_flush"
+FLUSH_SCRIPT = f"""
+proc {FLUSH_PROC} {{widget moves configs}} {{
+    foreach {{item x y}} $moves {{
+        $widget coords $item $x $y
+    }}
+    foreach {{item name value}} $configs {{
+        $widget itemconfigure $item $name $value
+    }}
+}}
+"""
+
+
+class CommandBuffer:
+    """
+    Класс CommandBuffer копит команды холста за кадр и отправляет их в Tcl одним вызовом.
+
+    Каждый вызов canvas.coords или canvas.itemconfig — отдельный переход из Python в Tcl
+    с разбором аргументов. Буфер повторяет эти два метода, но только запоминает команды:
+    для элемента хранятся последние координаты и объединенные параметры, поэтому повторные
+    команды одного элемента за кадр схлопываются. flush передает оставшиеся команды
+    плоскими списками в процедуру Tcl (FLUSH_SCRIPT), которая выполняет их в цикле.
+    Координаты, совпадающие с отправленными в прошлый раз, не отправляются.
+
+    Атрибуты:
+        canvas (tk.Canvas): Холст.
+        widget (str): Имя виджета холста в Tcl.
+        positions (dict): Координаты, ожидающие отправки: элемент -> (x, y).
+        options (dict): Параметры, ожидающие отправки: элемент -> словарь параметров.
+        sent (dict): Последние отправленные координаты элементов.
+        requested (int): Количество принятых команд.
+        submitted (int): Количество отправленных команд.
+        flushes (int): Количество вызовов процедуры.
+    """
+
+    def __init__(self, canvas):
+        """
+        Инициализация объекта CommandBuffer: определяет процедуру Tcl для отправки команд.
+
+        Аргументы:
+            canvas (tk.Canvas): Холст, которому адресованы команды.
+        """
+        self.canvas = canvas
+        self.widget = str(canvas)
+        self.positions = {}
+        self.options = {}
+        self.sent = {}
+        self.requested = 0
+        self.submitted = 0
+        self.flushes = 0
+        canvas.tk.eval(FLUSH_SCRIPT)
+
+    def coords(self, item, x, y):
+        """
+        Запоминает перемещение элемента в точку (x, y).
+
+        Аргументы:
+            item (int): Идентификатор элемента.
+            x (float): Координата x.
+            y (float): Координата y.
+        """
+        self.requested += 1
+        self.positions[item] = (x, y)
+
+    def itemconfig(self, item, **options):
+        """
+        Запоминает изменение параметров элемента (например, image или state).
+
+        Аргументы:
+            item (int): Идентификатор элемента.
+            **options: Параметры элемента.
+        """
+        self.requested += 1
+        pending = self.options.get(item)
+        if pending is None:
+            self.options[item] = options
+        else:
+            pending.update(options)
+
+    def flush(self):
+        """
+        Отправляет накопленные команды одним вызовом процедуры Tcl.
+
+        Возвращает:
+            int: Количество отправленных команд.
+        """
+        sent = self.sent
+        moves = []
+        for item, position in self.positions.items():
+            if sent.get(item) != position:
+                sent[item] = position
+                moves += (item, *position)
+        configs = []
+        for item, options in self.options.items():
+            for name, value in options.items():
+                configs += (item, "-" + name, str(value))
+        self.positions.clear()
+        self.options.clear()
+        count = (len(moves) + len(configs)) // 3
+        if count:
+            self.canvas.tk.call(FLUSH_PROC, self.widget, tuple(moves), tuple(configs))
+            self.flushes += 1
+            self.submitted += count
+        return count
@@ -0,0 +1,305 @@
+from src.config import *
+
+np = None  # NumPy импортируется при первой проверке numpy_available (импорт занимает около 0,1 с)
+
+# Битовые флаги состояния строки хранилища
+FLAG_DESTROYED = 1  # Астероид уничтожен
+FLAG_EXPLODING = 2  # Астероид взрывается
+FLAG_EXPIRED = 4  # Время жизни ракеты истекло
+FLAG_MORTAL = 8  # Строка имеет ограниченное время жизни
+FLAG_FROZEN = FLAG_DESTROYED | FLAG_EXPLODING | FLAG_EXPIRED  # Строки, которые не перемещаются
+
+
+def numpy_available():
+    """Проверяет, установлен ли NumPy, импортируя его при первом вызове."""
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:  # NumPy необязателен: без него объекты хранят состояние в своих атрибутах
+            return False
+        np = numpy
+    return True
+
+
+class StoreField:
+    """
+    Дескриптор числового атрибута объекта, который хранится либо в самом объекте,
+    либо (после привязки к EntityStore) в строке массивов хранилища.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.local = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if obj.store is None:
+            return getattr(obj, self.local)
+        return float(obj.store.arrays[self.name][obj.row])
+
+    def __set__(self, obj, value):
+        if obj.store is None:
+            setattr(obj, self.local, value)
+        else:
+            obj.store.arrays[self.name][obj.row] = value
+
+
+class StoreFlag:
+    """
+    Дескриптор логического атрибута, который хранится либо в самом объекте,
+    либо битом в массиве флагов EntityStore.
+    """
+
+    def __init__(self, bit):
+        self.bit = bit
+
+    def __set_name__(self, owner, name):
+        self.local = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if obj.store is None:
+            return getattr(obj, self.local)
+        return bool(obj.store.flags[obj.row] & self.bit)
+
+    def __set__(self, obj, value):
+        if obj.store is None:
+            setattr(obj, self.local, value)
+        elif value:
+            obj.store.flags[obj.row] |= self.bit
+        else:
+            obj.store.flags[obj.row] &= 0xFF ^ self.bit
+
+
+def store_view(cls, fields, flags, row_flags=0):
+    """
+    Создает подкласс объекта игры, атрибуты которого хранятся в строке EntityStore.
+
+    Исходный класс остается без изменений и работает с обычными атрибутами, поэтому
+    без хранилища доступ к полям не замедляется. Конструктор подкласса принимает
+    хранилище первым аргументом и запоминает его; метод reset исходного класса
+    (его вызывает и конструктор) привязывает объект к новой строке этого хранилища,
+    поэтому отвязанный объект можно выдать из пула повторно.
+
+    Аргументы:
+        cls (type): Исходный класс объекта.
+        fields (tuple): Имена числовых атрибутов из EntityStore.FIELDS.
+        flags (dict): Логические атрибуты и соответствующие им биты флагов.
+        row_flags (int): Флаги, устанавливаемые каждой новой строке (например, FLAG_MORTAL).
+
+    Возвращает:
+        type: Подкласс-представление.
+    """
+    def __init__(self, store, *args, **kwargs):
+        self.home_store = store
+        cls.__init__(self, *args, **kwargs)
+
+    def reset(self, *args, **kwargs):
+        cls.reset(self, *args, **kwargs)
+        self.home_store.attach(self, flags=row_flags)
+
+    namespace = {
+        "__init__": __init__,
+        "reset": reset,
+        "__doc__": f"Представление {cls.__name__}, хранящее состояние в EntityStore.",
+        "view_fields": tuple(fields),
+        "view_flags": dict(flags),
+    }
+    namespace.update({name: StoreField() for name in fields})
+    namespace.update({name: StoreFlag(bit) for name, bit in flags.items()})
+    return type(cls.__name__ + "View", (cls,), namespace)
+
+
+class EntityStore:
+    """
+    Класс EntityStore хранит состояние однотипных объектов (астероидов или ракет)
+    в непрерывных массивах NumPy и обновляет их пакетными векторными операциями.
+
+    Объекты игры остаются тонкими представлениями строк хранилища: их атрибуты,
+    объявленные через StoreField и StoreFlag, читают и пишут массивы напрямую.
+
+    Атрибуты:
+        count (int): Количество занятых строк.
+        entities (list): Объекты, соответствующие строкам, в том же порядке.
+        arrays (dict): Массивы полей по имени атрибута.
+        flags (numpy.ndarray): Битовые флаги строк.
+    """
+
+    FIELDS = ("x", "y", "velocity_x", "velocity_y", "angle", "angular_speed", "radius", "lifetime",
+              "explosion_timer")
+
+    def __init__(self, capacity=64):
+        """
+        Инициализация объекта EntityStore.
+
+        Аргументы:
+            capacity (int): Начальная вместимость массивов.
+        """
+        if not numpy_available():
+            raise RuntimeError("EntityStore requires NumPy")
+        self.count = 0
+        self.entities = []
+        self.arrays = {name: np.zeros(capacity) for name in self.FIELDS}
+        self.flags = np.zeros(capacity, dtype=np.uint8)
+
+    def attach(self, entity, flags=0):
+        """
+        Привязывает объект к новой строке хранилища, копируя в нее его текущие значения.
+
+        Аргументы:
+            entity: Объект класса, созданного store_view.
+            flags (int): Начальные флаги строки.
+        """
+        if self.count == len(self.flags):
+            self.grow()
+        row = self.count
+        for array in self.arrays.values():
+            array[row] = 0.0
+        for name in entity.view_fields:
+            self.arrays[name][row] = getattr(entity, "_" + name)
+        for name, bit in entity.view_flags.items():
+            if getattr(entity, "_" + name, False):
+                flags |= bit
+        self.flags[row] = flags
+        entity.store = self
+        entity.row = row
+        self.entities.append(entity)
+        self.count += 1
+
+    def grow(self):
+        """Удваивает вместимость массивов."""
+        capacity = len(self.flags) * 2
+        for name, array in self.arrays.items():
+            grown = np.zeros(capacity)
+            grown[:self.count] = array[:self.count]
+            self.arrays[name] = grown
+        flags = np.zeros(capacity, dtype=np.uint8)
+        flags[:self.count] = self.flags[:self.count]
+        self.flags = flags
+
+    def step(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, dt=1):
+        """
+        Выполняет один шаг физики для всех строк: перемещение с переходом через края,
+        вращение, уменьшение времени жизни с пометкой истекших строк и продвижение
+        таймеров взрыва с пометкой строк, взрыв которых завершился.
+
+        Шаг в несколько тиков перемещает строки по тикам, чтобы координаты точно
+        совпадали с пошаговым прогоном.
+
+        Аргументы:
+            dt (int): Длительность шага в тиках.
+        """
+        n = self.count
+        if not n:
+            return
+        a = self.arrays
+        flags = self.flags[:n]
+        moving = (flags & FLAG_FROZEN) == 0
+
+        x, y, angle = a["x"][:n], a["y"][:n], a["angle"][:n]
+        velocity_x = a["velocity_x"][:n][moving]
+        velocity_y = a["velocity_y"][:n][moving]
+        angular_speed = a["angular_speed"][:n][moving]
+        moved_x, moved_y, moved_angle = x[moving], y[moving], angle[moving]
+        for _ in range(dt):
+            moved_x = np.mod(moved_x + velocity_x, width)
+            moved_y = np.mod(moved_y + velocity_y, height)
+            moved_angle = np.mod(moved_angle + angular_speed, 360)
+        x[moving], y[moving], angle[moving] = moved_x, moved_y, moved_angle
+
+        mortal = moving & ((flags & FLAG_MORTAL) != 0)
+        lifetime = a["lifetime"][:n]
+        lifetime[mortal] -= dt
+        flags[mortal & (lifetime <= 0)] |= FLAG_EXPIRED
+
+        exploding = (flags & FLAG_EXPLODING) != 0
+        if exploding.any():
+            timer = a["explosion_timer"][:n]
+            timer[exploding] += dt
+            finished = exploding & (timer >= ASTEROID_EXPLOSION_TICKS)
+            flags[finished] = (flags[finished] & (0xFF ^ FLAG_EXPLODING)) | FLAG_DESTROYED
+
+    def removable(self, mask, absent=0):
+        """
+        Возвращает маску строк, у которых установлены все биты mask и сброшены все биты absent.
+        """
+        flags = self.flags[:self.count]
+        return ((flags & mask) == mask) & ((flags & absent) == 0)
+
+    def compact(self, remove):
+        """
+        Удаляет помеченные строки, сдвигая оставшиеся без изменения их порядка.
+
+        Аргументы:
+            remove (numpy.ndarray): Логическая маска удаляемых строк.
+
+        Возвращает:
+            list: Удаленные объекты (они отвязываются от хранилища).
+        """
+        if not remove.any():
+            return []
+        keep = np.flatnonzero(~remove)
+        removed_rows = np.flatnonzero(remove)
+        removed = [self.entities[row] for row in removed_rows]
+        for entity in removed:
+            self.detach(entity)
+
+        kept = len(keep)
+        for array in self.arrays.values():
+            array[:kept] = array[keep]
+        self.flags[:kept] = self.flags[keep]
+        self.entities[:] = [self.entities[row] for row in keep]
+        for row, entity in enumerate(self.entities):
+            entity.row = row
+        self.count = kept
+        return removed
+
+    def detach(self, entity):
+        """Копирует значения строки обратно в объект и отвязывает его от хранилища."""
+        row = entity.row
+        values = {name: float(array[row]) for name, array in self.arrays.items()}
+        flags = int(self.flags[row])
+        entity.store = None
+        entity.row = None
+        for name in entity.view_fields:
+            setattr(entity, "_" + name, values[name])
+        for name, bit in entity.view_flags.items():
+            setattr(entity, "_" + name, bool(flags & bit))
+
+    def clear(self):
+        """Отвязывает все объекты и очищает хранилище."""
+        for entity in self.entities:
+            self.detach(entity)
+        self.entities.clear()
+        self.count = 0
+
+    def first_hits(self, px, py, skip=0, start=0, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        """
+        Для каждой точки находит первую по порядку строку, круг которой содержит точку.
+        Расстояния учитывают переход через края экрана.
+
+        Аргументы:
+            px (numpy.ndarray): Координаты x точек.
+            py (numpy.ndarray): Координаты y точек.
+            skip (int): Флаги строк, которые не участвуют в проверке.
+            start (int): Номер строки, с которой начинается поиск.
+
+        Возвращает:
+            numpy.ndarray: Индексы строк или -1 для точек без попадания.
+        """
+        n = self.count
+        if not n or not len(px):
+            return np.full(len(px), -1, dtype=np.intp)
+        a = self.arrays
+        dx = np.mod(np.asarray(px)[:, None] - a["x"][:n][None, :] + width / 2, width) - width / 2
+        dy = np.mod(np.asarray(py)[:, None] - a["y"][:n][None, :] + height / 2, height) - height / 2
+        inside = dx * dx + dy * dy < a["radius"][:n][None, :] ** 2
+        if skip:
+            inside &= (self.flags[:n] & skip)[None, :] == 0
+        if start:
+            inside[:, :start] = False
+        first = inside.argmax(axis=1)
+        return np.where(inside.any(axis=1), first, -1)
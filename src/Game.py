@@ -1,51 +1,113 @@
+import time
+
+import_started = time.perf_counter()  # Начало импорта модулей игры (для --startup-profile)
+
 import tkinter as tk
-from PIL import Image, ImageTk
-import os
-import math
 import random
+import traceback
 
+from src.AssetManager import assets
 from src.Asteroid import Asteroid
-from src.BackgroundAsteroid import BackgroundAsteroid
-from src.Ship import Ship
+from src.Hud import Hud
+from src.Log import add_log_arguments, log
+from src.MemoryMonitor import MemoryMonitor
+from src.Preloader import Preloader
+from src.Profiler import FrameProfiler, StartupProfile
+from src.QualityGovernor import QualityGovernor
+from src.Renderer import create_renderer
+from src.Replay import Recorder, Replay
+from src.ResultsStore import ResultsWriter, format_leaderboard, game_result
+from src.RotationCache import rotation_cache
+from src.SaveState import RewindBuffer, load_state, write_state
+from src.Simulation import Simulation, INPUT_LEFT, INPUT_RIGHT, INPUT_THRUST, INPUT_SHOOT
+from src.SpatialHash import wrap_delta, wrapped_distance_sq
+from src.Starfield import Starfield
 from src.config import *
 
 
 class Game:
-    def __init__(self, root):
-        # Инициализация класса Game
+    """
+    Класс Game отображает симуляцию на холсте tkinter и передает ей управление с клавиатуры.
+
+    Правила игры находятся в Simulation; Game только превращает нажатия клавиш
+    в биты управления, продвигает симуляцию и синхронизирует с ней элементы холста.
+    """
+
+    def __init__(self, root, canvas=None, seed=None, background_loading=True):
+        # Инициализация класса Game (canvas можно передать готовым, например, заглушку для бенчмарков).
+        # Спрайты загружаются в фоновом потоке; background_loading=False загружает их сразу
+        # (для бенчмарков и проверок без цикла событий Tk).
+        # Все случайные величины игры берутся из генераторов с начальным значением seed
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed  # Начальное значение генераторов (записывается в запись игры)
+        self.rng = random.Random(seed)  # Генератор для оформления (звездное поле)
         self.start_screen_title = None  # Текст заголовка на стартовом экране
         self.start_screen_clickable = None  # Кликабельный текст на стартовом экране
+        self.start_screen_leaderboard = None  # Таблица лучших результатов на стартовом экране
         self.thrusting = None  # Состояние ускорения корабля (True/False)
         self.rotating_right = None  # Состояние вращения корабля вправо (True/False)
         self.rotating_left = None  # Состояние вращения корабля влево (True/False)
+        self.pending_shots = 0  # Количество выстрелов, ожидающих следующего тика
 
         self.root = root  # Корневой элемент Tkinter
-        self.canvas = tk.Canvas(root, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, bg="black")
+        if canvas is None:
+            canvas = tk.Canvas(root, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, bg="black")
+        self.canvas = canvas
         # Игровое поле с черным фоном
         self.canvas.pack()  # Отображение Canvas на экране
 
-        # Переменные состояния игры
-        self.lives = LIVES  # Текущее количество жизней игрока
-        self.score = INITIAL_SCORE  # Текущий счет игрока
-        self.running = False  # Флаг для определения состояния игры (запущена или остановлена)
+        # Симуляция с правилами игры
+        self.sim = Simulation(seed=seed)
+        self.recorder = None  # Запись игры (Recorder), если включена
+        self.replay = None  # Воспроизводимая запись (Replay), если игра воспроизводится
+        self.fast_forward = False  # Выполнять тики без ожидания реального времени
+        self.rewind = RewindBuffer()  # Состояния последних секунд игры для перемотки назад
+        self.start_state = None  # Состояние, с которого начинается игра (None — новая игра)
+        self.results = None  # Запись результатов игр (ResultsWriter), если включена
+
+        # Игровой цикл с фиксированным шагом симуляции
+        self.tick_interval = 1 / TICK_RATE  # Длительность тика симуляции (секунды)
+        self.frame_interval = 1 / RENDER_RATE  # Длительность кадра отрисовки (секунды)
+        self.accumulator = 0.0  # Реальное время, еще не отработанное симуляцией (секунды)
+        self.last_frame_time = None  # Время начала предыдущего кадра
+        self.next_frame_time = None  # Запланированное время начала следующего кадра
+        self.previous_positions = {}  # Позиции объектов до последнего тика (для интерполяции)
+
+        # Профилирование фаз кадра
+        self.profiler = FrameProfiler()
+        self.profiler_overlay = False  # Показан ли оверлей профилировщика
+        self.photo_allocations = (0, time.perf_counter())  # Число созданных PhotoImage и время замера
+        self.log_dump_path = None  # Файл для буфера журнала при сбое или окончании игры (None — не сохранять)
+        self.startup = None  # Измерение запуска (StartupProfile), если включено
+
+        # Наблюдение за ростом памяти (изображения Tk, элементы холста, объекты игры)
+        self.memory = MemoryMonitor()
+        self.memory_overlay = False  # Показан ли оверлей памяти
+        self.memory_sampling = False  # Делаются ли замеры памяти (включаются оверлеем, сохранением или проверкой)
+        self.memory_dump_path = None  # Файл для периодического сохранения замеров памяти в JSON (None — не сохранять)
+
+        # Качество отрисовки, которое понижается под нагрузкой
+        self.governor = QualityGovernor()
+        self.frame_number = 0  # Номер кадра (для обновления углов астероидов не каждый кадр)
+        self.asteroid_rotations = {}  # Последние кадры поворота астероидов: астероид -> (идентификатор, номер кадра)
 
         # Элементы пользовательского интерфейса (UI)
-        self.heart_images = []  # Список изображений сердец для отображения жизней
-        self.heart_widgets = []  # Список виджетов для сердец
-        self.background_asteroids = []  # Список астероидов, отображаемых на заднем плане
-
-        self.score_text = self.canvas.create_text(
-            10, 10, anchor="nw", fill="white",
-            font=("Arial", 16), text=f"Score: {self.score}"
-        )  # Текстовое поле для отображения счета в верхнем левом углу
-
-        # Объекты игры
-        self.asteroids = []  # Список астероидов на игровом экране
-        self.rockets = []  # Список ракет, выпущенных кораблем
-        self.ship = None  # Объект корабля
-
-        self.sprites = self.load_sprites()  # Загрузка спрайтов для игры
-        self.heart_image = self.sprites["heart"]  # Изображение сердца для отображения жизней
+        self.starfield = Starfield(self.canvas, self.rng)  # Фон с параллаксом (звезды сразу, астероиды после загрузки)
+
+        self.renderer = None  # Способ отрисовки объектов симуляции (создается после загрузки спрайтов)
+        self.sprites = {}  # Спрайты интерфейса (заполняются по мере загрузки)
+        self.heart_image = None  # Изображение сердца для отображения жизней
+        self.assets_ready = False  # Все спрайты загружены, игру можно начинать
+        self.start_requested = False  # Игру запросили начать до окончания загрузки
+
+        # Интерфейс поверх игры: сердечки, счет и оверлей профилировщика
+        self.hud = Hud(self.canvas, self.heart_image)
+        self.hud.set_score(self.sim.score)
+        self.hud.add_text("profiler", 10, 40, anchor="nw", fill="lime", font=("Courier", 10), text="",
+                          state="hidden")
+        self.hud.add_text("memory", SCREEN_WIDTH - 10, 40, anchor="ne", fill="orange", font=("Courier", 10),
+                          text="", state="hidden")
         self.setup_start_screen()  # Настройка стартового экрана
 
         # Привязка клавиш управления к игровым действиям
@@ -56,83 +118,88 @@ class Game:
         self.root.bind("<KeyPress-Up>", lambda event: self.set_thrust(True))  # Ускорение корабля
         self.root.bind("<KeyRelease-Up>", lambda event: self.set_thrust(False))  # Остановка ускорения
         self.root.bind("<space>", lambda event: self.shoot_rocket())  # Стрельба ракетой
+        self.root.bind(PROFILER_HOTKEY, lambda event: self.toggle_profiler())  # Оверлей профилировщика
+        self.root.bind(MEMORY_HOTKEY, lambda event: self.toggle_memory_overlay())  # Оверлей памяти
+        self.root.bind(QUICKSAVE_HOTKEY, lambda event: self.quick_save())  # Быстрое сохранение
+        self.root.bind(QUICKLOAD_HOTKEY, lambda event: self.quick_load())  # Быстрая загрузка
+        self.root.bind(REWIND_HOTKEY, lambda event: self.rewind_game())  # Перемотка назад
+
+        # Загрузка спрайтов: стартовый экран уже показан, изображения появятся по мере готовности
+        self.preloader = self.create_preloader()
+        if background_loading:
+            self.preloader.start()
+        else:
+            self.preloader.load_now()
 
-        self.game_over_in_progress = False  # Флаг, указывающий, идет ли обработка экрана окончания игры
-
-    def setup_background_asteroids(self):
+    def animate_start_screen(self):
         """
-        Создает полупрозрачные астероиды для фона стартового экрана.
-
-        Каждый астероид имеет случайные координаты, размер и скорость,
-        чтобы создать эффект движущегося звездного поля на фоне.
+        Сдвигает звездное поле стартового экрана по таймеру. Во время игры звездное поле
+        сдвигается в каждом кадре игрового цикла, и таймер останавливается.
         """
-        for _ in range(10):  # Количество астероидов
-            x = random.randint(0, SCREEN_WIDTH)  # Случайная координата X в пределах ширины экрана
-            y = random.randint(0, SCREEN_HEIGHT)  # Случайная координата Y в пределах высоты экрана
-            size = random.randint(30, 60)  # Случайный размер астероида
-            speed = random.uniform(1, 5)  # Случайная скорость астероида
-            asteroid = BackgroundAsteroid(self.canvas, x, y, size, speed)
-            # Создаем объект астероида и добавляем его в список фоновых астероидов
-            self.background_asteroids.append(asteroid)
+        if self.sim.running:
+            return
+        self.update_starfield()
+        delay = max(self.governor.settings["starfield_interval"], int(self.frame_interval * 1000))
+        self.root.after(delay, self.animate_start_screen)
 
-    def update_background_asteroids(self):
-        """
-        Обновляет позиции фоновых астероидов.
+    def update_starfield(self):
+        """Сдвигает звездное поле на время, прошедшее с предыдущего сдвига (не чаще, чем позволяет качество)."""
+        self.starfield.update(time.perf_counter(), self.governor.settings["starfield_interval"] / 1000)
 
-        Астероиды перемещаются в соответствии со своей скоростью. Если игра еще не началась,
-        обновление выполняется циклически с задержкой.
+    def create_preloader(self):
         """
-        for asteroid in self.background_asteroids:
-            asteroid.update()  # Перемещение астероида
+        Создает загрузку спрайтов в два этапа.
 
-        if not self.running:  # Продолжает обновление, пока игра не началась
-            self.root.after(50, self.update_background_asteroids)
+        Первый этап — изображения стартового экрана (сердечко и астероиды звездного поля).
+        Второй — все спрайты игры: кадры взрыва астероидов всех размеров, а при отрисовке
+        элементами холста также все повернутые кадры корабля, ракеты и астероидов, чтобы
+        появление астероидов, выстрелы и повороты не поворачивали изображения во время игры.
 
-    def load_sprites(self):
+        Возвращает:
+            Preloader: Загрузка, готовая к запуску.
         """
-        Загружает все необходимые спрайты для игры.
+        preloader = Preloader(self.root)
+        start_screen = [("photo", HEART_IMAGE_FILENAME, (HEART_IMAGE_SIZE, HEART_IMAGE_SIZE))]
+        for size in self.starfield.rock_sizes():
+            start_screen.append(("photo", ASTEROID_SPRITE, (size, size)))
+        preloader.add_stage(start_screen, self.on_start_screen_loaded)
+
+        sizes = [(radius * 2, radius * 2) for radius in sorted({Asteroid.bucket_radius(r) for r in range(20, 41)})]
+        game = [("photo", sprite, size) for size in sizes for sprite in EXPLOSION_SPRITES]
+        if RENDERER == "canvas":
+            # Повернутые PhotoImage нужны только при отрисовке элементами холста
+            ship_size = (SHIP_IMAGE_SIZE, SHIP_IMAGE_SIZE)
+            for sprite in (STATIC_SHIP_SPRITE, THRUSTING_SHIP_SPRITE):
+                game += Preloader.rotation_jobs(sprite, ship_size, SHIP_ROTATION_SPEED)
+            game += Preloader.rotation_jobs(ROCKET_SPRITE, None, SHIP_ROTATION_SPEED)
+            for size in sizes:
+                game += Preloader.rotation_jobs(ASTEROID_SPRITE, size, ASTEROID_ROTATION_STEP)
+        preloader.add_stage(game, self.on_assets_loaded)
+        return preloader
+
+    def on_start_screen_loaded(self):
+        """Показывает сердечки и астероиды звездного поля, когда загружены их изображения."""
+        self.heart_image = assets.get_photo(HEART_IMAGE_FILENAME, (HEART_IMAGE_SIZE, HEART_IMAGE_SIZE))
+        self.sprites["heart"] = self.hud.heart_image = self.heart_image
+        self.starfield.add_rocks()
 
-        Загружает изображения сердечек и корабля (статического и с работающим двигателем).
-        Преобразует их в формат PhotoImage для использования на Canvas.
-        """
-        sprites = {}
-
-        # Загрузка спрайта сердечка
-        heart_path = os.path.join(SPRITE_FOLDER, HEART_IMAGE_FILENAME)
-        sprites["heart"] = ImageTk.PhotoImage(
-            Image.open(heart_path).resize((HEART_IMAGE_SIZE, HEART_IMAGE_SIZE))
-        )
-
-        # Загрузка спрайтов корабля
-        static_ship_path = os.path.join(SPRITE_FOLDER, "static_ship.png")
-        thrusting_ship_path = os.path.join(SPRITE_FOLDER, "thrusting_ship.png")
-        sprites["static_ship"] = ImageTk.PhotoImage(Image.open(static_ship_path))
-        sprites["thrusting_ship"] = ImageTk.PhotoImage(Image.open(thrusting_ship_path))
-
-        return sprites
-
-    def update_heart_display(self):
-        """
-        Обновляет отображение количества жизней в виде сердечек.
-
-        Удаляет старые сердечки и добавляет новые в соответствии с оставшимися жизнями.
-        Сердечки размещаются по верхнему правому краю экрана.
-        """
-        # Удаление текущих виджетов сердечек
-        for widget in self.heart_widgets:
-            self.canvas.delete(widget)
-        self.heart_widgets.clear()
-
-        # Добавление новых сердечек
-        for i in range(self.lives):
-            x_offset = SCREEN_WIDTH - (i + 1) * (HEART_IMAGE_SIZE + 5) - 10  # Смещение по X
-            y_offset = 10  # Фиксированное смещение по Y
-            heart = self.canvas.create_image(x_offset, y_offset, anchor="nw", image=self.heart_image)
-            self.heart_widgets.append(heart)
-
-        # Убедиться, что сердечки отображаются поверх других элементов
-        for heart in self.heart_widgets:
-            self.canvas.tag_raise(heart)
+        # Обновление отображения жизней
+        self.hud.set_lives(self.sim.lives)
+        self.hud.covered = True
+        self.hud.apply()
+
+    def on_assets_loaded(self):
+        """Создает способ отрисовки и разрешает начать игру, когда загружены все спрайты."""
+        self.renderer = create_renderer(RENDERER, self.canvas, self.hud)
+        self.assets_ready = True
+        self.canvas.itemconfig(self.start_screen_clickable, text="Click to Play")
+
+        if self.startup is not None:
+            self.startup.mark("interactive")
+            print(f"Startup: {self.startup.report()}; {self.preloader.delivered} image(s) preloaded, "
+                  f"loader thread {self.preloader.worker_time * 1000:.1f} ms")
+        if self.start_requested:
+            self.start_game()
 
     def set_rotation(self, direction):
         """
@@ -167,37 +234,35 @@ class Game:
         Args:
             event (Optional): Событие, возникающее при нажатии.
         """
-        if not self.running:
-            self.running = True
+        if not self.assets_ready:
+            self.start_requested = True  # Игра начнется, когда загрузятся спрайты
+            return
+        if not self.sim.running:
             # Удаление элементов стартового экрана
             self.canvas.delete(self.start_screen_title)
             self.canvas.delete(self.start_screen_clickable)
-
-            # Удаление фоновых астероидов
-            for asteroid in self.background_asteroids:
-                asteroid.remove()
-
-            # Сброс параметров игры и создание корабля
-            self.reset_game()
-            self.ship = Ship(self.canvas, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, self.sprites)
-
-            # Генерация астероидов и запуск игрового цикла
-            self.spawn_asteroids()
+            if self.start_screen_leaderboard is not None:
+                self.canvas.delete(self.start_screen_leaderboard)
+
+            # Звездное поле остается фоном игры, если способ отрисовки его не закрывает
+            if self.renderer.opaque:
+                self.starfield.remove()
+
+            # Создание корабля и астероидов и запуск игрового цикла
+            self.apply_quality()
+            self.sim.start()
+            if self.start_state is not None:
+                self.restore_state(self.start_state)
+            self.last_frame_time = self.next_frame_time = time.perf_counter()
+            self.accumulator = 0.0
             self.update_game()
 
-    def reset_game(self):
-        """Сбрасывает параметры игры до начального состояния."""
-        self.lives = LIVES  # Установка количества жизней
-        self.score = INITIAL_SCORE  # Установка начального счета
-        self.update_heart_display()  # Обновление отображения жизней
-        self.canvas.itemconfig(self.score_text, text=f"Score: {self.score}")  # Обновление текста счета
-
     def setup_start_screen(self):
-        """Создает элементы стартового экрана."""
-        # Создание фоновых астероидов
-        self.setup_background_asteroids()
-        self.update_background_asteroids()
-
+        """
+        Создает элементы стартового экрана. Фоновые астероиды и сердечки появляются
+        после загрузки их изображений, а надпись "Loading..." сменяется на "Click to Play"
+        после загрузки всех спрайтов.
+        """
         # ASCII-заголовок игры
         ascii_title = """
 
@@ -220,165 +285,433 @@ class Game:
         self.start_screen_clickable = self.canvas.create_text(
             SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50,
             fill="white", font=("Arial", 18, "bold"),
-            text="Click to Play", anchor="center"
+            text="Loading...", anchor="center"
         )
         # Привязка нажатия к запуску игры
         self.canvas.tag_bind(self.start_screen_clickable, "<Button-1>", self.start_game)
+        self.hud.apply()
+        self.animate_start_screen()
 
-        # Обновление отображения жизней
-        self.update_heart_display()
+    def enable_results(self, writer):
+        """
+        Включает запись результатов игр и показывает таблицу лучших результатов
+        на стартовом экране, как только фоновый поток ее прочитает.
 
-    def update_game(self):
-        """Основной игровой цикл."""
-        if self.running:
-            # Обновление состояния корабля
-            if self.ship:
-                if self.rotating_left:
-                    self.ship.rotate(-SHIP_ROTATION_SPEED)
-                if self.rotating_right:
-                    self.ship.rotate(SHIP_ROTATION_SPEED)
-
-                self.ship.thrusting = self.thrusting
-                self.ship.update()
-
-            # Обновление объектов
-            self.update_rockets()
-            self.update_asteroids()
-            self.check_collisions()
-            self.cleanup_objects()
-
-            # Генерация дополнительных астероидов
-            if not self.game_over_in_progress:
-                self.spawn_asteroids()
-
-            # Планирование следующего кадра
-            self.root.after(16, self.update_game)
-
-    def cleanup_objects(self):
-        """Удаляет объекты, которые больше не нужны."""
-        # Удаление устаревших ракет
-        for rocket in self.rockets:
-            if rocket.expired:
-                self.canvas.delete(rocket.sprite_id)
-        self.rockets = [r for r in self.rockets if not r.expired]
-
-        # Удаление уничтоженных астероидов
-        for asteroid in self.asteroids:
-            if asteroid.destroyed and not asteroid.exploding:
-                self.canvas.delete(asteroid.sprite_id)
-        self.asteroids = [a for a in self.asteroids if not (a.destroyed and not a.exploding)]
-
-    def check_collisions(self):
-        """Проверяет столкновения между объектами."""
-        # Проверка столкновений ракета-астероид
-        for rocket in self.rockets:
-            for asteroid in self.asteroids:
-                if self.distance(rocket.x, rocket.y, asteroid.x, asteroid.y) < asteroid.radius:
-                    print(f"Collision detected: Rocket {rocket.sprite_id} hit Asteroid {asteroid.sprite_id}")
-                    rocket.expired = True
-                    if not asteroid.exploding:
-                        print(f"Asteroid {asteroid.sprite_id} starts explosion")
-                        asteroid.start_explosion()
-                    self.score += 1
-                    self.canvas.itemconfig(self.score_text, text=f"Score: {self.score}")
-                    self.canvas.tag_raise(self.score_text)
-                    break
-
-        # Проверка столкновений корабль-астероид
-        if self.ship:
-            for asteroid in self.asteroids:
-                # Пропускает астероиды, которые ещё взрываются
-                if asteroid.exploding:
-                    continue
-
-                if self.distance(self.ship.x, self.ship.y, asteroid.x, asteroid.y) < asteroid.radius:
-                    print(f"Collision detected: Ship collided with Asteroid {asteroid.sprite_id}")
-                    if not asteroid.exploding:
-                        asteroid.start_explosion(mark_as_killer=True)
-                    self.lives -= 1
-                    self.update_heart_display()
-                    if self.lives <= 0:
-                        self.game_over()
-                        return
-                    else:
-                        self.ship.respawn()
-
-    def update_rockets(self):
-        """Обновляет положение ракет и удаляет истёкшие."""
-        for rocket in self.rockets:
-            rocket.update()
-        # Удаляем ракеты, которые истекли
-        self.rockets = [r for r in self.rockets if not r.expired]
-
-    def update_asteroids(self):
-        """Обновляет положение астероидов и удаляет завершившие взрыв."""
-        for asteroid in self.asteroids:
-            asteroid.update()
-        # Удаляем астероиды, только если они разрушены и взрыв завершился
-        self.asteroids = [a for a in self.asteroids if not (a.destroyed and not a.exploding)]
-
-    def spawn_asteroids(self):
-        """Генерирует астероиды, чтобы их общее количество на экране было сбалансированным."""
-        if not self.running or self.game_over_in_progress:  # Предотвращение спавна при завершении игры
+        Аргументы:
+            writer (ResultsWriter): Запись результатов (запускается здесь).
+        """
+        self.results = writer
+        writer.start()
+        self.poll_leaderboard()
+
+    def poll_leaderboard(self):
+        """Ждет таблицу лучших результатов от фонового потока и показывает ее, пока игра не началась."""
+        if self.sim.running:
+            return
+        if not self.results.ready.is_set():
+            self.root.after(RESULTS_POLL_INTERVAL, self.poll_leaderboard)
+            return
+        if self.results.error is not None:
+            log.channel("game").warning("Results store unavailable: %s", self.results.error)
             return
+        self.start_screen_leaderboard = self.canvas.create_text(
+            SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 85,
+            fill="gold", font=("Courier", 11), anchor="n",
+            text=format_leaderboard(self.results.leaderboard)
+        )
+        self.hud.covered = True  # Таблица создана поверх интерфейса
+        self.hud.apply()
+
+    def update_game(self):
+        """
+        Основной игровой цикл с фиксированным шагом.
 
-        # Рассчитываем, сколько астероидов нужно добавить
-        num_to_spawn = max(0, MIN_ASTEROIDS - len(self.asteroids))
-        for _ in range(num_to_spawn):
-            x = random.randint(0, SCREEN_WIDTH)  # Случайная координата x
-            y = random.randint(0, SCREEN_HEIGHT)  # Случайная координата y
-            dx = random.uniform(-ASTEROID_SPEED, ASTEROID_SPEED)  # Случайная скорость по x
-            dy = random.uniform(-ASTEROID_SPEED, ASTEROID_SPEED)  # Случайная скорость по y
-            self.asteroids.append(Asteroid(self.canvas, x, y, dx, dy))
-
-        # Ограничиваем общее количество астероидов максимальным значением
-        self.asteroids = self.asteroids[:MAX_ASTEROIDS]
-
-    def game_over(self):
-        """Обрабатывает завершение игры."""
-        print("Game Over! Finalizing animations...")
-        self.game_over_in_progress = True  # Indicate game-over sequence is in progress
-
-        # Удаляем корабль с экрана
-        if self.ship and hasattr(self.ship, 'sprite_id'):
-            self.canvas.delete(self.ship.sprite_id)
-            self.ship = None
-
-        # Удаляем все астероиды, кроме "убийцы"
-        for asteroid in self.asteroids:
-            if not asteroid.exploding:
-                self.canvas.delete(asteroid.sprite_id)
-        self.asteroids = [a for a in self.asteroids if a.exploding]
-
-        # Удаляем текст счета
-        self.canvas.delete(self.score_text)
-
-        # Ждем завершения взрывов перед отображением финального экрана
-        self.wait_for_explosions()
-
-    def wait_for_explosions(self):
-        """Ждет завершения всех взрывов, прежде чем отобразить финальный экран."""
-        explosions_active = any(asteroid.exploding for asteroid in self.asteroids)
-
-        if explosions_active:
-            # Если есть активные взрывы, проверяем их через короткий интервал
-            self.root.after(100, self.wait_for_explosions)
+        Прошедшее реальное время накапливается, и симуляция выполняет столько тиков
+        по TICK_RATE, сколько в нем помещается (не больше MAX_TICKS_PER_FRAME). Затем
+        кадр отрисовывается один раз с позициями, интерполированными между двумя
+        последними тиками, а следующий кадр планируется с учетом оставшегося бюджета.
+        """
+        if not self.sim.running:
+            return
+        profiler = self.sim.profiler
+        if profiler:
+            profiler.begin_frame()
+
+        now = time.perf_counter()
+        self.accumulator += now - self.last_frame_time
+        self.last_frame_time = now
+
+        if self.fast_forward:
+            # Максимальная скорость: полный кадр тиков без интерполяции
+            ticks = MAX_TICKS_PER_FRAME
+            self.accumulator = 0.0
         else:
-            # Когда взрывы завершены, отображаем финальный экран
+            ticks = min(int(self.accumulator / self.tick_interval), MAX_TICKS_PER_FRAME)
+            self.accumulator -= ticks * self.tick_interval
+            if ticks == MAX_TICKS_PER_FRAME:
+                # Отбрасываем отставание, которое не удалось отработать за кадр
+                self.accumulator = min(self.accumulator, self.tick_interval)
+
+        for tick in range(ticks):
+            if tick == ticks - 1:
+                self.capture_previous_positions()
+            self.step_simulation()
+            if not self.sim.running:
+                break
+
+        if profiler:
+            profiler.restart()
+        self.render(self.accumulator / self.tick_interval)
+        if profiler:
+            profiler.mark("render")
+            self.end_profiled_frame()
+        if self.governor.record(time.perf_counter() - now):
+            self.apply_quality()
+        if self.memory_sampling and self.memory.due(self.frame_number):
+            self.sample_memory()
+            if self.memory.failed:
+                self.root.quit()  # Проверка длительной игрой не пройдена
+                return
+
+        if self.sim.finished:
             self.finalize_game_over()
+            return
+
+        # Планирование следующего кадра по оставшемуся бюджету времени
+        self.next_frame_time += self.frame_interval
+        now = time.perf_counter()
+        if self.next_frame_time < now or self.fast_forward:
+            self.next_frame_time = now  # Кадр опоздал: не пытаемся догнать пропущенные кадры
+        self.root.after(int((self.next_frame_time - now) * 1000), self.update_game)
+
+    def apply_quality(self):
+        """
+        Применяет текущий уровень качества к симуляции.
+
+        Частота появления астероидов меняет ход игры, поэтому при записи и воспроизведении
+        она остается такой, как в config.py: иначе запись не воспроизвелась бы.
+        """
+        if self.recorder is None and self.replay is None:
+            self.sim.spawn_interval = self.governor.settings["spawn_interval"]
+        else:
+            self.sim.spawn_interval = ASTEROID_SPAWN_INTERVAL
+
+    def enable_profiler(self, enabled=True):
+        """
+        Включает или выключает сбор измерений профилировщика.
+
+        Аргументы:
+            enabled (bool): Новое состояние профилировщика.
+        """
+        self.profiler.enabled = enabled
+        self.sim.profiler = self.profiler if enabled else None
+
+    def toggle_profiler(self):
+        """Переключает оверлей профилировщика (и сбор измерений, если не идет запись в CSV)."""
+        self.profiler_overlay = not self.profiler_overlay
+        self.hud.set_visible("profiler", self.profiler_overlay)
+        self.hud.apply()
+        self.enable_profiler(self.profiler_overlay or self.profiler.csv_file is not None)
+
+    def end_profiled_frame(self):
+        """Завершает кадр профилировщика и периодически обновляет оверлей."""
+        profiler = self.profiler
+        allocations = rotation_cache.misses + len(assets.photos)
+        profiler.end_frame({
+            "asteroids": len(self.sim.asteroids),
+            "rockets": len(self.sim.rockets),
+            "canvas_items": len(self.canvas.find_all()),
+            "photo_images": allocations,
+            "quality_level": self.governor.index,
+        })
+
+        if self.profiler_overlay and profiler.frames % PROFILER_OVERLAY_INTERVAL == 0:
+            now = time.perf_counter()
+            previous_allocations, previous_time = self.photo_allocations
+            rate = (allocations - previous_allocations) / max(now - previous_time, 1e-9)
+            self.photo_allocations = (allocations, now)
+            self.hud.set("profiler", text=f"{profiler.report()}\nphoto_images/s: {rate:.1f}\n"
+                                          f"{self.governor.report()}")  # Применится в следующем кадре
+
+    def toggle_memory_overlay(self):
+        """Переключает оверлей памяти; при показе сразу делает замер."""
+        self.memory_overlay = not self.memory_overlay
+        self.hud.set_visible("memory", self.memory_overlay)
+        self.enable_memory_sampling(self.memory_overlay)
+        if self.memory_overlay:
+            self.sample_memory()
+        self.hud.apply()
+
+    def enable_memory_sampling(self, enabled=True):
+        """
+        Включает или выключает замеры памяти. Замеры не выключаются, пока идет сохранение
+        в JSON или проверка длительной игрой.
+
+        Аргументы:
+            enabled (bool): Новое состояние замеров.
+        """
+        self.memory_sampling = enabled or self.memory_dump_path is not None or self.memory.strict
+
+    def memory_counters(self):
+        """
+        Собирает счетчики объектов, которые могут накапливаться за игру.
+
+        Возвращает:
+            dict: Живые изображения Tk, элементы холста, объекты симуляции и кэшей.
+        """
+        counters = {
+            "tk_images": len(self.canvas.image_names()),
+            "canvas_items": len(self.canvas.find_all()),
+            "asteroids": len(self.sim.asteroids),
+            "rockets": len(self.sim.rockets),
+            "pooled_asteroids": len(self.sim.asteroid_pool.free),
+            "cached_photos": len(assets.photos),
+            "rotation_frames": len(rotation_cache.frames),
+        }
+        if self.renderer is not None:
+            counters.update(self.renderer.memory_counters())
+        return counters
+
+    def sample_memory(self):
+        """
+        Делает замер памяти, пишет превышения в журнал, обновляет оверлей
+        и периодически сохраняет замеры в JSON.
+        """
+        memory = self.memory
+        violations = memory.record(self.frame_number, self.memory_counters())
+        for violation in violations:
+            log.channel("game").error("Memory growth: %s", violation)
+        if self.memory_dump_path and (violations or memory.recorded % MEMORY_DUMP_INTERVAL == 0):
+            memory.dump(self.memory_dump_path)
+        if self.memory_overlay:
+            self.hud.set("memory", text=memory.report())  # Применится в следующем кадре
+
+    def capture_previous_positions(self):
+        """
+        Запоминает позиции объектов перед тиком, чтобы интерполировать между тиками.
+        Вместе с позицией запоминается идентификатор: объект из пула, выданный
+        заново за этот тик, не интерполируется от своего прошлого положения.
+        """
+        positions = {obj: (obj.x, obj.y, obj.id) for obj in self.sim.asteroids}
+        positions.update((obj, (obj.x, obj.y, obj.id)) for obj in self.sim.rockets)
+        if self.sim.ship:
+            positions[self.sim.ship] = (self.sim.ship.x, self.sim.ship.y, None)
+        self.previous_positions = positions
+
+    def interpolate(self, obj, alpha):
+        """
+        Вычисляет позицию объекта для отрисовки между двумя последними тиками.
+
+        Аргументы:
+            obj: Объект симуляции с координатами x и y.
+            alpha (float): Доля тика, прошедшая после последнего тика (0..1).
+
+        Возвращает:
+            tuple: Координаты (x, y) для отрисовки.
+        """
+        previous = self.previous_positions.get(obj)
+        if previous is None or alpha >= 1 or previous[2] != getattr(obj, "id", None):
+            return obj.x, obj.y
+        dx = wrap_delta(obj.x - previous[0], SCREEN_WIDTH)
+        dy = wrap_delta(obj.y - previous[1], SCREEN_HEIGHT)
+        if dx * dx + dy * dy > INTERPOLATION_SNAP_DISTANCE ** 2:
+            return obj.x, obj.y  # Телепортация (например, возрождение) не интерполируется
+        x = (previous[0] + dx * alpha) % SCREEN_WIDTH
+        y = (previous[1] + dy * alpha) % SCREEN_HEIGHT
+        return x, y
+
+    def step_simulation(self):
+        """
+        Выполняет один тик симуляции с битами управления от клавиатуры или из
+        воспроизводимой записи и передает тик записи игры, если она ведется.
+        """
+        if self.replay is not None:
+            if self.replay.finished(self.sim):
+                log.channel("game").warning("Replay finished at tick %s, %s checksum(s) verified",
+                                            self.sim.tick, self.replay.verified)
+                self.sim.running = False  # Запись кончилась раньше игры
+                return
+            inputs = self.replay.inputs_for(self.sim.tick + 1)
+        else:
+            inputs = self.read_inputs()
+        self.sim.step(inputs)
+        if self.recorder is not None:
+            self.recorder.record(self.sim, inputs)
+        if self.replay is not None:
+            self.replay.verify(self.sim)
+        elif self.recorder is None:
+            self.rewind.record(self.sim)  # Перемотка недоступна во время записи и воспроизведения
+
+    def quick_save(self):
+        """Сохраняет состояние идущей игры в файл QUICKSAVE_PATH."""
+        if not self.sim.running:
+            return
+        write_state(QUICKSAVE_PATH, self.sim)
+        log.channel("game").info("Game state saved to %s at tick %s", QUICKSAVE_PATH, self.sim.tick)
+
+    def quick_load(self):
+        """Загружает состояние из файла QUICKSAVE_PATH, если игра идет."""
+        if not self.sim.running:
+            return
+        try:
+            with open(QUICKSAVE_PATH, "rb") as file:
+                data = file.read()
+        except OSError as error:
+            log.channel("game").warning("Quick load failed: %s", error)
+            return
+        self.restore_state(data)
+
+    def rewind_game(self):
+        """Перематывает игру на REWIND_STEP секунд назад (не дальше, чем хранит RewindBuffer)."""
+        if not self.sim.running:
+            return
+        data = self.rewind.rewind(self.sim.tick - REWIND_STEP * TICK_RATE)
+        if data is not None:
+            self.restore_state(data)
+
+    def restore_state(self, data):
+        """
+        Загружает состояние в симуляцию на месте (см. SaveState.load_state): объекты берутся
+        из пулов и сохраняют свои элементы холста, а интерполяция начинается заново.
+
+        Во время записи и воспроизведения загрузка недоступна: запись хранит только
+        биты управления от начала игры и после загрузки не воспроизвелась бы.
+
+        Аргументы:
+            data (bytes): Состояние (SaveState.save_state).
+
+        Возвращает:
+            bool: True, если состояние загружено.
+        """
+        if self.recorder is not None or self.replay is not None:
+            log.channel("game").warning("Game states can not be loaded while recording or replaying")
+            return False
+        load_state(data, self.sim)
+        self.previous_positions = {}
+        self.asteroid_rotations.clear()
+        self.pending_shots = 0
+        self.apply_quality()
+        log.channel("game").info("Game state loaded at tick %s", self.sim.tick)
+        return True
+
+    def read_inputs(self):
+        """
+        Собирает биты управления для очередного тика из состояния клавиш.
+
+        Возвращает:
+            int: Битовая маска управления для Simulation.step.
+        """
+        inputs = 0
+        if self.rotating_left:
+            inputs |= INPUT_LEFT
+        if self.rotating_right:
+            inputs |= INPUT_RIGHT
+        if self.thrusting:
+            inputs |= INPUT_THRUST
+        if self.pending_shots:
+            self.pending_shots -= 1
+            inputs |= INPUT_SHOOT
+        return inputs
+
+    def render(self, alpha=1.0):
+        """
+        Сдвигает звездное поле, отрисовывает текущее состояние симуляции выбранным способом
+        (RENDERER в config.py) и обновляет интерфейс.
+
+        Аргументы:
+            alpha (float): Доля тика для интерполяции позиций (1 — без интерполяции).
+        """
+        renderer = self.renderer
+        self.frame_number += 1
+        self.update_starfield()
+        renderer.begin_frame()
+        renderer.draw_layer("asteroids", [self.sprite(asteroid, self.asteroid_frame(asteroid), alpha)
+                                          for asteroid in self.sim.asteroids])
+        renderer.draw_layer("rockets", [self.sprite(rocket, self.rocket_frame(rocket), alpha)
+                                        for rocket in self.sim.rockets])
+        ship = self.sim.ship
+        renderer.draw_layer("ship", [self.sprite(ship, self.ship_frame(ship), alpha)] if ship else [])
+        renderer.end_frame()
+
+        # Интерфейс применяет только изменившиеся жизни и счет
+        self.hud.set_lives(self.sim.lives)
+        self.hud.set_score(self.sim.score)
+        self.hud.set_visible("score", not self.sim.game_over_in_progress and not self.sim.finished)
+        self.hud.apply()
+
+    def sprite(self, obj, frame, alpha):
+        """Возвращает кортеж (объект, x, y, кадр) для отрисовки с интерполированной позицией."""
+        x, y = self.interpolate(obj, alpha)
+        return obj, x, y, frame
+
+    @staticmethod
+    def ship_frame(ship):
+        """Возвращает кадр корабля: повернутый спрайт с работающим двигателем или без."""
+        sprite = THRUSTING_SHIP_SPRITE if ship.thrusting else STATIC_SHIP_SPRITE
+        index = rotation_cache.quantize(-(ship.angle - 90), SHIP_ROTATION_SPEED)  # Корректируем угол
+        return "frame", sprite, (SHIP_IMAGE_SIZE, SHIP_IMAGE_SIZE), SHIP_ROTATION_SPEED, index
+
+    def asteroid_frame(self, asteroid):
+        """
+        Возвращает кадр астероида: повернутый спрайт или кадр анимации взрыва.
+        Кадр включает размер, так как объект из пула может вернуться с другим радиусом;
+        размер спрайта привязан к шагу ASTEROID_RADIUS_BUCKET.
+
+        На пониженном качестве угол спрайта обновляется раз в несколько кадров, мелкие
+        и далекие от корабля астероиды не вращаются, а анимация взрыва короче.
+        Угол в симуляции при этом не меняется.
+        """
+        quality = self.governor.settings
+        radius = Asteroid.bucket_radius(int(asteroid.radius))
+        size = (radius * 2, radius * 2)
+        if asteroid.exploding:
+            frame = min(int(asteroid.explosion_timer) // 10, quality["explosion_frames"] - 1)
+            return "photo", EXPLOSION_SPRITES[frame], size
+        interval = quality["rotation_interval"]
+        max_distance = quality["rotation_max_distance"]
+        if interval == 1 and not quality["rotation_min_radius"] and max_distance is None:
+            index = rotation_cache.quantize(asteroid.angle, ASTEROID_ROTATION_STEP)
+        else:
+            last = self.asteroid_rotations.get(asteroid)
+            ship = self.sim.ship
+            if (last is None or last[0] != asteroid.id
+                    or (self.frame_number + asteroid.id) % interval == 0  # Астероиды обновляются вразнобой
+                    and asteroid.radius >= quality["rotation_min_radius"]
+                    and (max_distance is None or ship is None
+                         or wrapped_distance_sq(ship.x, ship.y, asteroid.x, asteroid.y) <= max_distance ** 2)):
+                last = self.asteroid_rotations[asteroid] = (
+                    asteroid.id, rotation_cache.quantize(asteroid.angle, ASTEROID_ROTATION_STEP))
+            index = last[1]
+        return "frame", ASTEROID_SPRITE, size, ASTEROID_ROTATION_STEP, index
+
+    @staticmethod
+    def rocket_frame(rocket):
+        """Возвращает кадр ракеты; угол ракеты кратен шагу поворота корабля."""
+        index = rotation_cache.quantize(rocket.angle, SHIP_ROTATION_SPEED)
+        return "frame", ROCKET_SPRITE, None, SHIP_ROTATION_SPEED, index
+
+    def report_crash(self, exc_type, value, trace):
+        """
+        Обрабатывает исключение в обработчике tkinter: пишет его в журнал,
+        сохраняет буфер журнала (если задан log_dump_path) и выводит трассировку.
+        """
+        log.channel("game").error("Unhandled %s: %s", exc_type.__name__, value)
+        if self.log_dump_path:
+            log.dump(self.log_dump_path)
+        traceback.print_exception(exc_type, value, trace)
 
     def finalize_game_over(self):
         """Очищает экран и отображает финальное сообщение 'Game Over'."""
-        # Удаляем все оставшиеся элементы игры
-        for asteroid in self.asteroids:
-            if hasattr(asteroid, 'sprite_id'):
-                self.canvas.delete(asteroid.sprite_id)
-        self.asteroids.clear()
-
-        for rocket in self.rockets:
-            if hasattr(rocket, 'sprite_id'):
-                self.canvas.delete(rocket.sprite_id)
-        self.rockets.clear()
+        # Удаляем все оставшиеся элементы игры (симуляция уже очистила свои списки)
+        self.render()
+        if self.log_dump_path:
+            log.dump(self.log_dump_path)
+        if self.recorder is not None:
+            self.recorder.save(self.sim)
+        if self.memory_dump_path:
+            self.memory.dump(self.memory_dump_path)
+        if self.results is not None and self.replay is None:
+            self.results.submit(game_result(self.sim, self.seed))  # Запишет фоновый поток
 
         # ASCII-арт с сообщением "Game Over"
         game_over_ascii = """
@@ -396,24 +729,88 @@ class Game:
         # Отображаем финальный счет
         self.canvas.create_text(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50,
                                 fill="white", font=("Arial", 18, "bold"),
-                                text=f"Final Score: {self.score}", anchor="center")
-
-        # Завершаем игру
-        self.running = False
-        print("Game Over sequence completed.")
+                                text=f"Final Score: {self.sim.score}", anchor="center")
 
     def shoot_rocket(self):
-        """Выстреливает ракету из корабля."""
-        if self.running:
-            self.rockets.append(self.ship.shoot())
-
-    @staticmethod
-    def distance(x1, y1, x2, y2):
-        """Вычисляет расстояние между двумя точками."""
-        return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+        """Запрашивает выстрел ракетой на следующем тике симуляции."""
+        if self.sim.running:
+            self.pending_shots += 1
 
 
 if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Asteroids")
+    parser.add_argument("--profile-csv", metavar="PATH", help="Записывать измерения каждого кадра в CSV-файл")
+    add_log_arguments(parser)
+    parser.add_argument("--log-dump", metavar="PATH", help="Сохранять буфер журнала при сбое и окончании игры")
+    parser.add_argument("--seed", type=int, help="Начальное значение генераторов случайных чисел")
+    parser.add_argument("--record", metavar="PATH", help="Записать игру в файл")
+    parser.add_argument("--replay", metavar="PATH", help="Воспроизвести запись игры")
+    parser.add_argument("--fast", action="store_true", help="Воспроизводить запись с максимальной скоростью")
+    parser.add_argument("--load-state", metavar="PATH",
+                        help="Начать игру с сохраненного состояния (F5 или python -m src.SaveState)")
+    parser.add_argument("--quality", choices=QUALITY_LEVELS, default=QUALITY_LEVEL, help="Начальный уровень качества")
+    parser.add_argument("--fixed-quality", action="store_true", help="Не менять уровень качества под нагрузкой")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="Вывести время импорта, первого кадра и готовности к игре")
+    parser.add_argument("--memory-dump", metavar="PATH", help="Периодически сохранять замеры памяти в JSON-файл")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Включить tracemalloc и показывать места с наибольшими выделениями памяти")
+    parser.add_argument("--results", metavar="PATH", default=RESULTS_PATH,
+                        help="Файл результатов игр (таблица лучших результатов на стартовом экране)")
+    parser.add_argument("--no-results", action="store_true", help="Не записывать результаты игр")
+    parser.add_argument("--memory-soak", action="store_true",
+                        help="Завершить игру с кодом 1, если память растет больше MEMORY_SOAK_LIMITS")
+    args = parser.parse_args()
+    if args.load_state and (args.record or args.replay):
+        parser.error("--load-state can not be combined with --record or --replay")
+    startup = StartupProfile(import_started) if args.startup_profile else None
+    if startup:
+        startup.mark("imports")
+    log.configure(args)
+
     root = tk.Tk()
-    game = Game(root)
+    replay = Replay(args.replay) if args.replay else None
+    game = Game(root, seed=replay.seed if replay else args.seed)
+    if startup:
+        game.startup = startup
+        game.canvas.bind("<Expose>", lambda event: startup.mark("first_frame"), add="+")
+    game.log_dump_path = args.log_dump
+    game.governor.set_level(args.quality)
+    game.governor.adaptive = not args.fixed_quality
+    root.report_callback_exception = game.report_crash
+    if args.profile_csv:
+        game.profiler.open_csv(args.profile_csv)
+        game.enable_profiler(True)
+    if args.trace_memory:
+        MemoryMonitor.start_tracing()
+    game.memory_dump_path = args.memory_dump
+    game.memory.strict = args.memory_soak
+    game.enable_memory_sampling(False)
+    if args.record:
+        game.recorder = Recorder(args.record, game.seed, use_store=game.sim.asteroid_store is not None,
+                                 swept=game.sim.swept)
+    if args.load_state:
+        with open(args.load_state, "rb") as file:
+            game.start_state = file.read()
+    if not args.no_results and not replay:
+        game.enable_results(ResultsWriter(args.results))
+    if replay:
+        game.sim = replay.create_simulation()
+        game.replay = replay
+        game.fast_forward = args.fast
+        game.start_game()
     root.mainloop()
+    if game.recorder is not None and not game.sim.finished:
+        game.recorder.save(game.sim)  # Окно закрыто до окончания игры
+    game.profiler.close()
+    if game.results is not None:
+        game.results.close()  # Дописывает результаты из очереди
+    if game.memory_dump_path:
+        game.memory.dump(game.memory_dump_path)
+    log.stop()
+    if game.memory.failed:
+        print(f"Memory soak failed: {'; '.join(game.memory.violations)}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,135 @@
+from src.config import *
+
+
+class Hud:
+    """
+    Класс Hud отображает интерфейс поверх игры: сердечки жизней, счет и другие индикаторы.
+
+    Элементы создаются на холсте один раз и дальше только изменяются. Игра задает
+    желаемое состояние элементов методами set, set_lives и set_score сколько угодно раз
+    за кадр, а apply один раз за кадр сравнивает его с показанным и отправляет не больше
+    одного itemconfig на элемент. Все элементы помечены тегом HUD_TAG, поэтому слой
+    поднимается над игрой одним tag_raise, и только если под ним появились новые элементы.
+
+    Атрибуты:
+        canvas (tk.Canvas): Холст игры.
+        items (dict): Идентификаторы элементов на холсте по имени.
+        shown (dict): Показанные параметры элементов по имени.
+        desired (dict): Желаемые параметры элементов по имени.
+        heart_image (ImageTk.PhotoImage): Изображение сердечка (None, пока оно загружается).
+        hearts (int): Количество созданных элементов-сердечек.
+        covered (bool): Флаг, указывающий, что на холсте созданы элементы поверх слоя интерфейса.
+    """
+
+    def __init__(self, canvas, heart_image):
+        """
+        Инициализация объекта Hud.
+
+        Аргументы:
+            canvas (tk.Canvas): Холст игры.
+            heart_image (ImageTk.PhotoImage): Изображение сердечка (None, пока оно загружается).
+        """
+        self.canvas = canvas
+        self.items = {}
+        self.shown = {}
+        self.desired = {}
+        self.heart_image = heart_image
+        self.hearts = 0
+        self.covered = False
+
+        # Текстовое поле для отображения счета в верхнем левом углу
+        self.add_text("score", 10, 10, anchor="nw", fill="white", font=("Arial", 16), text="")
+
+    def add_text(self, name, x, y, **options):
+        """
+        Создает текстовый элемент интерфейса.
+
+        Аргументы:
+            name (str): Имя элемента.
+            x (float): Координата x.
+            y (float): Координата y.
+            **options: Параметры create_text.
+        """
+        self.add(name, self.canvas.create_text(x, y, tags=(HUD_TAG,), **options), options)
+
+    def add_image(self, name, x, y, **options):
+        """
+        Создает элемент интерфейса с изображением.
+
+        Аргументы:
+            name (str): Имя элемента.
+            x (float): Координата x.
+            y (float): Координата y.
+            **options: Параметры create_image.
+        """
+        self.add(name, self.canvas.create_image(x, y, tags=(HUD_TAG,), **options), options)
+
+    def add(self, name, item, options):
+        """Регистрирует созданный элемент и его начальные параметры."""
+        self.items[name] = item
+        self.shown[name] = dict(options)
+        self.desired[name] = dict(options)
+
+    def set(self, name, **options):
+        """
+        Задает желаемые параметры элемента; на холст они попадут при вызове apply.
+
+        Аргументы:
+            name (str): Имя элемента.
+            **options: Параметры itemconfig (text, state, image и т. п.).
+        """
+        self.desired[name].update(options)
+
+    def set_visible(self, name, visible):
+        """
+        Показывает или скрывает элемент.
+
+        Аргументы:
+            name (str): Имя элемента.
+            visible (bool): Новое состояние видимости.
+        """
+        self.desired[name]["state"] = "normal" if visible else "hidden"
+
+    def set_score(self, score):
+        """
+        Задает отображаемый счет.
+
+        Аргументы:
+            score (int): Счет игрока.
+        """
+        self.desired["score"]["text"] = f"Score: {score}"
+
+    def set_lives(self, lives):
+        """
+        Задает количество сердечек. Недостающие сердечки создаются один раз,
+        лишние скрываются. Сердечки размещаются по верхнему правому краю экрана;
+        пока изображение сердечка не загружено, они не создаются.
+
+        Аргументы:
+            lives (int): Количество жизней.
+        """
+        while self.heart_image is not None and self.hearts < lives:
+            x_offset = SCREEN_WIDTH - (self.hearts + 1) * (HEART_IMAGE_SIZE + 5) - 10  # Смещение по X
+            y_offset = 10  # Фиксированное смещение по Y
+            self.add_image(f"heart{self.hearts}", x_offset, y_offset, anchor="nw", image=self.heart_image,
+                           state="hidden")
+            self.hearts += 1
+        for i in range(self.hearts):
+            self.set_visible(f"heart{i}", i < lives)
+
+    def apply(self):
+        """
+        Применяет изменения желаемого состояния к холсту: не больше одного itemconfig
+        на элемент и не больше одного tag_raise на весь слой.
+        """
+        for name, desired in self.desired.items():
+            shown = self.shown[name]
+            changes = {key: value for key, value in desired.items() if shown.get(key) != value}
+            if changes:
+                self.canvas.itemconfig(self.items[name], **changes)
+                shown.update(changes)
+
+        # Элементы игры, созданные после интерфейса, оказались над ним
+        if self.covered:
+            self.canvas.tag_raise(HUD_TAG)
+            self.covered = False
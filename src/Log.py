@@ -0,0 +1,313 @@
+import sys
+import threading
+import time
+
+from src.config import *
+
+# Уровни журнала
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100  # Категория выключена
+
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR", OFF: "OFF"}
+
+
+def parse_level(level):
+    """
+    Преобразует имя уровня ("debug", "INFO" и т. п.) или число в числовой уровень.
+
+    Аргументы:
+        level (str | int): Имя или значение уровня.
+
+    Возвращает:
+        int: Числовой уровень.
+    """
+    if isinstance(level, int):
+        return level
+    for value, name in LEVEL_NAMES.items():
+        if name == level.upper():
+            return value
+    raise ValueError(f"unknown log level: {level}")
+
+
+def add_log_arguments(parser):
+    """
+    Добавляет в argparse параметры журнала: --log-level, --log-category и --log-file.
+
+    Аргументы:
+        parser (argparse.ArgumentParser): Разборщик аргументов.
+    """
+    parser.add_argument("--log-level", help="Уровень журнала: debug, info, warning, error, off")
+    parser.add_argument("--log-category", action="append", metavar="NAME[=LEVEL]",
+                        help="Уровень отдельной категории (explosion, collision, game, net); по умолчанию debug")
+    parser.add_argument("--log-file", metavar="PATH", help="Файл журнала (по умолчанию stderr)")
+
+
+class Channel:
+    """
+    Класс Channel — категория журнала с собственным уровнем.
+
+    В горячем коде запись проверяется одним сравнением целых чисел до форматирования
+    и даже до вызова метода:
+
+        if explosion_log.level <= DEBUG:
+            explosion_log.debug("Asteroid %s exploding", asteroid.id)
+
+    Атрибуты:
+        name (str): Имя категории.
+        level (int): Минимальный уровень записей, которые попадают в журнал.
+    """
+
+    def __init__(self, log, name, level):
+        """
+        Инициализация объекта Channel.
+
+        Аргументы:
+            log (Log): Журнал, в который пишутся записи.
+            name (str): Имя категории.
+            level (int): Минимальный уровень записей.
+        """
+        self.log = log
+        self.name = name
+        self.level = level
+
+    def write(self, level, message, *args):
+        """
+        Добавляет запись, если ее уровень не ниже уровня категории. Сообщение
+        форматируется (message % args) только при выводе, в фоновом потоке.
+        """
+        if level >= self.level:
+            self.log.record(level, self.name, message, args)
+
+    def debug(self, message, *args):
+        self.write(DEBUG, message, *args)
+
+    def info(self, message, *args):
+        self.write(INFO, message, *args)
+
+    def warning(self, message, *args):
+        self.write(WARNING, message, *args)
+
+    def error(self, message, *args):
+        self.write(ERROR, message, *args)
+
+
+class Log:
+    """
+    Класс Log — журнал с уровнями и категориями, который не пишет в поток вывода
+    из игрового цикла.
+
+    Записи складываются в кольцевой буфер в памяти; фоновый поток периодически
+    выводит новые записи пачкой в файл или stderr. Если поток не успевает и буфер
+    переполняется, самые старые записи теряются (их количество считается в dropped).
+    Последние записи буфера можно сохранить в файл при сбое или окончании игры.
+
+    Атрибуты:
+        level (int): Уровень по умолчанию для новых категорий.
+        channels (dict): Категории по имени.
+        records (list): Кольцевой буфер записей (время, уровень, категория, сообщение, аргументы).
+        written (int): Количество записей, добавленных с начала работы.
+        flushed (int): Количество записей, обработанных фоновым потоком.
+        dropped (int): Количество записей, потерянных при переполнении буфера.
+        stream (file): Поток вывода фонового потока (None, если вывод не запущен).
+    """
+
+    def __init__(self, capacity=LOG_BUFFER_SIZE, level=LOG_LEVEL):
+        """
+        Инициализация объекта Log.
+
+        Аргументы:
+            capacity (int): Размер кольцевого буфера (записи).
+            level (str | int): Уровень по умолчанию.
+        """
+        self.level = parse_level(level)
+        self.channels = {}
+        self.records = [None] * capacity
+        self.written = 0
+        self.flushed = 0
+        self.dropped = 0
+        self.stream = None
+        self.owns_stream = False
+        self.thread = None
+        self.wakeup = threading.Event()
+        self.stopping = False
+        self.lock = threading.Lock()  # Выводящий поток и dump не пишут в файлы одновременно
+
+    def channel(self, name):
+        """
+        Возвращает категорию журнала, создавая ее при первом обращении.
+
+        Аргументы:
+            name (str): Имя категории.
+
+        Возвращает:
+            Channel: Категория.
+        """
+        channel = self.channels.get(name)
+        if channel is None:
+            level = parse_level(LOG_CATEGORY_LEVELS.get(name, self.level))
+            channel = self.channels[name] = Channel(self, name, level)
+        return channel
+
+    def set_level(self, level, category=None):
+        """
+        Устанавливает уровень одной категории или всех категорий сразу.
+
+        Аргументы:
+            level (str | int): Новый уровень.
+            category (str): Имя категории; None — уровень по умолчанию и все категории.
+        """
+        level = parse_level(level)
+        if category is not None:
+            self.channel(category).level = level
+            return
+        self.level = level
+        for channel in self.channels.values():
+            channel.level = level
+
+    def record(self, level, category, message, args=()):
+        """
+        Добавляет запись в кольцевой буфер. Записи добавляются только из игрового потока.
+
+        Аргументы:
+            level (int): Уровень записи.
+            category (str): Имя категории.
+            message (str): Шаблон сообщения.
+            args (tuple): Аргументы шаблона.
+        """
+        self.records[self.written % len(self.records)] = (time.time(), level, category, message, args)
+        self.written += 1
+
+    def recent(self, since=0, concurrent=False):
+        """
+        Возвращает записи буфера с порядковым номером не меньше since.
+
+        Аргументы:
+            since (int): Порядковый номер первой нужной записи.
+            concurrent (bool): Буфер читается из фонового потока, пока игровой поток добавляет записи.
+
+        Возвращает:
+            tuple: Номер первой возвращенной записи и список записей.
+        """
+        capacity = len(self.records)
+        end = self.written
+        start = max(since, end - capacity)
+        batch = [self.records[index % capacity] for index in range(start, end)]
+
+        # Игровой поток мог перезаписать часть слотов, пока они копировались. record сначала
+        # записывает слот и только потом увеличивает written, поэтому при чтении из другого потока
+        # слот номер written - capacity может уже перезаписываться, хотя written еще не изменился:
+        # он тоже считается потерянным
+        overwritten = self.written - capacity - start + (1 if concurrent else 0)
+        if overwritten > 0:
+            batch = batch[overwritten:]
+            start += overwritten
+        return start, batch
+
+    @staticmethod
+    def format(record):
+        """
+        Форматирует запись в строку.
+
+        Аргументы:
+            record (tuple): Запись буфера.
+
+        Возвращает:
+            str: Строка вида "12:00:00.123 INFO collision: сообщение".
+        """
+        created, level, category, message, args = record
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                message = f"{message} {args!r}"
+        stamp = time.strftime("%H:%M:%S", time.localtime(created))
+        return f"{stamp}.{int(created * 1000) % 1000:03d} {LEVEL_NAMES.get(level, level)} {category}: {message}"
+
+    def configure(self, args):
+        """
+        Применяет параметры командной строки, добавленные add_log_arguments,
+        и запускает вывод журнала.
+
+        Аргументы:
+            args (argparse.Namespace): Разобранные аргументы.
+        """
+        if args.log_level:
+            self.set_level(args.log_level)
+        for item in args.log_category or ():
+            category, _, level = item.partition("=")
+            self.set_level(level or DEBUG, category)
+        self.start(args.log_file)
+
+    def start(self, path=None):
+        """
+        Запускает фоновый поток, который выводит новые записи в файл или stderr.
+
+        Аргументы:
+            path (str): Путь к файлу журнала; None — stderr.
+        """
+        self.stop()
+        if path:
+            self.stream = open(path, "a", encoding="utf-8")
+            self.owns_stream = True
+        else:
+            self.stream = sys.stderr
+            self.owns_stream = False
+        self.flushed = self.written
+        self.stopping = False
+        self.wakeup.clear()
+        self.thread = threading.Thread(target=self.run, name="log-writer", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        """Цикл фонового потока: выводит записи пачками раз в LOG_FLUSH_INTERVAL секунд."""
+        while not self.stopping:
+            self.wakeup.wait(LOG_FLUSH_INTERVAL)
+            self.flush()
+
+    def flush(self):
+        """Выводит записи, добавленные после предыдущего вывода."""
+        if self.stream is None:
+            return
+        with self.lock:
+            # Из фонового потока буфер читается одновременно с добавлением записей
+            start, batch = self.recent(self.flushed, concurrent=threading.current_thread() is self.thread)
+            self.dropped += start - self.flushed
+            self.flushed = start + len(batch)
+            if batch:
+                self.stream.write("\n".join(self.format(record) for record in batch) + "\n")
+                self.stream.flush()
+
+    def stop(self):
+        """Останавливает фоновый поток, выведя оставшиеся записи."""
+        if self.thread is None:
+            return
+        self.stopping = True
+        self.wakeup.set()
+        self.thread.join()
+        self.thread = None
+        self.flush()
+        if self.owns_stream:
+            self.stream.close()
+        self.stream = None
+
+    def dump(self, path):
+        """
+        Сохраняет все записи кольцевого буфера в файл (например, при сбое или окончании игры).
+
+        Аргументы:
+            path (str): Путь к файлу.
+        """
+        with self.lock:
+            start, batch = self.recent()
+            with open(path, "w", encoding="utf-8") as file:
+                if start:
+                    file.write(f"... {start} earlier record(s) not kept\n")
+                for record in batch:
+                    file.write(self.format(record) + "\n")
+
+
+# Общий журнал игры
+log = Log()
@@ -0,0 +1,197 @@
+import gc
+import json
+import time
+import tracemalloc
+from collections import deque
+
+from src.config import *
+
+
+class MemoryMonitor:
+    """
+    Класс MemoryMonitor следит за ростом памяти во время игры: периодически записывает
+    счетчики живых изображений Tk, элементов холста и объектов игры, число объектов
+    под наблюдением сборщика мусора и, если включен tracemalloc, объем выделенной памяти
+    и места с наибольшими выделениями.
+
+    Счетчики собирает Game (как счетчики кадра для FrameProfiler), монитор добавляет
+    к ним показатели интерпретатора. Первые warmup замеров пропускаются: в начале игры
+    заполняются кэши и пулы. Следующий замер становится базовым, и рост каждого счетчика
+    из limits сравнивается с допустимым. В строгом режиме (проверка длительной игрой)
+    превышение считается ошибкой; иначе оно только попадает в отчет.
+
+    Замеры хранятся в памяти (до MEMORY_HISTORY штук, около 0,7 КБ каждый), и traced_kb
+    учитывает их тоже.
+
+    Атрибуты:
+        interval (int): Период замеров (кадры).
+        top (int): Количество мест с наибольшими выделениями в отчете.
+        warmup (int): Количество замеров до базового.
+        limits (dict): Допустимый рост счетчиков относительно базового замера.
+        strict (bool): Считать превышение ошибкой (режим проверки длительной игрой).
+        samples (collections.deque): Последние замеры (словари счетчиков).
+        baseline (dict): Базовый замер (None, пока идет прогрев).
+        peaks (dict): Наибольшие значения счетчиков за игру.
+        violations (list): Описания превышений в порядке обнаружения.
+        exceeded (set): Имена счетчиков, превысивших допустимый рост.
+        top_allocations (list): Места с наибольшими выделениями по последнему замеру.
+        recorded (int): Количество сделанных замеров.
+    """
+
+    def __init__(self, interval=MEMORY_SAMPLE_INTERVAL, top=MEMORY_TOP_ALLOCATIONS, warmup=MEMORY_WARMUP_SAMPLES,
+                 limits=MEMORY_SOAK_LIMITS, strict=False):
+        """
+        Инициализация объекта MemoryMonitor.
+
+        Аргументы:
+            interval (int): Период замеров (кадры).
+            top (int): Количество мест с наибольшими выделениями в отчете.
+            warmup (int): Количество замеров до базового.
+            limits (dict): Допустимый рост счетчиков относительно базового замера.
+            strict (bool): Считать превышение ошибкой.
+        """
+        self.interval = interval
+        self.top = top
+        self.warmup = warmup
+        self.limits = dict(limits)
+        self.strict = strict
+        self.samples = deque(maxlen=MEMORY_HISTORY)
+        self.baseline = None
+        self.peaks = {}
+        self.violations = []
+        self.exceeded = set()
+        self.top_allocations = []
+        self.recorded = 0
+
+    @staticmethod
+    def start_tracing(frames=1):
+        """
+        Включает tracemalloc (заметно замедляет игру, поэтому по умолчанию выключен).
+
+        Аргументы:
+            frames (int): Глубина стека, сохраняемого для каждого выделения.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    def due(self, frame):
+        """Проверяет, нужен ли замер в кадре с номером frame."""
+        return frame % self.interval == 0
+
+    def record(self, frame, counters):
+        """
+        Делает замер: дополняет счетчики игры показателями интерпретатора и проверяет рост.
+
+        Аргументы:
+            frame (int): Номер кадра.
+            counters (dict): Счетчики игры (tk_images, canvas_items, asteroids и т. п.).
+
+        Возвращает:
+            list: Новые превышения (пустой список, если рост в пределах).
+        """
+        sample = {"frame": frame, "time": round(time.time(), 3)}
+        sample.update(counters)
+        sample["python_objects"] = len(gc.get_objects())
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            sample["traced_kb"] = current // 1024
+            sample["traced_peak_kb"] = peak // 1024
+            self.top_allocations = self.allocations()
+        self.samples.append(sample)
+        self.recorded += 1
+        for name, value in sample.items():
+            if name not in ("frame", "time") and value > self.peaks.get(name, value - 1):
+                self.peaks[name] = value
+
+        if self.baseline is None:
+            if self.recorded > self.warmup:
+                self.baseline = sample
+            return []
+        found = []
+        for name, limit in self.limits.items():
+            if name in self.exceeded or name not in sample or name not in self.baseline:
+                continue
+            growth = sample[name] - self.baseline[name]
+            if growth > limit:
+                # Каждый счетчик попадает в список превышений один раз
+                self.exceeded.add(name)
+                found.append(f"{name} grew by {growth} (from {self.baseline[name]} to {sample[name]}, "
+                             f"limit {limit}) at frame {frame}")
+        self.violations.extend(found)
+        return found
+
+    def allocations(self):
+        """
+        Возвращает места с наибольшим объемом живых выделений памяти (нужен tracemalloc).
+
+        Возвращает:
+            list: Словари с местом в коде ("файл:строка"), объемом (КБ) и числом блоков.
+        """
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),  # Замеры самого монитора
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ))
+        return [
+            {"where": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+             "kb": round(stat.size / 1024, 1), "blocks": stat.count}
+            for stat in snapshot.statistics("lineno")[:self.top]
+        ]
+
+    @property
+    def failed(self):
+        """Флаг, указывающий, что в строгом режиме обнаружено превышение."""
+        return self.strict and bool(self.violations)
+
+    def growth(self):
+        """Возвращает рост счетчиков последнего замера относительно базового (пустой словарь до него)."""
+        if self.baseline is None or not self.samples:
+            return {}
+        last = self.samples[-1]
+        return {name: last[name] - value for name, value in self.baseline.items()
+                if name not in ("frame", "time") and name in last}
+
+    def report(self):
+        """
+        Формирует текстовый отчет для оверлея.
+
+        Возвращает:
+            str: Последние значения счетчиков, их рост и места с наибольшими выделениями.
+        """
+        if not self.samples:
+            return "memory: no samples yet"
+        last = self.samples[-1]
+        growth = self.growth()
+        lines = [f"memory at frame {last['frame']}" + ("" if self.baseline else " (warming up)")]
+        for name, value in last.items():
+            if name in ("frame", "time"):
+                continue
+            change = f" ({growth[name]:+})" if name in growth else ""
+            lines.append(f"{name}: {value}{change}")
+        for allocation in self.top_allocations[:5]:
+            lines.append(f"{allocation['kb']:8.1f} KB  {allocation['where'][-40:]}")
+        for violation in self.violations:
+            lines.append(f"GROWTH: {violation}")
+        return "\n".join(lines)
+
+    def dump(self, path):
+        """
+        Сохраняет замеры, базовый замер, превышения и места наибольших выделений в JSON.
+
+        Аргументы:
+            path (str): Путь к файлу.
+        """
+        data = {
+            "interval": self.interval,
+            "strict": self.strict,
+            "limits": self.limits,
+            "baseline": self.baseline,
+            "peaks": self.peaks,
+            "growth": self.growth(),
+            "violations": self.violations,
+            "top_allocations": self.top_allocations,
+            "samples": list(self.samples),
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2)
@@ -0,0 +1,229 @@
+import math
+import struct
+import zlib
+
+from src.Log import INFO, log
+from src.Ship import Ship
+from src.Simulation import Simulation, INPUT_SHOOT, apply_ship_inputs, ship_path
+from src.config import *
+
+collision_log = log.channel("collision")
+
+
+class Player:
+    """
+    Класс Player — участник игры по сети: свой корабль, жизни, счет и интервал между выстрелами.
+
+    Атрибуты:
+        number (int): Номер игрока (1..NET_MAX_PLAYERS).
+        spawn_x (float): Координата x точки возрождения.
+        spawn_y (float): Координата y точки возрождения.
+        ship (Ship): Корабль игрока (None, если жизни кончились).
+        lives (int): Текущее количество жизней.
+        score (int): Текущий счет.
+        last_shot_tick (int): Тик последнего выстрела (None, если выстрелов не было).
+    """
+
+    def __init__(self, number, spawn_x, spawn_y, thrust=SHIP_THRUST):
+        """
+        Инициализация объекта Player.
+
+        Аргументы:
+            number (int): Номер игрока.
+            spawn_x (float): Координата x точки возрождения.
+            spawn_y (float): Координата y точки возрождения.
+            thrust (float): Ускорение корабля при включенной тяге.
+        """
+        self.number = number
+        self.spawn_x = spawn_x
+        self.spawn_y = spawn_y
+        self.ship = Ship(spawn_x, spawn_y)
+        self.ship.thrust = thrust
+        self.lives = LIVES
+        self.score = INITIAL_SCORE
+        self.last_shot_tick = None
+
+    def respawn(self):
+        """Возвращает корабль в точку возрождения с обнулением скорости."""
+        self.ship.respawn()
+        self.ship.x = self.spawn_x
+        self.ship.y = self.spawn_y
+
+
+class MultiplayerSimulation(Simulation):
+    """
+    Класс MultiplayerSimulation — правила игры для нескольких кораблей в одном поле астероидов.
+
+    Астероиды, ракеты, столкновения и появление астероидов те же, что в Simulation, но у каждого
+    игрока свой корабль, свои жизни и свой счет; попадание ракеты приносит очко ее владельцу.
+    Игрок без жизней остается зрителем, а когда жизни кончились у всех, игра завершается
+    так же, как одиночная. Игроки могут присоединяться и уходить во время игры.
+
+    Атрибуты simulation.ship, lives и score сохраняют смысл для кода одиночной игры:
+    ship — корабль первого игрока с кораблем, lives и score — суммы по игрокам.
+    Хранилища NumPy не поддерживаются: объекты хранятся в списках.
+
+    Атрибуты:
+        players (dict): Игроки по номеру.
+        max_players (int): Максимальное количество игроков.
+    """
+
+    def __init__(self, seed=None, max_players=NET_MAX_PLAYERS, rocket_capacity=ROCKET_CAPACITY, dt=1,
+                 swept=COLLISION_SWEPT):
+        """
+        Инициализация объекта MultiplayerSimulation.
+
+        Аргументы:
+            seed (int): Начальное значение генератора случайных чисел.
+            max_players (int): Максимальное количество игроков.
+            rocket_capacity (int): Максимальное количество ракет в полете у одного игрока.
+            dt (int): Количество тиков за один шаг.
+            swept (bool): Проверять столкновения по пути объектов за шаг.
+        """
+        super().__init__(seed=seed, use_store=False, rocket_capacity=rocket_capacity * max_players, dt=dt,
+                         swept=swept)
+        self.players = {}
+        self.max_players = max_players
+
+    def spawn_point(self, number):
+        """Возвращает точку возрождения игрока: игроки расставлены по кругу вокруг центра экрана."""
+        angle = 2 * math.pi * (number - 1) / self.max_players
+        radius = min(SCREEN_WIDTH, SCREEN_HEIGHT) / 4
+        return SCREEN_WIDTH / 2 + radius * math.cos(angle), SCREEN_HEIGHT / 2 + radius * math.sin(angle)
+
+    def add_player(self, number=None):
+        """
+        Добавляет игрока.
+
+        Аргументы:
+            number (int): Номер игрока (по умолчанию наименьший свободный).
+
+        Возвращает:
+            Player: Новый игрок или None, если мест нет или номер занят.
+        """
+        if number is None:
+            free = [number for number in range(1, self.max_players + 1) if number not in self.players]
+            if not free:
+                return None
+            number = free[0]
+        elif number in self.players or not 1 <= number <= self.max_players:
+            return None
+        player = self.players[number] = Player(number, *self.spawn_point(number), thrust=self.ship_thrust)
+        self.update_totals()
+        return player
+
+    def remove_player(self, number):
+        """
+        Убирает игрока из игры; его ракеты долетают.
+
+        Аргументы:
+            number (int): Номер игрока.
+        """
+        self.players.pop(number, None)
+        self.update_totals()
+
+    def start(self):
+        """Начинает игру: создает астероиды (корабли создаются при добавлении игроков)."""
+        if self.running:
+            return
+        self.running = True
+        self.game_over_in_progress = False
+        self.finished = False
+        self.hits = 0
+        self.update_totals()
+        self.spawn_asteroids()
+
+    def update_totals(self):
+        """Обновляет общие атрибуты ship, lives и score по игрокам."""
+        ships = [player.ship for player in self.players.values() if player.ship is not None]
+        self.ship = ships[0] if ships else None
+        self.lives = sum(player.lives for player in self.players.values())
+        self.score = sum(player.score for player in self.players.values())
+
+    def without_shots(self, inputs):
+        if not inputs:
+            return inputs
+        return {number: bits & ~INPUT_SHOOT for number, bits in inputs.items()}
+
+    def ship_paths(self, inputs, ticks):
+        return [ship_path(player.ship, inputs.get(number, 0) if inputs else 0, ticks)
+                for number, player in self.players.items() if player.ship is not None]
+
+    def update_ships(self, inputs):
+        """
+        Применяет биты управления игроков к их кораблям.
+
+        Аргументы:
+            inputs (dict): Битовые маски управления по номеру игрока (игроки без записи не управляют).
+        """
+        for number, player in self.players.items():
+            if player.ship is None:
+                continue
+            bits = inputs.get(number, 0) if inputs else 0
+            if bits & INPUT_SHOOT:
+                self.shoot_player_rocket(player)
+            apply_ship_inputs(player.ship, bits, self.dt)
+
+    def shoot_player_rocket(self, player):
+        """
+        Выстреливает ракету из корабля игрока с учетом его интервала между выстрелами.
+
+        Аргументы:
+            player (Player): Стреляющий игрок.
+
+        Возвращает:
+            Rocket: Выпущенная ракета или None, если выстрел не состоялся.
+        """
+        if player.last_shot_tick is not None and self.tick - player.last_shot_tick < self.fire_cooldown:
+            return None
+        rocket = player.ship.shoot(self.rocket_pool)
+        if rocket is None:
+            return None
+        self.rockets.append(rocket)
+        rocket.id = self.new_id()
+        rocket.lifetime = self.rocket_lifetime
+        rocket.owner = player.number
+        player.last_shot_tick = self.tick
+        return rocket
+
+    def award_hit(self, rocket):
+        player = self.players.get(rocket.owner)
+        if player is not None:
+            player.score += 1
+        self.update_totals()
+
+    def check_ship_collisions(self, grid):
+        for player in self.players.values():
+            start = 0
+            swept = self.swept
+            while player.ship:
+                ship = player.ship
+                index = self.find_ship_hit_swept(grid, ship) if swept else self.find_ship_hit(grid, start, ship)
+                if index is None:
+                    break
+                asteroid = self.asteroids[index]
+                if collision_log.level <= INFO:
+                    collision_log.info("Collision detected: Ship %s collided with Asteroid %s",
+                                       player.number, asteroid.id)
+                asteroid.start_explosion(mark_as_killer=True)
+                player.lives -= 1
+                if player.lives <= 0:
+                    player.ship = None  # Игрок без жизней остается зрителем
+                else:
+                    player.respawn()
+                start = index + 1
+                swept = False
+        self.update_totals()
+        if self.players and self.ship is None:
+            self.game_over()
+
+    def checksum(self):
+        crc = super().checksum()
+        for number in sorted(self.players):
+            player = self.players[number]
+            crc = zlib.crc32(struct.pack("<qqq", number, player.lives, player.score), crc)
+            ship = player.ship
+            if ship is not None:
+                crc = zlib.crc32(struct.pack("<5d", ship.x, ship.y, ship.angle, ship.velocity_x, ship.velocity_y),
+                                 crc)
+        return crc
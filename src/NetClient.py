@@ -0,0 +1,404 @@
+import asyncio
+import math
+import random
+import time
+from collections import OrderedDict, deque
+
+from src.NetProtocol import *
+from src.Ship import Ship
+from src.Simulation import apply_ship_inputs
+from src.SpatialHash import wrap_delta, wrapped_distance_sq
+from src.config import *
+
+
+class RemoteObject:
+    """
+    Класс RemoteObject — объект поля на клиенте сетевой игры с теми атрибутами
+    объектов симуляции, которые нужны для отрисовки.
+
+    Атрибуты:
+        id (int): Идентификатор объекта на сервере (номер игрока для кораблей).
+        x (float): Координата x.
+        y (float): Координата y.
+        angle (float): Угол (градусы).
+        radius (int): Радиус астероида (0 для ракет и кораблей).
+        exploding (bool): Флаг, указывающий, что астероид взрывается.
+        explosion_timer (int): Таймер взрыва астероида (тики).
+        owner (int): Номер игрока, выпустившего ракету.
+        thrusting (bool): Флаг, указывающий, что двигатель корабля включен.
+    """
+
+    def __init__(self, id, x, y, angle, radius=0, exploding=False, explosion_timer=0, owner=None, thrusting=False):
+        """
+        Инициализация объекта RemoteObject.
+
+        Аргументы:
+            id (int): Идентификатор объекта.
+            x (float): Координата x.
+            y (float): Координата y.
+            angle (float): Угол (градусы).
+            radius (int): Радиус астероида.
+            exploding (bool): Астероид взрывается.
+            explosion_timer (int): Таймер взрыва.
+            owner (int): Номер игрока-владельца ракеты.
+            thrusting (bool): Двигатель корабля включен.
+        """
+        self.id = id
+        self.x = x
+        self.y = y
+        self.angle = angle
+        self.radius = radius
+        self.exploding = exploding
+        self.explosion_timer = explosion_timer
+        self.owner = owner
+        self.thrusting = thrusting
+
+
+def remote_entity(entity, kind, x, y, angle, flags):
+    """
+    Создает RemoteObject по квантованному состоянию объекта (см. NetProtocol.world_state).
+
+    Аргументы:
+        entity (int): Идентификатор объекта.
+        kind (int): Вид объекта (KIND_ASTEROID или KIND_ROCKET).
+        x (float): Координата x в долях пикселя.
+        y (float): Координата y в долях пикселя.
+        angle (float): Угол в шагах ANGLE_STEPS.
+        flags (int): Состояние объекта.
+    """
+    x /= NET_POSITION_SCALE
+    y /= NET_POSITION_SCALE
+    angle = angle * 360 / ANGLE_STEPS
+    if kind == KIND_ASTEROID:
+        return RemoteObject(entity, x, y, angle, radius=flags & 63, exploding=bool(flags >> 6 & 1),
+                            explosion_timer=flags >> 7)
+    return RemoteObject(entity, x, y, angle, owner=flags)
+
+
+def lerp_wrapped(old, new, alpha, period):
+    """Интерполирует величину с периодом period (координату или угол) по кратчайшему пути."""
+    return (old + wrap_delta(new - old, period) * alpha) % period
+
+
+class GameClient(asyncio.DatagramProtocol):
+    """
+    Класс GameClient — клиент сетевой игры: отправляет серверу команды управления
+    и принимает снимки состояния.
+
+    Каждый тик клиент отправляет команду с очередным номером вместе с несколькими
+    предыдущими (на случай потерь) и номером последнего полученного снимка, относительно
+    которого сервер сжимает следующие. Свой корабль клиент предсказывает сразу, применяя
+    команду локально; со снимком приходит состояние корабля после последней примененной
+    сервером команды, и клиент заново применяет к нему еще не подтвержденные команды.
+    Чужие объекты отрисовываются с отставанием interpolation_delay тиков, с интерполяцией
+    между двумя снимками.
+
+    Атрибуты:
+        policy (callable): Функция policy(client), возвращающая биты управления (None — без управления).
+        interpolation_delay (float): Отставание отрисовки чужих объектов (тики).
+        player (int): Номер игрока (None до приветствия сервера).
+        history (collections.OrderedDict): Состояния объектов полученных снимков по тику (базовые для сжатия).
+        snapshots (collections.deque): Последние снимки для интерполяции.
+        latest (NetProtocol.Snapshot): Последний снимок.
+        received_at (float): Время получения последнего снимка (time.monotonic).
+        sequence (int): Номер последней отправленной команды.
+        pending (collections.deque): Неподтвержденные команды: [номер, биты, время отправки,
+                                     предсказанные x и y корабля].
+        ship (Ship): Предсказанный корабль игрока (None, если корабля нет).
+        finished (bool): Флаг, указывающий, что сервер завершил работу.
+        bytes_sent (int): Отправлено байт.
+        bytes_received (int): Получено байт.
+        snapshots_received (int): Принято снимков.
+        undecodable (int): Снимков, отброшенных из-за отсутствия базового.
+        latencies (collections.deque): Время от отправки команды до снимка, в котором она применена (секунды).
+        prediction_errors (collections.deque): Расхождения предсказанного корабля с сервером (пиксели).
+    """
+
+    def __init__(self, policy=None, interpolation_delay=NET_INTERPOLATION_DELAY):
+        """
+        Инициализация объекта GameClient.
+
+        Аргументы:
+            policy (callable): Функция policy(client), возвращающая биты управления.
+            interpolation_delay (float): Отставание отрисовки чужих объектов (тики).
+        """
+        self.policy = policy
+        self.interpolation_delay = interpolation_delay
+        self.transport = None
+        self.welcomed = None
+        self.player = None
+        self.history = OrderedDict()
+        self.snapshots = deque(maxlen=16)
+        self.latest = None
+        self.received_at = None
+        self.sequence = 0
+        self.pending = deque()
+        self.ship = None
+        self.finished = False
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.snapshots_received = 0
+        self.undecodable = 0
+        self.latencies = deque(maxlen=PROFILER_WINDOW)
+        self.prediction_errors = deque(maxlen=PROFILER_WINDOW)
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.welcomed = asyncio.get_running_loop().create_future()
+        self.send(HELLO.pack(MSG_HELLO, PROTOCOL_VERSION))
+
+    def send(self, data):
+        """Отправляет пакет серверу."""
+        self.transport.sendto(data)
+        self.bytes_sent += len(data)
+
+    def datagram_received(self, data, address):
+        if not data:
+            return
+        self.bytes_received += len(data)
+        kind = data[0]
+        if kind == MSG_SNAPSHOT:
+            self.receive_snapshot(data)
+        elif kind == MSG_WELCOME:
+            self.player = WELCOME.unpack_from(data)[2]
+            if not self.welcomed.done():
+                self.welcomed.set_result(self.player)
+        elif kind == MSG_FULL:
+            if not self.welcomed.done():
+                self.welcomed.set_exception(ConnectionRefusedError("server is full"))
+        elif kind == MSG_BYE:
+            self.finished = True
+
+    def receive_snapshot(self, data):
+        """Разбирает снимок относительно базового, сохраняет его и сверяет предсказанный корабль."""
+        tick, base_tick, _, _ = read_snapshot_header(data)
+        if self.latest is not None and tick <= self.latest.tick:
+            return  # Опоздавший или повторный пакет
+        base = self.history.get(base_tick) if base_tick else None
+        if base_tick and base is None:
+            self.undecodable += 1
+            return
+        snapshot = decode_snapshot(data, base)
+        self.history[tick] = snapshot.entities
+        while len(self.history) > NET_HISTORY:
+            self.history.popitem(last=False)
+        self.snapshots.append(snapshot)
+        self.latest = snapshot
+        self.received_at = time.monotonic()
+        self.snapshots_received += 1
+        self.reconcile(snapshot, self.received_at)
+
+    def reconcile(self, snapshot, now):
+        """
+        Принимает состояние своего корабля из снимка и заново применяет к нему неподтвержденные команды.
+
+        Аргументы:
+            snapshot (NetProtocol.Snapshot): Новый снимок.
+            now (float): Время получения снимка (time.monotonic).
+        """
+        predicted = None
+        pending = self.pending
+        while pending and pending[0][0] <= snapshot.input_ack:
+            sequence, bits, sent, x, y = pending.popleft()
+            self.latencies.append(now - sent)
+            if sequence == snapshot.input_ack:
+                predicted = (x, y)
+
+        state = snapshot.players.get(self.player)
+        if state is None or not state[1] & PLAYER_SHIP:
+            self.ship = None
+            return
+        lives, flags, score, x, y, angle, velocity_x, velocity_y = state
+        if predicted is not None and predicted[0] is not None:
+            self.prediction_errors.append(math.sqrt(wrapped_distance_sq(predicted[0], predicted[1], x, y)))
+
+        ship = self.ship or Ship(x, y)
+        ship.x, ship.y, ship.angle = x, y, angle
+        ship.velocity_x, ship.velocity_y = velocity_x, velocity_y
+        ship.thrusting = bool(flags & PLAYER_THRUSTING)
+        for command in pending:
+            apply_ship_inputs(ship, command[1])
+            command[3], command[4] = ship.x, ship.y
+        self.ship = ship
+
+    def send_input(self, bits):
+        """
+        Применяет команду к предсказанному кораблю и отправляет ее серверу вместе с предыдущими.
+
+        Аргументы:
+            bits (int): Биты управления.
+        """
+        self.sequence += 1
+        x = y = None
+        if self.ship is not None:
+            apply_ship_inputs(self.ship, bits)
+            x, y = self.ship.x, self.ship.y
+        self.pending.append([self.sequence, bits, time.monotonic(), x, y])
+        while len(self.pending) > NET_HISTORY:
+            self.pending.popleft()  # Сервер давно не отвечает
+        commands = [(command[0], command[1]) for command in list(self.pending)[-NET_INPUT_REDUNDANCY:]]
+        self.send(encode_input(self.latest.tick if self.latest else 0, commands))
+
+    def render_tick(self, now=None):
+        """
+        Возвращает тик, который отрисовывается сейчас: последний снимок минус отставание
+        плюс время, прошедшее с его получения (не дальше последнего снимка).
+
+        Аргументы:
+            now (float): Текущее время (time.monotonic).
+        """
+        if self.latest is None:
+            return None
+        if now is None:
+            now = time.monotonic()
+        elapsed = (now - self.received_at) * TICK_RATE
+        return min(self.latest.tick, self.latest.tick - self.interpolation_delay + elapsed)
+
+    def view(self, now=None):
+        """
+        Собирает объекты для отрисовки: астероиды и ракеты, интерполированные между снимками,
+        чужие корабли (тоже с отставанием) и предсказанный свой корабль.
+
+        Аргументы:
+            now (float): Текущее время (time.monotonic).
+
+        Возвращает:
+            tuple: Списки RemoteObject астероидов, ракет и кораблей.
+        """
+        tick = self.render_tick(now)
+        if tick is None:
+            return [], [], []
+        older = newer = self.snapshots[-1]
+        for snapshot in reversed(self.snapshots):
+            if snapshot.tick <= tick:
+                older = snapshot
+                break
+            newer = older = snapshot
+        alpha = (tick - older.tick) / (newer.tick - older.tick) if newer.tick > older.tick else 0.0
+
+        width = SCREEN_WIDTH * NET_POSITION_SCALE
+        height = SCREEN_HEIGHT * NET_POSITION_SCALE
+        asteroids = []
+        rockets = []
+        previous = older.entities
+        for entity, (kind, x, y, angle, flags) in newer.entities.items():
+            old = previous.get(entity)
+            if old is not None and alpha:
+                x = lerp_wrapped(old[1], x, alpha, width)
+                y = lerp_wrapped(old[2], y, alpha, height)
+                angle = lerp_wrapped(old[3], angle, alpha, ANGLE_STEPS)
+            obj = remote_entity(entity, kind, x, y, angle, flags)
+            (asteroids if kind == KIND_ASTEROID else rockets).append(obj)
+
+        ships = []
+        for number, state in newer.players.items():
+            if number == self.player:
+                continue
+            lives, flags, score, x, y, angle, velocity_x, velocity_y = state
+            if not flags & PLAYER_SHIP:
+                continue
+            old = older.players.get(number)
+            if old is not None and old[1] & PLAYER_SHIP and alpha:
+                x = lerp_wrapped(old[3], x, alpha, SCREEN_WIDTH)
+                y = lerp_wrapped(old[4], y, alpha, SCREEN_HEIGHT)
+                angle = lerp_wrapped(old[5], angle, alpha, 360)
+            ships.append(RemoteObject(number, x, y, angle, thrusting=bool(flags & PLAYER_THRUSTING)))
+        if self.ship is not None:
+            ship = self.ship
+            ships.append(RemoteObject(self.player, ship.x, ship.y, ship.angle, thrusting=ship.thrusting))
+        return asteroids, rockets, ships
+
+    async def run(self, duration=None):
+        """
+        Отправляет команды управления с частотой TICK_RATE.
+
+        Аргументы:
+            duration (float): Длительность работы (секунды; None — пока сервер не завершит работу).
+        """
+        loop = asyncio.get_running_loop()
+        interval = 1 / TICK_RATE
+        next_tick = loop.time()
+        stop = None if duration is None else next_tick + duration
+        while not self.finished and (stop is None or next_tick < stop):
+            self.send_input(self.policy(self) if self.policy else 0)
+            next_tick += interval
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+    def close(self):
+        """Сообщает серверу об отключении и закрывает сокет."""
+        if not self.finished:
+            self.send(bytes([MSG_BYE]))
+        self.transport.close()
+
+
+async def connect(host=NET_HOST, port=NET_PORT, timeout=2.0, **options):
+    """
+    Подключается к серверу. Приветствие повторяется, пока сервер не ответит (UDP может терять пакеты).
+
+    Аргументы:
+        host (str): Адрес сервера.
+        port (int): Порт сервера.
+        timeout (float): Время ожидания ответа (секунды).
+        **options: Аргументы GameClient.
+
+    Возвращает:
+        GameClient: Подключенный клиент.
+    """
+    loop = asyncio.get_running_loop()
+    _, client = await loop.create_datagram_endpoint(lambda: GameClient(**options), remote_addr=(host, port))
+    deadline = loop.time() + timeout
+    while True:
+        try:
+            await asyncio.wait_for(asyncio.shield(client.welcomed), 0.25)
+            return client
+        except asyncio.TimeoutError:
+            if loop.time() >= deadline:
+                client.transport.close()
+                raise
+            client.send(HELLO.pack(MSG_HELLO, PROTOCOL_VERSION))
+
+
+def random_client_policy(rng):
+    """
+    Создает политику, которая держит случайные биты управления несколько тиков подряд.
+
+    Аргументы:
+        rng (random.Random): Генератор случайных чисел политики.
+
+    Возвращает:
+        callable: Функция policy(client).
+    """
+    state = {"bits": 0, "left": 0}
+
+    def policy(client):
+        if state["left"] <= 0:
+            state["bits"] = rng.getrandbits(4)
+            state["left"] = rng.randint(5, 30)
+        state["left"] -= 1
+        return state["bits"]
+    return policy
+
+
+async def play(host, port, duration, seed):
+    """Подключается к серверу и играет случайными нажатиями duration секунд."""
+    client = await connect(host, port, policy=random_client_policy(random.Random(seed)))
+    started = time.monotonic()
+    try:
+        await client.run(duration)
+    finally:
+        client.close()
+    elapsed = time.monotonic() - started
+    print(f"Player {client.player}: {client.snapshots_received} snapshot(s), "
+          f"{client.bytes_received / elapsed / 1024:.1f} KB/s down, {client.bytes_sent / elapsed / 1024:.1f} KB/s up")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Клиент сетевой игры Asteroids без дисплея (случайное управление)")
+    parser.add_argument("--host", default=NET_HOST, help="Адрес сервера")
+    parser.add_argument("--port", type=int, default=NET_PORT, help="UDP-порт сервера")
+    parser.add_argument("--duration", type=float, default=10.0, help="Время игры (секунды)")
+    parser.add_argument("--seed", type=int, help="Начальное значение генератора управления")
+    args = parser.parse_args()
+    asyncio.run(play(args.host, args.port, args.duration, args.seed))
@@ -0,0 +1,371 @@
+"""
+Двоичный протокол сетевой игры поверх UDP.
+
+Каждый пакет начинается с байта типа сообщения:
+
+    HELLO     клиент -> сервер: версия протокола;
+    WELCOME   сервер -> клиент: версия, номер игрока, тик сервера;
+    FULL      сервер -> клиент: мест нет;
+    INPUT     клиент -> сервер: последний полученный снимок и несколько последних команд
+              управления (номер и биты), чтобы потеря пакета не теряла команду;
+    SNAPSHOT  сервер -> клиент: снимок состояния, сжатый относительно снимка, который
+              клиент подтвердил (base_tick; 0 — полный снимок);
+    BYE       в обе стороны: отключение.
+
+Снимок состоит из состояний игроков (всегда целиком: их немного) и объектов поля —
+астероидов и ракет. Объект передается квантованным: координаты в долях пикселя
+(NET_POSITION_SCALE), угол в 1/256 оборота. Для каждого объекта, изменившегося по сравнению
+с базовым снимком, передается разница номера с предыдущим объектом (varint), байт маски
+и только изменившиеся поля: небольшие сдвиги — одним байтом, остальное — целиком.
+Исчезнувшие объекты передаются списком номеров.
+"""
+import struct
+
+from src.config import *
+
+PROTOCOL_VERSION = 1
+
+# Типы сообщений
+MSG_HELLO = 1
+MSG_WELCOME = 2
+MSG_FULL = 3
+MSG_INPUT = 4
+MSG_SNAPSHOT = 5
+MSG_BYE = 6
+
+# Виды объектов поля
+KIND_ASTEROID = 0
+KIND_ROCKET = 1
+
+# Флаги состояния игрока
+PLAYER_SHIP = 1  # У игрока есть корабль
+PLAYER_THRUSTING = 2  # Двигатель корабля включен
+
+ANGLE_STEPS = 256  # Точность угла объектов поля (шагов на оборот)
+SHIP_ANGLE_SCALE = 100  # Точность угла корабля (доли градуса)
+VELOCITY_SCALE = 64  # Точность скорости корабля (доли пикселя за тик)
+
+# Коды полей в маске объекта (по два бита на координаты и угол)
+FIELD_SAME = 0  # Поле не изменилось
+FIELD_DELTA = 1  # Сдвиг одним байтом со знаком
+FIELD_FULL = 2  # Значение целиком (два байта)
+MASK_STATE = 0x40  # Изменилось состояние (varint)
+MASK_KIND = 0x80  # Изменился вид объекта (байт)
+
+HELLO = struct.Struct("<BB")  # Тип, версия
+WELCOME = struct.Struct("<BBBI")  # Тип, версия, номер игрока, тик
+INPUT_HEADER = struct.Struct("<BIB")  # Тип, подтвержденный снимок, количество команд
+INPUT_ENTRY = struct.Struct("<IB")  # Номер команды, биты управления
+SNAPSHOT_HEADER = struct.Struct("<BIIIB")  # Тип, тик, базовый тик, последняя примененная команда, игроки
+PLAYER = struct.Struct("<BBBIHHHhh")  # Номер, жизни, флаги, счет, x, y, угол, скорость x, скорость y
+INT8 = struct.Struct("<b")
+UINT16 = struct.Struct("<H")
+
+EMPTY_STATE = (KIND_ASTEROID, 0, 0, 0, 0)  # Базовое состояние для новых объектов
+
+
+class Snapshot:
+    """
+    Класс Snapshot — разобранный снимок состояния.
+
+    Атрибуты:
+        tick (int): Тик сервера.
+        base_tick (int): Тик снимка, относительно которого снимок сжат (0 — полный снимок).
+        input_ack (int): Номер последней команды клиента, примененной сервером.
+        players (dict): Состояния игроков по номеру: кортежи (жизни, флаги, счет, x, y, угол, скорость x, скорость y)
+                        в исходных единицах.
+        entities (dict): Квантованные состояния объектов по идентификатору: (вид, x, y, угол, состояние).
+    """
+
+    def __init__(self, tick, base_tick, input_ack, players, entities):
+        """
+        Инициализация объекта Snapshot.
+
+        Аргументы:
+            tick (int): Тик сервера.
+            base_tick (int): Тик базового снимка.
+            input_ack (int): Номер последней примененной команды клиента.
+            players (dict): Состояния игроков.
+            entities (dict): Состояния объектов.
+        """
+        self.tick = tick
+        self.base_tick = base_tick
+        self.input_ack = input_ack
+        self.players = players
+        self.entities = entities
+
+
+def write_varint(out, value):
+    """Дописывает неотрицательное целое в out (bytearray) по 7 бит на байт."""
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, offset):
+    """
+    Читает целое, записанное write_varint.
+
+    Возвращает:
+        tuple: Значение и смещение после него.
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def quantize_position(x, y):
+    """Квантует координаты точки до NET_POSITION_SCALE долей пикселя."""
+    return int(round(x * NET_POSITION_SCALE)), int(round(y * NET_POSITION_SCALE))
+
+
+def world_state(sim):
+    """
+    Снимает квантованное состояние астероидов и ракет симуляции.
+
+    Состояние астероида включает радиус, признак взрыва и таймер взрыва,
+    состояние ракеты — номер ее владельца.
+
+    Аргументы:
+        sim (Simulation): Симуляция.
+
+    Возвращает:
+        dict: Кортежи (вид, x, y, угол, состояние) по идентификатору объекта.
+    """
+    state = {}
+    for asteroid in sim.asteroids:
+        x, y = quantize_position(asteroid.x, asteroid.y)
+        flags = int(asteroid.radius) | asteroid.exploding << 6 | min(int(asteroid.explosion_timer), 255) << 7
+        state[asteroid.id] = (KIND_ASTEROID, x, y, int(round(asteroid.angle * ANGLE_STEPS / 360)) % ANGLE_STEPS,
+                              flags)
+    for rocket in sim.rockets:
+        x, y = quantize_position(rocket.x, rocket.y)
+        state[rocket.id] = (KIND_ROCKET, x, y, int(round(rocket.angle * ANGLE_STEPS / 360)) % ANGLE_STEPS,
+                            rocket.owner or 0)
+    return state
+
+
+def player_state(player):
+    """
+    Квантует состояние игрока сетевой игры (см. MultiplayerSimulation.Player).
+
+    Возвращает:
+        tuple: Поля записи PLAYER.
+    """
+    ship = player.ship
+    if ship is None:
+        return player.number, max(player.lives, 0), 0, player.score, 0, 0, 0, 0, 0
+    x, y = quantize_position(ship.x, ship.y)
+    flags = PLAYER_SHIP | (PLAYER_THRUSTING if ship.thrusting else 0)
+    velocity_x = max(-32768, min(32767, int(round(ship.velocity_x * VELOCITY_SCALE))))
+    velocity_y = max(-32768, min(32767, int(round(ship.velocity_y * VELOCITY_SCALE))))
+    return (player.number, player.lives, flags, player.score, x, y,
+            int(round(ship.angle * SHIP_ANGLE_SCALE)) % (360 * SHIP_ANGLE_SCALE), velocity_x, velocity_y)
+
+
+def encode_field(out, old, new, modulo=None):
+    """
+    Дописывает поле объекта и возвращает его код для маски.
+
+    Аргументы:
+        out (bytearray): Буфер пакета.
+        old (int): Значение в базовом снимке.
+        new (int): Новое значение.
+        modulo (int): Период значения (для угла); сдвиг берется кратчайший.
+    """
+    if old == new:
+        return FIELD_SAME
+    delta = new - old
+    if modulo is not None:
+        delta = (delta + modulo // 2) % modulo - modulo // 2
+    if -128 <= delta <= 127:
+        out += INT8.pack(delta)
+        return FIELD_DELTA
+    out += UINT16.pack(new)
+    return FIELD_FULL
+
+
+def decode_field(data, offset, code, old, modulo=None):
+    """
+    Читает поле объекта по его коду.
+
+    Возвращает:
+        tuple: Значение и смещение после поля.
+    """
+    if code == FIELD_SAME:
+        return old, offset
+    if code == FIELD_DELTA:
+        value = old + INT8.unpack_from(data, offset)[0]
+        return (value % modulo if modulo is not None else value), offset + 1
+    return UINT16.unpack_from(data, offset)[0], offset + 2
+
+
+def encode_entities(out, base, state):
+    """
+    Дописывает разницу между состояниями объектов base и state.
+
+    Аргументы:
+        out (bytearray): Буфер пакета.
+        base (dict): Состояние базового снимка (пустой словарь для полного снимка).
+        state (dict): Новое состояние.
+    """
+    removed = sorted(entity for entity in base if entity not in state)
+    write_varint(out, len(removed))
+    previous = 0
+    for entity in removed:
+        write_varint(out, entity - previous)
+        previous = entity
+
+    changed = sorted(entity for entity, values in state.items() if base.get(entity) != values)
+    write_varint(out, len(changed))
+    previous = 0
+    for entity in changed:
+        write_varint(out, entity - previous)
+        previous = entity
+        old_kind, old_x, old_y, old_angle, old_flags = base.get(entity, EMPTY_STATE)
+        kind, x, y, angle, flags = state[entity]
+        mask_at = len(out)
+        out.append(0)
+        mask = encode_field(out, old_x, x)
+        mask |= encode_field(out, old_y, y) << 2
+        mask |= encode_field(out, old_angle, angle, ANGLE_STEPS) << 4
+        if flags != old_flags:
+            mask |= MASK_STATE
+            write_varint(out, flags)
+        if kind != old_kind:
+            mask |= MASK_KIND
+            out.append(kind)
+        out[mask_at] = mask
+
+
+def decode_entities(data, offset, base):
+    """
+    Восстанавливает состояние объектов по базовому и разнице, записанной encode_entities.
+
+    Возвращает:
+        tuple: Новое состояние (dict) и смещение после разницы.
+    """
+    state = dict(base)
+    count, offset = read_varint(data, offset)
+    entity = 0
+    for _ in range(count):
+        gap, offset = read_varint(data, offset)
+        entity += gap
+        state.pop(entity, None)
+
+    count, offset = read_varint(data, offset)
+    entity = 0
+    for _ in range(count):
+        gap, offset = read_varint(data, offset)
+        entity += gap
+        kind, x, y, angle, flags = state.get(entity, EMPTY_STATE)
+        mask = data[offset]
+        offset += 1
+        x, offset = decode_field(data, offset, mask & 3, x)
+        y, offset = decode_field(data, offset, mask >> 2 & 3, y)
+        angle, offset = decode_field(data, offset, mask >> 4 & 3, angle, ANGLE_STEPS)
+        if mask & MASK_STATE:
+            flags, offset = read_varint(data, offset)
+        if mask & MASK_KIND:
+            kind = data[offset]
+            offset += 1
+        state[entity] = (kind, x, y, angle, flags)
+    return state, offset
+
+
+def encode_snapshot(tick, base_tick, input_ack, players, state, base=None):
+    """
+    Кодирует снимок состояния.
+
+    Аргументы:
+        tick (int): Тик сервера.
+        base_tick (int): Тик базового снимка (0 — полный снимок).
+        input_ack (int): Номер последней примененной команды клиента.
+        players (list): Записи игроков (см. player_state).
+        state (dict): Состояние объектов (см. world_state).
+        base (dict): Состояние объектов базового снимка (None — полный снимок).
+
+    Возвращает:
+        bytes: Пакет.
+    """
+    out = bytearray(SNAPSHOT_HEADER.pack(MSG_SNAPSHOT, tick, base_tick if base is not None else 0, input_ack,
+                                         len(players)))
+    for player in players:
+        out += PLAYER.pack(*player)
+    encode_entities(out, base or {}, state)
+    return bytes(out)
+
+
+def read_snapshot_header(data):
+    """
+    Читает заголовок снимка, чтобы найти базовый снимок до разбора.
+
+    Возвращает:
+        tuple: Тик, базовый тик, номер последней примененной команды, количество игроков.
+    """
+    return SNAPSHOT_HEADER.unpack_from(data)[1:]
+
+
+def decode_snapshot(data, base=None):
+    """
+    Разбирает снимок состояния.
+
+    Аргументы:
+        data (bytes): Пакет.
+        base (dict): Состояние объектов базового снимка (для полного снимка не нужно).
+
+    Возвращает:
+        Snapshot: Снимок в исходных единицах для игроков и квантованный для объектов.
+    """
+    tick, base_tick, input_ack, count = read_snapshot_header(data)
+    if base_tick and base is None:
+        raise ValueError(f"snapshot {tick} needs base snapshot {base_tick}")
+    offset = SNAPSHOT_HEADER.size
+    players = {}
+    for _ in range(count):
+        number, lives, flags, score, x, y, angle, velocity_x, velocity_y = PLAYER.unpack_from(data, offset)
+        offset += PLAYER.size
+        players[number] = (lives, flags, score, x / NET_POSITION_SCALE, y / NET_POSITION_SCALE,
+                           angle / SHIP_ANGLE_SCALE, velocity_x / VELOCITY_SCALE, velocity_y / VELOCITY_SCALE)
+    entities, offset = decode_entities(data, offset, base if base_tick else {})
+    return Snapshot(tick, base_tick, input_ack, players, entities)
+
+
+def encode_input(ack_tick, commands):
+    """
+    Кодирует команды управления клиента.
+
+    Аргументы:
+        ack_tick (int): Тик последнего полученного снимка.
+        commands (list): Пары (номер команды, биты управления), от старых к новым.
+
+    Возвращает:
+        bytes: Пакет.
+    """
+    out = bytearray(INPUT_HEADER.pack(MSG_INPUT, ack_tick, len(commands)))
+    for sequence, bits in commands:
+        out += INPUT_ENTRY.pack(sequence, bits)
+    return bytes(out)
+
+
+def decode_input(data):
+    """
+    Разбирает команды управления клиента.
+
+    Возвращает:
+        tuple: Тик подтвержденного снимка и список пар (номер команды, биты управления).
+    """
+    _, ack_tick, count = INPUT_HEADER.unpack_from(data)
+    offset = INPUT_HEADER.size
+    commands = []
+    for _ in range(count):
+        commands.append(INPUT_ENTRY.unpack_from(data, offset))
+        offset += INPUT_ENTRY.size
+    return ack_tick, commands
@@ -0,0 +1,288 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+
+from src.Log import INFO, add_log_arguments, log
+from src.MultiplayerSimulation import MultiplayerSimulation
+from src.NetProtocol import *
+from src.Simulation import INPUT_SHOOT
+from src.config import *
+
+net_log = log.channel("net")
+
+
+class ClientConnection:
+    """
+    Класс ClientConnection — состояние одного клиента на сервере.
+
+    Атрибуты:
+        address (tuple): Адрес клиента (хост, порт).
+        player (int): Номер игрока клиента.
+        commands (collections.deque): Полученные, но еще не примененные команды: пары (номер, биты).
+        last_received (int): Номер последней полученной команды.
+        last_applied (int): Номер последней примененной команды.
+        bits (int): Биты управления, действующие, пока новых команд нет.
+        ack_tick (int): Тик последнего снимка, который клиент подтвердил (0 — ни одного).
+        last_heard (float): Время последнего пакета клиента (time.monotonic).
+        bytes_sent (int): Отправлено клиенту байт.
+        bytes_received (int): Получено от клиента байт.
+        snapshots (int): Отправлено снимков.
+    """
+
+    def __init__(self, address, player, now):
+        """
+        Инициализация объекта ClientConnection.
+
+        Аргументы:
+            address (tuple): Адрес клиента.
+            player (int): Номер игрока.
+            now (float): Текущее время (time.monotonic).
+        """
+        self.address = address
+        self.player = player
+        self.commands = deque()
+        self.last_received = 0
+        self.last_applied = 0
+        self.bits = 0
+        self.ack_tick = 0
+        self.last_heard = now
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.snapshots = 0
+
+    def next_bits(self):
+        """
+        Берет очередную команду клиента. Если команд нет, повторяются прежние биты без выстрела;
+        если клиент прислал слишком много команд вперед, старые отбрасываются.
+
+        Возвращает:
+            int: Биты управления на этот тик.
+        """
+        commands = self.commands
+        while len(commands) > 2 * NET_INPUT_REDUNDANCY:
+            commands.popleft()
+        if commands:
+            self.last_applied, self.bits = commands.popleft()
+            return self.bits
+        return self.bits & ~INPUT_SHOOT
+
+
+class GameServer(asyncio.DatagramProtocol):
+    """
+    Класс GameServer — авторитетный сервер сетевой игры: выполняет MultiplayerSimulation
+    и рассылает клиентам снимки состояния по UDP.
+
+    Клиенты присылают команды управления с номерами, сервер применяет по одной команде
+    каждого клиента за тик и раз в snapshot_interval тиков отправляет каждому снимок,
+    сжатый относительно последнего снимка, который клиент подтвердил. Снимки хранятся
+    NET_HISTORY тиков; если подтвержденного снимка уже нет, отправляется полный снимок.
+    Когда жизни кончаются у всех игроков, начинается новая игра с теми же игроками.
+
+    Атрибуты:
+        seed (int): Начальное значение генераторов первой игры.
+        params (dict): Параметры симуляции (см. Simulation.set_params).
+        max_players (int): Максимальное количество игроков.
+        snapshot_interval (int): Период отправки снимков (тики).
+        compare_full (bool): Считать размер полных снимков для сравнения (для замеров).
+        sim (MultiplayerSimulation): Текущая игра.
+        games (int): Количество начатых игр.
+        tick (int): Тик сервера (не сбрасывается между играми).
+        clients (dict): Клиенты по адресу.
+        history (collections.OrderedDict): Состояния объектов отправленных снимков по тику.
+        tick_times (collections.deque): Длительности последних тиков (секунды).
+        full_bytes (int): Суммарный размер полных снимков (только при compare_full).
+        transport (asyncio.DatagramTransport): Сокет сервера.
+    """
+
+    def __init__(self, seed=0, params=None, max_players=NET_MAX_PLAYERS, snapshot_interval=NET_SNAPSHOT_INTERVAL,
+                 compare_full=False):
+        """
+        Инициализация объекта GameServer.
+
+        Аргументы:
+            seed (int): Начальное значение генераторов первой игры.
+            params (dict): Параметры симуляции.
+            max_players (int): Максимальное количество игроков.
+            snapshot_interval (int): Период отправки снимков (тики).
+            compare_full (bool): Считать размер полных снимков для сравнения.
+        """
+        self.seed = seed
+        self.params = params or {}
+        self.max_players = max_players
+        self.snapshot_interval = snapshot_interval
+        self.compare_full = compare_full
+        self.games = 0
+        self.sim = None
+        self.tick = 0
+        self.clients = {}
+        self.history = OrderedDict()
+        self.tick_times = deque(maxlen=PROFILER_WINDOW)
+        self.full_bytes = 0
+        self.transport = None
+        self.new_game()
+
+    def new_game(self):
+        """Начинает новую игру с теми же игроками."""
+        self.sim = MultiplayerSimulation(seed=self.seed + self.games, max_players=self.max_players)
+        self.sim.set_params(self.params)
+        self.sim.start()
+        self.games += 1
+        for client in self.clients.values():
+            self.sim.add_player(client.player)
+        # Идентификаторы объектов новой игры начинаются заново: старые снимки не годятся как базовые
+        self.history.clear()
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, address):
+        if not data:
+            return
+        kind = data[0]
+        client = self.clients.get(address)
+        if client is not None:
+            client.last_heard = time.monotonic()
+            client.bytes_received += len(data)
+        if kind == MSG_INPUT and client is not None:
+            ack_tick, commands = decode_input(data)
+            if ack_tick > client.ack_tick:
+                client.ack_tick = ack_tick
+            for sequence, bits in commands:
+                if sequence > client.last_received:
+                    client.commands.append((sequence, bits))
+                    client.last_received = sequence
+        elif kind == MSG_HELLO:
+            self.join(address, data)
+        elif kind == MSG_BYE and client is not None:
+            self.leave(address)
+
+    def join(self, address, data):
+        """Принимает нового клиента (или повторяет приветствие, если оно потерялось)."""
+        version = HELLO.unpack_from(data)[1]
+        if version != PROTOCOL_VERSION:
+            return
+        client = self.clients.get(address)
+        if client is None:
+            player = self.sim.add_player()
+            if player is None:
+                self.transport.sendto(bytes([MSG_FULL]), address)
+                return
+            client = self.clients[address] = ClientConnection(address, player.number, time.monotonic())
+            if net_log.level <= INFO:
+                net_log.info("Player %s joined from %s:%s", player.number, *address[:2])
+        self.transport.sendto(WELCOME.pack(MSG_WELCOME, PROTOCOL_VERSION, client.player, self.tick), address)
+
+    def leave(self, address):
+        """Отключает клиента и убирает его корабль."""
+        client = self.clients.pop(address)
+        self.sim.remove_player(client.player)
+        if net_log.level <= INFO:
+            net_log.info("Player %s left", client.player)
+
+    def step(self):
+        """Выполняет тик: применяет команды клиентов, продвигает игру и при необходимости рассылает снимки."""
+        started = time.perf_counter()
+        now = time.monotonic()
+        for address in [address for address, client in self.clients.items()
+                        if now - client.last_heard > NET_CLIENT_TIMEOUT]:
+            self.leave(address)
+
+        self.tick += 1
+        self.sim.step({client.player: client.next_bits() for client in self.clients.values()})
+        if self.sim.finished:
+            self.new_game()
+        if self.tick % self.snapshot_interval == 0:
+            self.send_snapshots()
+        self.tick_times.append(time.perf_counter() - started)
+
+    def send_snapshots(self):
+        """Рассылает клиентам снимок текущего тика, сжатый относительно подтвержденного каждым."""
+        state = world_state(self.sim)
+        self.history[self.tick] = state
+        while len(self.history) > NET_HISTORY:
+            self.history.popitem(last=False)
+        players = [player_state(player) for player in self.sim.players.values()]
+        if self.compare_full and self.clients:
+            self.full_bytes += len(encode_snapshot(self.tick, 0, 0, players, state)) * len(self.clients)
+        for client in self.clients.values():
+            base = self.history.get(client.ack_tick)
+            data = encode_snapshot(self.tick, client.ack_tick, client.last_applied, players, state, base)
+            self.transport.sendto(data, client.address)
+            client.bytes_sent += len(data)
+            client.snapshots += 1
+
+    async def run(self, duration=None):
+        """
+        Выполняет тики с частотой TICK_RATE.
+
+        Аргументы:
+            duration (float): Длительность работы (секунды; None — пока задачу не отменят).
+        """
+        loop = asyncio.get_running_loop()
+        interval = 1 / TICK_RATE
+        next_tick = loop.time()
+        stop = None if duration is None else next_tick + duration
+        while stop is None or next_tick < stop:
+            self.step()
+            next_tick += interval
+            delay = next_tick - loop.time()
+            if delay < 0:
+                next_tick = loop.time()  # Сервер отстал: не догоняем пропущенные тики
+                delay = 0
+            await asyncio.sleep(delay)
+
+    def close(self):
+        """Сообщает клиентам об остановке и закрывает сокет."""
+        for address in self.clients:
+            self.transport.sendto(bytes([MSG_BYE]), address)
+        self.transport.close()
+
+
+async def start_server(host=NET_HOST, port=NET_PORT, **options):
+    """
+    Открывает UDP-сокет сервера.
+
+    Аргументы:
+        host (str): Адрес.
+        port (int): Порт (0 — любой свободный; см. server.transport.get_extra_info("sockname")).
+        **options: Аргументы GameServer.
+
+    Возвращает:
+        GameServer: Сервер; тики выполняет server.run().
+    """
+    loop = asyncio.get_running_loop()
+    _, server = await loop.create_datagram_endpoint(lambda: GameServer(**options), local_addr=(host, port))
+    return server
+
+
+async def serve(host, port, duration, **options):
+    """Запускает сервер и выполняет тики duration секунд (None — до остановки)."""
+    server = await start_server(host, port, **options)
+    print(f"Serving on {host}:{server.transport.get_extra_info('sockname')[1]}")
+    try:
+        await server.run(duration)
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Сервер сетевой игры Asteroids")
+    parser.add_argument("--host", default=NET_HOST, help="Адрес сервера")
+    parser.add_argument("--port", type=int, default=NET_PORT, help="UDP-порт сервера")
+    parser.add_argument("--seed", type=int, default=0, help="Начальное значение генераторов")
+    parser.add_argument("--players", type=int, default=NET_MAX_PLAYERS, help="Максимальное количество игроков")
+    parser.add_argument("--asteroids", type=int, help="Количество астероидов на поле")
+    parser.add_argument("--duration", type=float, help="Время работы (секунды; по умолчанию до Ctrl+C)")
+    add_log_arguments(parser)
+    args = parser.parse_args()
+    log.configure(args)
+
+    params = {"MIN_ASTEROIDS": args.asteroids, "MAX_ASTEROIDS": args.asteroids} if args.asteroids else None
+    try:
+        asyncio.run(serve(args.host, args.port, args.duration, seed=args.seed, params=params,
+                          max_players=args.players))
+    except KeyboardInterrupt:
+        pass
+    log.stop()
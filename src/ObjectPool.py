@@ -0,0 +1,111 @@
+class ObjectPool:
+    """
+    Класс ObjectPool хранит освободившиеся объекты игры и выдает их повторно
+    вместо создания новых.
+
+    Повторно выдаваемый объект заново инициализируется методом reset с теми же
+    аргументами, что и конструктор, поэтому в установившейся игре новые объекты
+    не создаются.
+
+    Атрибуты:
+        factory (callable): Функция создания нового объекта (аргументы как у reset).
+        capacity (int): Максимальное количество хранимых свободных объектов.
+        free (list): Свободные объекты.
+        created (int): Количество созданных объектов.
+        reused (int): Количество повторных выдач.
+    """
+
+    def __init__(self, factory, capacity):
+        """
+        Инициализация объекта ObjectPool.
+
+        Аргументы:
+            factory (callable): Функция создания нового объекта.
+            capacity (int): Максимальное количество хранимых свободных объектов.
+        """
+        self.factory = factory
+        self.capacity = capacity
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args):
+        """
+        Выдает свободный объект, заново инициализированный аргументами args,
+        или создает новый, если свободных нет.
+        """
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return self.factory(*args)
+
+    def release(self, obj):
+        """
+        Возвращает объект в пул. Объекты сверх вместимости отбрасываются.
+
+        Аргументы:
+            obj: Объект, который больше не используется симуляцией.
+        """
+        if len(self.free) < self.capacity:
+            self.free.append(obj)
+
+
+class RingPool:
+    """
+    Класс RingPool — кольцевой буфер фиксированной вместимости с объектами,
+    которые выдаются по кругу.
+
+    Слот освобождается сам, когда объект перестает использоваться (например, у ракеты
+    истекает время жизни), поэтому возвращать объекты не нужно. Если очередной по кругу
+    слот еще занят, буфер заполнен и объект не выдается. Для объектов с одинаковым временем
+    жизни (ракет) очередной слот всегда самый старый, поэтому проверки одного слота достаточно.
+
+    Атрибуты:
+        factory (callable): Функция создания нового объекта (аргументы как у reset).
+        is_free (callable): Функция is_free(obj), проверяющая, свободен ли объект.
+        slots (list): Объекты буфера (None — слот еще не заполнялся).
+        head (int): Индекс очередного слота.
+        created (int): Количество созданных объектов.
+        reused (int): Количество повторных выдач.
+        rejected (int): Количество отказов из-за заполненного буфера.
+    """
+
+    def __init__(self, factory, capacity, is_free):
+        """
+        Инициализация объекта RingPool.
+
+        Аргументы:
+            factory (callable): Функция создания нового объекта.
+            capacity (int): Количество слотов.
+            is_free (callable): Функция is_free(obj), проверяющая, свободен ли объект.
+        """
+        self.factory = factory
+        self.is_free = is_free
+        self.slots = [None] * max(1, capacity)
+        self.head = 0
+        self.created = 0
+        self.reused = 0
+        self.rejected = 0
+
+    def acquire(self, *args):
+        """
+        Выдает объект очередного слота, заново инициализированный аргументами args.
+
+        Возвращает:
+            object: Объект или None, если буфер заполнен.
+        """
+        obj = self.slots[self.head]
+        if obj is None:
+            obj = self.slots[self.head] = self.factory(*args)
+            self.created += 1
+        elif self.is_free(obj):
+            obj.reset(*args)
+            self.reused += 1
+        else:
+            self.rejected += 1
+            return None
+        self.head = (self.head + 1) % len(self.slots)
+        return obj
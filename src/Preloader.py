@@ -0,0 +1,155 @@
+import queue
+import threading
+import time
+
+from src.AssetManager import assets
+from src.RotationCache import rotation_cache
+from src.config import *
+
+
+class Preloader:
+    """
+    Класс Preloader готовит спрайты игры в фоновом потоке, не задерживая стартовый экран.
+
+    Задания разбиты на этапы. Фоновый поток декодирует и масштабирует изображения
+    и заранее строит повернутые кадры (PIL отпускает GIL на время декодирования
+    и поворота), а готовые изображения передает через очередь. Поток Tk забирает их
+    таймером after и создает PhotoImage, тратя на это не больше budget секунд за вызов,
+    чтобы анимация стартового экрана не замирала. После последнего задания этапа
+    вызывается функция этапа.
+
+    Задания:
+        ("photo", файл, размер) — PhotoImage масштабированного изображения (assets.get_photo);
+        ("frame", файл, размер, шаг, номер) — повернутый кадр кэша поворотов; размер None —
+        исходный размер файла.
+
+    Атрибуты:
+        root (tk.Tk): Корневое окно (для таймера after).
+        stages (list): Этапы: пары (список заданий, функция без аргументов).
+        queue (queue.Queue): Готовые изображения от фонового потока.
+        thread (threading.Thread): Фоновый поток (None до запуска и при загрузке без потока).
+        delivered (int): Количество изображений, переданных в поток Tk.
+        worker_time (float): Время работы фонового потока (секунды).
+        done (bool): Флаг, указывающий, что все этапы завершены.
+    """
+
+    def __init__(self, root, poll_interval=PRELOAD_POLL_INTERVAL, budget=PRELOAD_FRAME_BUDGET):
+        """
+        Инициализация объекта Preloader.
+
+        Аргументы:
+            root (tk.Tk): Корневое окно.
+            poll_interval (int): Период опроса очереди (миллисекунды).
+            budget (float): Время потока Tk на создание PhotoImage за один опрос (секунды).
+        """
+        self.root = root
+        self.poll_interval = poll_interval
+        self.budget = budget
+        self.stages = []
+        self.queue = queue.Queue()
+        self.thread = None
+        self.delivered = 0
+        self.worker_time = 0.0
+        self.done = False
+
+    def add_stage(self, jobs, callback):
+        """
+        Добавляет этап загрузки.
+
+        Аргументы:
+            jobs (list): Задания этапа.
+            callback (callable): Функция, вызываемая в потоке Tk после выполнения этапа.
+        """
+        self.stages.append((list(jobs), callback))
+
+    def start(self):
+        """Запускает фоновый поток и опрос очереди."""
+        self.thread = threading.Thread(target=self.run, name="asset-preloader", daemon=True)
+        self.thread.start()
+        self.root.after(self.poll_interval, self.poll)
+
+    def load_now(self):
+        """Выполняет все этапы в текущем потоке (например, в бенчмарках без цикла событий Tk)."""
+        self.run()
+        while not self.done and not self.queue.empty():
+            self.deliver()
+
+    def run(self):
+        """Тело фонового потока: готовит изображения всех этапов по порядку."""
+        started = time.perf_counter()
+        try:
+            for index, (jobs, callback) in enumerate(self.stages):
+                for job in jobs:
+                    self.queue.put(self.prepare(job))
+                self.queue.put(("stage", index))
+        except Exception as error:
+            self.queue.put(("error", error))  # Исключение пробрасывается в потоке Tk
+        self.worker_time = time.perf_counter() - started
+
+    @staticmethod
+    def rotation_jobs(filename, size, step):
+        """
+        Возвращает задания для всех повернутых кадров спрайта.
+
+        Аргументы:
+            filename (str): Имя файла спрайта.
+            size (tuple): Размер (ширина, высота); None — исходный размер файла.
+            step (float): Шаг квантования угла в градусах.
+        """
+        return [("frame", filename, size, step, index) for index in range(int(round(360 / step)))]
+
+    @staticmethod
+    def prepare(job):
+        """
+        Выполняет часть задания, не требующую Tk.
+
+        Аргументы:
+            job (tuple): Задание.
+
+        Возвращает:
+            tuple: Элемент очереди для потока Tk.
+        """
+        kind, filename, size = job[:3]
+        image = assets.get_scaled(filename, size) if size else assets.load(filename)
+        if kind == "photo":
+            return job
+        step, index = job[3:]
+        key = (filename, image.size, step, index)
+        return "frame", key, rotation_cache.rotate(image, key)
+
+    def poll(self):
+        """Забирает готовые изображения в пределах бюджета и планирует следующий опрос."""
+        self.deliver(self.budget)
+        if not self.done:
+            self.root.after(self.poll_interval, self.poll)
+
+    def deliver(self, budget=None):
+        """
+        Создает PhotoImage для готовых изображений и вызывает функции завершенных этапов.
+
+        Аргументы:
+            budget (float): Ограничение времени (секунды); None — до опустошения очереди.
+        """
+        deadline = None if budget is None else time.perf_counter() + budget
+        while deadline is None or time.perf_counter() < deadline:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                return
+            kind = item[0]
+            if kind == "photo":
+                assets.get_photo(item[1], item[2])
+                self.delivered += 1
+            elif kind == "frame":
+                if item[1] not in rotation_cache.frames:  # Кадр мог понадобиться раньше и уже построен
+                    rotation_cache.add_frame(item[1], item[2])
+                self.delivered += 1
+            elif kind == "stage":
+                if item[1] == len(self.stages) - 1:
+                    self.done = True
+                self.stages[item[1]][1]()
+                if self.done:
+                    return
+            else:
+                self.done = True
+                raise item[1]
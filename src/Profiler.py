@@ -0,0 +1,185 @@
+import csv
+import time
+from collections import deque
+
+from src.config import *
+
+
+class FrameProfiler:
+    """
+    Класс FrameProfiler измеряет время отдельных фаз каждого кадра и хранит
+    скользящее окно измерений для расчета перцентилей.
+
+    Фазы симуляции отмечаются вызовами mark(phase) внутри Simulation.step, фазы
+    отрисовки и простоя Tk — в Game. Когда профилировщик выключен, Simulation
+    хранит вместо него None, и накладные расходы сводятся к одной проверке на фазу.
+
+    Атрибуты:
+        enabled (bool): Флаг, указывающий, собираются ли измерения.
+        history (dict): Скользящие окна длительностей фаз (секунды) по имени фазы.
+        current (dict): Длительности фаз текущего кадра (секунды).
+        counters (dict): Последние значения счетчиков (количество объектов и т. п.).
+        frames (int): Количество записанных кадров.
+        csv_file (file): Файл для потоковой записи измерений (None, если запись выключена).
+    """
+
+    PHASES = ("ship", "rockets", "asteroids", "collisions", "cleanup", "spawn", "render", "idle", "frame")
+
+    def __init__(self, window=PROFILER_WINDOW):
+        """
+        Инициализация объекта FrameProfiler.
+
+        Аргументы:
+            window (int): Количество последних кадров, по которым считаются перцентили.
+        """
+        self.enabled = False
+        self.history = {phase: deque(maxlen=window) for phase in self.PHASES}
+        self.current = dict.fromkeys(self.PHASES, 0.0)
+        self.counters = {}
+        self.frames = 0
+        self.frame_start = None
+        self.frame_end = None
+        self.last_mark = None
+        self.csv_file = None
+        self.csv_writer = None
+        self.counter_names = None
+
+    def open_csv(self, path):
+        """
+        Включает потоковую запись измерений каждого кадра в CSV-файл.
+
+        Аргументы:
+            path (str): Путь к CSV-файлу.
+        """
+        self.csv_file = open(path, "w", newline="")
+        self.csv_writer = csv.writer(self.csv_file)
+        self.counter_names = None  # Заголовок пишется с первым кадром, когда известны счетчики
+
+    def close(self):
+        """Закрывает CSV-файл, если он открыт."""
+        if self.csv_file is not None:
+            self.csv_file.close()
+            self.csv_file = None
+            self.csv_writer = None
+
+    def begin_frame(self):
+        """Начинает кадр; время с конца предыдущего кадра записывается как простой Tk."""
+        now = time.perf_counter()
+        if self.frame_end is not None:
+            self.current["idle"] = now - self.frame_end
+        self.frame_start = self.last_mark = now
+
+    def restart(self):
+        """Начинает отсчет следующей фазы, не приписывая прошедшее время ни одной фазе."""
+        self.last_mark = time.perf_counter()
+
+    def mark(self, phase):
+        """
+        Приписывает время с предыдущей отметки фазе phase.
+
+        Аргументы:
+            phase (str): Имя фазы из PHASES.
+        """
+        now = time.perf_counter()
+        self.current[phase] += now - self.last_mark
+        self.last_mark = now
+
+    def end_frame(self, counters=None):
+        """
+        Завершает кадр: переносит длительности фаз в историю и пишет строку в CSV.
+
+        Аргументы:
+            counters (dict): Значения счетчиков кадра (количество объектов и т. п.).
+        """
+        now = time.perf_counter()
+        current = self.current
+        current["frame"] = now - self.frame_start
+        for phase, duration in current.items():
+            self.history[phase].append(duration)
+        if counters:
+            self.counters = counters
+
+        if self.csv_writer is not None:
+            if self.counter_names is None:
+                self.counter_names = sorted(self.counters)
+                self.csv_writer.writerow(["frame", "time"] + [f"{phase}_ms" for phase in self.PHASES]
+                                         + self.counter_names)
+            self.csv_writer.writerow(
+                [self.frames, f"{now:.6f}"] + [f"{current[phase] * 1000:.4f}" for phase in self.PHASES]
+                + [self.counters.get(name, "") for name in self.counter_names]
+            )
+
+        self.frames += 1
+        self.current = dict.fromkeys(self.PHASES, 0.0)
+        self.frame_end = time.perf_counter()
+
+    def percentiles(self, phase):
+        """
+        Вычисляет перцентили длительности фазы по скользящему окну.
+
+        Аргументы:
+            phase (str): Имя фазы.
+
+        Возвращает:
+            tuple: Значения p50, p95 и p99 в миллисекундах.
+        """
+        samples = sorted(self.history[phase])
+        if not samples:
+            return 0.0, 0.0, 0.0
+        last = len(samples) - 1
+        return tuple(samples[int(round(q * last))] * 1000 for q in (0.5, 0.95, 0.99))
+
+    def report(self):
+        """
+        Формирует текстовый отчет для оверлея.
+
+        Возвращает:
+            str: Таблица перцентилей по фазам и значения счетчиков.
+        """
+        lines = [f"{'phase':<11}{'p50':>7}{'p95':>7}{'p99':>7}  ms"]
+        for phase in self.PHASES:
+            p50, p95, p99 = self.percentiles(phase)
+            lines.append(f"{phase:<11}{p50:7.2f}{p95:7.2f}{p99:7.2f}")
+        for name in sorted(self.counters):
+            lines.append(f"{name}: {self.counters[name]}")
+        return "\n".join(lines)
+
+
+class StartupProfile:
+    """
+    Класс StartupProfile измеряет запуск игры: время импорта модулей, время до
+    первого кадра стартового экрана и время до готовности к игре.
+
+    Атрибуты:
+        started (float): Момент начала отсчета (time.perf_counter()).
+        marks (dict): Время от начала отсчета до каждой отметки (секунды) в порядке отметок.
+    """
+
+    def __init__(self, started):
+        """
+        Инициализация объекта StartupProfile.
+
+        Аргументы:
+            started (float): Момент начала отсчета (time.perf_counter()).
+        """
+        self.started = started
+        self.marks = {}
+
+    def mark(self, name):
+        """
+        Отмечает момент запуска; повторные отметки с тем же именем не учитываются.
+
+        Аргументы:
+            name (str): Имя отметки ("imports", "first_frame", "interactive" и т. п.).
+        """
+        if name not in self.marks:
+            self.marks[name] = time.perf_counter() - self.started
+
+    def report(self):
+        """
+        Возвращает отчет о запуске.
+
+        Возвращает:
+            str: Строка вида "imports: 95.1 ms, first_frame: 180.4 ms, interactive: 410.9 ms".
+        """
+        return ", ".join(f"{name}: {elapsed * 1000:.1f} ms" for name, elapsed in self.marks.items())
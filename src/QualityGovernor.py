@@ -0,0 +1,115 @@
+from collections import deque
+
+from src.Log import INFO, log
+from src.config import *
+
+game_log = log.channel("game")
+
+
+class QualityGovernor:
+    """
+    Класс QualityGovernor удерживает частоту кадров под нагрузкой, переключая уровни качества
+    (пресеты QUALITY_PRESETS в config.py) по времени работы последних кадров.
+
+    Когда среднее время кадра за окно превышает бюджет, качество понижается на один
+    уровень; когда среднее время укладывается в долю headroom бюджета, повышается.
+    После каждого переключения окно начинается заново, поэтому уровень не меняется
+    чаще одного раза за окно.
+
+    Атрибуты:
+        levels (list): Имена уровней от низкого к высокому.
+        index (int): Номер текущего уровня в levels.
+        budget (float): Бюджет времени работы кадра (секунды).
+        headroom (float): Доля бюджета, при которой качество повышается.
+        adaptive (bool): Переключать уровни автоматически.
+        frame_times (collections.deque): Время работы последних кадров (секунды).
+        changes (int): Количество переключений уровня.
+    """
+
+    def __init__(self, level=QUALITY_LEVEL, budget=1 / RENDER_RATE, window=QUALITY_WINDOW,
+                 headroom=QUALITY_HEADROOM, adaptive=QUALITY_ADAPTIVE):
+        """
+        Инициализация объекта QualityGovernor.
+
+        Аргументы:
+            level (str): Начальный уровень качества.
+            budget (float): Бюджет времени работы кадра (секунды).
+            window (int): Количество кадров, по которым принимается решение.
+            headroom (float): Доля бюджета, при которой качество повышается.
+            adaptive (bool): Переключать уровни автоматически.
+        """
+        self.levels = list(QUALITY_LEVELS)
+        self.index = self.levels.index(level)
+        self.budget = budget
+        self.headroom = headroom
+        self.adaptive = adaptive
+        self.frame_times = deque(maxlen=window)
+        self.changes = 0
+
+    @property
+    def level(self):
+        """Имя текущего уровня качества."""
+        return self.levels[self.index]
+
+    @property
+    def settings(self):
+        """Параметры текущего уровня качества (словарь из QUALITY_PRESETS)."""
+        return QUALITY_PRESETS[self.level]
+
+    def set_level(self, level):
+        """
+        Устанавливает уровень качества.
+
+        Аргументы:
+            level (str): Имя уровня из QUALITY_LEVELS.
+        """
+        if level not in self.levels:
+            raise ValueError(f"unknown quality level: {level}; known: {', '.join(self.levels)}")
+        self.index = self.levels.index(level)
+        self.frame_times.clear()
+
+    def mean_frame_time(self):
+        """Возвращает среднее время работы кадра за окно (секунды)."""
+        if not self.frame_times:
+            return 0.0
+        return sum(self.frame_times) / len(self.frame_times)
+
+    def record(self, frame_time):
+        """
+        Учитывает время работы очередного кадра и при необходимости переключает уровень.
+
+        Аргументы:
+            frame_time (float): Время работы кадра без ожидания следующего (секунды).
+
+        Возвращает:
+            bool: True, если уровень изменился.
+        """
+        frame_times = self.frame_times
+        frame_times.append(frame_time)
+        if not self.adaptive or len(frame_times) < frame_times.maxlen:
+            return False
+        mean = self.mean_frame_time()
+        if mean > self.budget and self.index > 0:
+            step = -1
+        elif mean < self.budget * self.headroom and self.index < len(self.levels) - 1:
+            step = 1
+        else:
+            return False
+        self.index += step
+        self.changes += 1
+        frame_times.clear()
+        if game_log.level <= INFO:
+            game_log.info("Quality %s to %s: mean frame %.1f ms, budget %.1f ms",
+                          "lowered" if step < 0 else "raised", self.level, mean * 1000, self.budget * 1000)
+        return True
+
+    def report(self):
+        """
+        Формирует строку для диагностики.
+
+        Возвращает:
+            str: Уровень, среднее время кадра и бюджет.
+        """
+        mode = "auto" if self.adaptive else "fixed"
+        return (f"quality: {self.level} ({mode}), frame {self.mean_frame_time() * 1000:.1f}"
+                f"/{self.budget * 1000:.1f} ms")
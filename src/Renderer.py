@@ -0,0 +1,244 @@
+from src.AssetManager import assets
+from src.CommandBuffer import CommandBuffer
+from src.RotationCache import rotation_cache
+from src.config import *
+
+# Кадр спрайта описывается кортежем того же вида, что и задания Preloader:
+#     ("photo", файл, размер) — масштабированное изображение;
+#     ("frame", файл, размер, шаг, номер) — повернутый кадр (размер None — исходный размер файла).
+# Кортеж однозначно определяет изображение, поэтому по нему же проверяется, сменился ли кадр.
+
+
+def source_image(frame):
+    """Возвращает исходное (масштабированное, но не повернутое) PIL-изображение кадра."""
+    filename, size = frame[1], frame[2]
+    return assets.get_scaled(filename, size) if size else assets.load(filename)
+
+
+class Renderer:
+    """
+    Класс Renderer — интерфейс отрисовки объектов симуляции и заодно пустая
+    реализация для запусков без отрисовки.
+
+    Game в каждом кадре вызывает begin_frame, затем draw_layer для каждого слоя
+    (астероиды, ракеты, корабль — в порядке снизу вверх) и end_frame. Слой передается
+    целиком: списком кортежей (объект, x, y, кадр).
+
+    Атрибуты:
+        draws (int): Количество отрисованных спрайтов с начала работы.
+        opaque (bool): Способ отрисовки закрывает элементы холста под собой (например, звездное поле).
+    """
+
+    opaque = False
+
+    def __init__(self, canvas=None, hud=None):
+        """
+        Инициализация объекта Renderer.
+
+        Аргументы:
+            canvas (tk.Canvas): Холст игры.
+            hud (Hud): Интерфейс поверх игры.
+        """
+        self.canvas = canvas
+        self.hud = hud
+        self.draws = 0
+
+    def begin_frame(self):
+        """Начинает кадр."""
+
+    def draw_layer(self, name, sprites):
+        """
+        Отрисовывает слой.
+
+        Аргументы:
+            name (str): Имя слоя.
+            sprites (list): Кортежи (объект, x, y, кадр).
+        """
+        self.draws += len(sprites)
+
+    def end_frame(self):
+        """Завершает кадр и выводит его на экран."""
+
+    def memory_counters(self):
+        """Возвращает счетчики объектов, которые хранит способ отрисовки (для MemoryMonitor)."""
+        return {}
+
+
+class CanvasRenderer(Renderer):
+    """
+    Класс CanvasRenderer отрисовывает каждый объект отдельным элементом-изображением холста.
+
+    Спрайты объектов, которых больше нет в слое, скрываются и переходят в запас, а новые
+    объекты сначала получают спрайты из запаса, поэтому элементы холста создаются только
+    при росте числа объектов. Изображение элемента меняется только при смене кадра.
+
+    Перемещения и смена изображений и состояний копятся в CommandBuffer и отправляются
+    в Tcl одним вызовом в end_frame (CANVAS_BATCH_COMMANDS в config.py); без буфера
+    каждая команда сразу вызывает метод холста.
+
+    Атрибуты:
+        layers (dict): Спрайты по имени слоя: объект -> [идентификатор на холсте, кадр, изображение].
+        spares (dict): Скрытые спрайты, ожидающие повторного использования, по имени слоя.
+        commands: Получатель команд coords и itemconfig: CommandBuffer или сам холст.
+    """
+
+    def __init__(self, canvas, hud=None, batch=CANVAS_BATCH_COMMANDS):
+        """
+        Инициализация объекта CanvasRenderer.
+
+        Аргументы:
+            canvas (tk.Canvas): Холст игры.
+            hud (Hud): Интерфейс поверх игры.
+            batch (bool): Отправлять команды холста одним вызовом Tcl за кадр.
+        """
+        super().__init__(canvas, hud)
+        self.layers = {}
+        self.spares = {}
+        self.commands = CommandBuffer(canvas) if batch else canvas
+
+    def draw_layer(self, name, sprites):
+        self.draws += len(sprites)
+        commands = self.commands
+        items = self.layers.setdefault(name, {})
+        spares = self.spares.setdefault(name, [])
+
+        # Если число спрайтов не совпадает с числом объектов или в слое появился новый объект,
+        # часть объектов могла быть удалена из симуляции: их спрайты переходят в запас
+        # до того, как новые объекты получат спрайты
+        if len(items) != len(sprites) or any(sprite[0] not in items for sprite in sprites):
+            alive = {sprite[0] for sprite in sprites}
+            for obj in [obj for obj in items if obj not in alive]:
+                item = items.pop(obj)
+                commands.itemconfig(item[0], state="hidden")
+                spares.append(item)
+
+        for obj, x, y, frame in sprites:
+            item = items.get(obj)
+            if item is None:
+                if spares:
+                    item = items[obj] = spares.pop()
+                    commands.itemconfig(item[0], state="normal")
+                else:
+                    item = items[obj] = [self.canvas.create_image(x, y), None, None]
+                    if self.hud is not None:
+                        self.hud.covered = True  # Новый элемент создан поверх интерфейса
+            if frame != item[1]:
+                item[1] = frame
+                item[2] = self.photo(frame)
+                commands.itemconfig(item[0], image=item[2])
+            commands.coords(item[0], x, y)
+
+    def end_frame(self):
+        if self.commands is not self.canvas:
+            self.commands.flush()
+
+    def memory_counters(self):
+        # Спрайты объектов и скрытые спрайты в запасе
+        return {"sprites": sum(map(len, self.layers.values())) + sum(map(len, self.spares.values()))}
+
+    @staticmethod
+    def photo(frame):
+        """Возвращает PhotoImage кадра из общих кэшей спрайтов и поворотов."""
+        if frame[0] == "photo":
+            return assets.get_photo(frame[1], frame[2])
+        step, index = frame[3], frame[4]
+        return rotation_cache.get_frame(source_image(frame), frame[1], index * step, step=step)
+
+
+class FramebufferRenderer(Renderer):
+    """
+    Класс FramebufferRenderer собирает весь кадр в одном изображении и показывает его
+    одним элементом холста.
+
+    Каждый кадр спрайты накладываются с альфа-смешиванием (Image.paste с маской
+    прозрачности) на RGB-изображение размером с экран, и изображение передается
+    в единственный PhotoImage. Вместо очистки всего буфера закрашиваются только
+    прямоугольники спрайтов предыдущего кадра (пока их немного). Повернутые RGBA-кадры
+    хранятся в собственном кэше: их набор ограничен размерами спрайтов и шагами поворота.
+    Интерфейс (Hud) остается элементами холста над буфером.
+
+    Атрибуты:
+        buffer (PIL.Image): Изображение кадра.
+        photo (ImageTk.PhotoImage): Изображение на холсте.
+        item (int): Идентификатор элемента холста.
+        sprites (dict): RGBA-изображения по кадру.
+        dirty (list): Прямоугольники, занятые спрайтами в предыдущем кадре.
+    """
+
+    FULL_CLEAR_BOXES = 40  # С этого числа прямоугольников дешевле закрасить весь буфер
+    opaque = True  # Буфер непрозрачен и закрывает все элементы под собой
+
+    def __init__(self, canvas, hud=None):
+        super().__init__(canvas, hud)
+        from PIL import Image, ImageTk  # PIL импортируется только для этого способа отрисовки
+
+        self.buffer = Image.new("RGB", (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.photo = ImageTk.PhotoImage(self.buffer)
+        self.item = canvas.create_image(0, 0, anchor="nw", image=self.photo)
+        canvas.tag_lower(self.item)  # Буфер под всеми элементами холста
+        self.sprites = {}
+        self.dirty = []
+
+    def begin_frame(self):
+        buffer = self.buffer
+        if len(self.dirty) >= self.FULL_CLEAR_BOXES:
+            buffer.paste(0, (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+        else:
+            for box in self.dirty:
+                buffer.paste(0, box)
+        self.dirty.clear()
+
+    def draw_layer(self, name, sprites):
+        self.draws += len(sprites)
+        buffer = self.buffer
+        dirty = self.dirty
+        cache = self.sprites
+        for obj, x, y, frame in sprites:
+            image = cache.get(frame)
+            if image is None:
+                image = cache[frame] = self.sprite(frame)
+            width, height = image.size
+            left = int(x) - width // 2
+            top = int(y) - height // 2
+            buffer.paste(image, (left, top), image)
+            dirty.append((left, top, left + width, top + height))
+
+    def end_frame(self):
+        self.photo.paste(self.buffer)
+
+    def memory_counters(self):
+        # Кэш растет до числа различных кадров, как кэш поворотов
+        return {"sprite_cache": len(self.sprites)}
+
+    @staticmethod
+    def sprite(frame):
+        """Строит RGBA-изображение кадра."""
+        image = source_image(frame)
+        if frame[0] == "frame":
+            image = rotation_cache.rotate(image, (frame[1], image.size, frame[3], frame[4]))
+        return image.convert("RGBA")
+
+
+# Способы отрисовки по имени (RENDERER в config.py)
+RENDERERS = {
+    "canvas": CanvasRenderer,
+    "framebuffer": FramebufferRenderer,
+    "null": Renderer,
+}
+
+
+def create_renderer(name, canvas, hud=None):
+    """
+    Создает способ отрисовки по имени.
+
+    Аргументы:
+        name (str): Имя способа: "canvas", "framebuffer" или "null".
+        canvas (tk.Canvas): Холст игры.
+        hud (Hud): Интерфейс поверх игры.
+
+    Возвращает:
+        Renderer: Способ отрисовки.
+    """
+    if name not in RENDERERS:
+        raise ValueError(f"unknown renderer: {name}; known: {', '.join(RENDERERS)}")
+    return RENDERERS[name](canvas, hud)
@@ -0,0 +1,236 @@
+import struct
+import time
+
+from src.Simulation import Simulation
+from src.config import *
+
+REPLAY_MAGIC = b"ASTR"
+REPLAY_VERSION = 1
+
+# Формат заголовка: сигнатура, версия, флаги, начальное значение генератора, период контрольных сумм
+HEADER = struct.Struct("<4sBBQH")
+FLAG_ENTITY_STORE = 1  # Запись сделана с хранилищем EntityStore
+FLAG_SWEPT = 2  # Запись сделана с проверкой столкновений по пути объектов
+
+# Записи после заголовка: тип и тик, затем значение
+TAG_INPUT = 1  # Биты управления изменились начиная с тика
+TAG_CHECKSUM = 2  # Контрольная сумма состояния после тика
+TAG_END = 3  # Последний тик записи
+INPUT_RECORD = struct.Struct("<BIB")
+CHECKSUM_RECORD = struct.Struct("<BII")
+END_RECORD = struct.Struct("<BI")
+
+
+class ReplayDivergence(Exception):
+    """Исключение при расхождении состояния воспроизводимой игры с записанным."""
+
+    def __init__(self, tick, expected, actual):
+        super().__init__(f"replay diverged at tick {tick}: checksum {actual:#010x}, recorded {expected:#010x}")
+        self.tick = tick
+        self.expected = expected
+        self.actual = actual
+
+
+class Recorder:
+    """
+    Класс Recorder записывает игру в компактный двоичный файл: начальное значение
+    генератора и биты управления, привязанные к тикам симуляции.
+
+    Записываются только изменения битов управления (нажатия и отпускания клавиш,
+    выстрелы), а каждые checksum_interval тиков — контрольная сумма состояния.
+    Запись копится в памяти и сохраняется на диск целиком в save.
+
+    Атрибуты:
+        path (str): Путь к файлу записи.
+        seed (int): Начальное значение генератора случайных чисел игры.
+        checksum_interval (int): Период записи контрольных сумм (тики).
+        data (bytearray): Записанные данные.
+        last_inputs (int): Биты управления последнего тика.
+        last_tick (int): Последний записанный тик.
+    """
+
+    def __init__(self, path, seed, use_store=False, checksum_interval=REPLAY_CHECKSUM_INTERVAL, swept=False):
+        """
+        Инициализация объекта Recorder.
+
+        Аргументы:
+            path (str): Путь к файлу записи.
+            seed (int): Начальное значение генератора случайных чисел игры.
+            use_store (bool): Используется ли в игре EntityStore.
+            checksum_interval (int): Период записи контрольных сумм (тики).
+            swept (bool): Проверяются ли в игре столкновения по пути объектов.
+        """
+        self.path = path
+        self.seed = seed
+        self.checksum_interval = checksum_interval
+        flags = (FLAG_ENTITY_STORE if use_store else 0) | (FLAG_SWEPT if swept else 0)
+        self.data = bytearray(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, flags, seed, checksum_interval))
+        self.last_inputs = 0
+        self.last_tick = 0
+
+    def record(self, simulation, inputs):
+        """
+        Записывает тик, только что выполненный симуляцией.
+
+        Аргументы:
+            simulation (Simulation): Симуляция после вызова step(inputs).
+            inputs (int): Биты управления, переданные в step.
+        """
+        tick = simulation.tick
+        if tick == self.last_tick:
+            return  # Симуляция не выполняла тик (игра не запущена)
+        self.last_tick = tick
+        if inputs != self.last_inputs:
+            self.data += INPUT_RECORD.pack(TAG_INPUT, tick, inputs)
+            self.last_inputs = inputs
+        if tick % self.checksum_interval == 0:
+            self.data += CHECKSUM_RECORD.pack(TAG_CHECKSUM, tick, simulation.checksum())
+
+    def save(self, simulation=None):
+        """
+        Сохраняет запись в файл, завершая ее последним тиком.
+
+        Аргументы:
+            simulation (Simulation): Симуляция для контрольной суммы последнего тика (необязательно).
+        """
+        end = END_RECORD.pack(TAG_END, self.last_tick)
+        if simulation is not None and self.last_tick % self.checksum_interval:
+            end = CHECKSUM_RECORD.pack(TAG_CHECKSUM, self.last_tick, simulation.checksum()) + end
+        with open(self.path, "wb") as file:
+            file.write(self.data)
+            file.write(end)
+
+
+class Replay:
+    """
+    Класс Replay воспроизводит запись Recorder: выдает биты управления для каждого тика
+    и сверяет контрольные суммы состояния.
+
+    Атрибуты:
+        seed (int): Начальное значение генератора случайных чисел игры.
+        use_store (bool): Использовался ли при записи EntityStore.
+        swept (bool): Проверялись ли при записи столкновения по пути объектов.
+        checksum_interval (int): Период контрольных сумм (тики).
+        inputs (list): Пары (тик, биты управления) в порядке тиков.
+        checksums (dict): Контрольные суммы по тику.
+        end_tick (int): Последний записанный тик.
+        verified (int): Количество совпавших контрольных сумм.
+    """
+
+    def __init__(self, path):
+        """
+        Загружает запись из файла.
+
+        Аргументы:
+            path (str): Путь к файлу записи.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        magic, version, flags, self.seed, self.checksum_interval = HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"{path} is not a replay file (version {REPLAY_VERSION})")
+        self.use_store = bool(flags & FLAG_ENTITY_STORE)
+        self.swept = bool(flags & FLAG_SWEPT)
+        self.inputs = []
+        self.checksums = {}
+        self.end_tick = None
+
+        offset = HEADER.size
+        while offset < len(data):
+            tag = data[offset]
+            if tag == TAG_INPUT:
+                _, tick, inputs = INPUT_RECORD.unpack_from(data, offset)
+                self.inputs.append((tick, inputs))
+                offset += INPUT_RECORD.size
+            elif tag == TAG_CHECKSUM:
+                _, tick, checksum = CHECKSUM_RECORD.unpack_from(data, offset)
+                self.checksums[tick] = checksum
+                offset += CHECKSUM_RECORD.size
+            elif tag == TAG_END:
+                _, self.end_tick = END_RECORD.unpack_from(data, offset)
+                offset += END_RECORD.size
+            else:
+                raise ValueError(f"corrupt replay record at offset {offset}")
+        if self.end_tick is None:
+            raise ValueError(f"{path} is truncated")
+
+        self.position = 0
+        self.current_inputs = 0
+        self.verified = 0
+
+    def create_simulation(self):
+        """Создает симуляцию с записанным начальным значением генератора."""
+        return Simulation(seed=self.seed, use_store=self.use_store, swept=self.swept)
+
+    def inputs_for(self, tick):
+        """
+        Возвращает биты управления для тика. Тики запрашиваются по возрастанию.
+
+        Аргументы:
+            tick (int): Номер тика, который выполнит симуляция.
+        """
+        while self.position < len(self.inputs) and self.inputs[self.position][0] <= tick:
+            self.current_inputs = self.inputs[self.position][1]
+            self.position += 1
+        return self.current_inputs
+
+    def finished(self, simulation):
+        """Проверяет, что симуляция дошла до конца записи."""
+        return simulation.tick >= self.end_tick or not simulation.running
+
+    def verify(self, simulation):
+        """
+        Сверяет контрольную сумму состояния, если для текущего тика она записана.
+
+        Аргументы:
+            simulation (Simulation): Воспроизводимая симуляция.
+
+        Исключения:
+            ReplayDivergence: Состояние разошлось с записанным.
+        """
+        expected = self.checksums.get(simulation.tick)
+        if expected is None:
+            return
+        actual = simulation.checksum()
+        if actual != expected:
+            raise ReplayDivergence(simulation.tick, expected, actual)
+        self.verified += 1
+
+    def run(self, simulation=None, realtime=False):
+        """
+        Воспроизводит запись без отрисовки.
+
+        Аргументы:
+            simulation (Simulation): Симуляция; по умолчанию создается create_simulation.
+            realtime (bool): Выдерживать частоту TICK_RATE вместо максимальной скорости.
+
+        Возвращает:
+            Simulation: Симуляция после воспроизведения.
+        """
+        simulation = simulation or self.create_simulation()
+        simulation.start()
+        started = time.perf_counter()
+        while not self.finished(simulation):
+            simulation.step(self.inputs_for(simulation.tick + 1))
+            self.verify(simulation)
+            if realtime:
+                delay = started + simulation.tick / TICK_RATE - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+        return simulation
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Воспроизведение записи Asteroids без отрисовки")
+    parser.add_argument("path", help="Файл записи")
+    parser.add_argument("--realtime", action="store_true", help="Воспроизводить с частотой TICK_RATE")
+    args = parser.parse_args()
+
+    replay = Replay(args.path)
+    started = time.perf_counter()
+    simulation = replay.run(realtime=args.realtime)
+    elapsed = time.perf_counter() - started
+    print(f"Ticks: {simulation.tick}, score: {simulation.score}, lives: {simulation.lives}, "
+          f"checksums verified: {replay.verified}, ticks/sec: {simulation.tick / elapsed:.0f}")
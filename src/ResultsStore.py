@@ -0,0 +1,526 @@
+import bisect
+import heapq
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+
+from src.Simulation import Simulation
+from src.config import *
+
+RESULTS_MAGIC = b"ASRS"
+RESULTS_VERSION = 1
+
+# Файл результатов: заголовок, затем записи фиксированного размера в порядке окончания игр
+HEADER = struct.Struct("<4sBxH")  # Сигнатура, версия, размер записи
+RECORD = struct.Struct("<dQIiIIH2x")  # Время окончания, начальное значение генераторов, хеш параметров, счет,
+                                      # длительность (тики), уничтожено астероидов, потеряно жизней
+
+# Индекс рядом с файлом результатов: лучшие записи и итоги по параметрам
+INDEX_MAGIC = b"ASRI"
+INDEX_HEADER = struct.Struct("<4sBxHQHI")  # Сигнатура, версия, вместимость таблицы лучших, учтено записей,
+                                           # записей в таблице лучших, наборов параметров
+TOP_ENTRY = struct.Struct("<iQ")  # Счет, номер записи
+CONFIG_ENTRY = struct.Struct("<IQqiQQQ")  # Хеш параметров, игр, сумма счета, лучший счет, сумма длительностей,
+                                          # сумма уничтоженных астероидов, сумма потерянных жизней
+
+SCAN_CHUNK = 65536  # Записей за одно чтение при полном просмотре файла
+
+
+class GameResult:
+    """
+    Класс GameResult — итог одной игры.
+
+    Атрибуты:
+        timestamp (float): Время окончания игры (секунды с начала эпохи).
+        seed (int): Начальное значение генераторов игры.
+        config_hash (int): Хеш параметров симуляции (см. config_hash).
+        score (int): Итоговый счет.
+        duration (int): Длительность игры (тики).
+        asteroids_destroyed (int): Количество уничтоженных ракетами астероидов.
+        lives_lost (int): Количество потерянных жизней.
+    """
+
+    def __init__(self, timestamp, seed, config_hash, score, duration, asteroids_destroyed, lives_lost):
+        """
+        Инициализация объекта GameResult.
+
+        Аргументы:
+            timestamp (float): Время окончания игры.
+            seed (int): Начальное значение генераторов.
+            config_hash (int): Хеш параметров симуляции.
+            score (int): Итоговый счет.
+            duration (int): Длительность игры (тики).
+            asteroids_destroyed (int): Уничтожено астероидов.
+            lives_lost (int): Потеряно жизней.
+        """
+        self.timestamp = timestamp
+        self.seed = seed
+        self.config_hash = config_hash
+        self.score = score
+        self.duration = duration
+        self.asteroids_destroyed = asteroids_destroyed
+        self.lives_lost = lives_lost
+
+    def pack(self):
+        """Возвращает запись результата для файла."""
+        return RECORD.pack(self.timestamp, self.seed, self.config_hash, self.score, self.duration,
+                           self.asteroids_destroyed, self.lives_lost)
+
+
+def config_hash(sim):
+    """
+    Вычисляет хеш параметров симуляции (Simulation.PARAMETERS), с которыми шла игра,
+    чтобы сравнивать результаты только игр с одинаковыми правилами.
+
+    Аргументы:
+        sim (Simulation): Симуляция.
+
+    Возвращает:
+        int: CRC32 параметров.
+    """
+    values = [float(getattr(sim, Simulation.PARAMETERS[name])) for name in sorted(Simulation.PARAMETERS)]
+    return zlib.crc32(struct.pack(f"<{len(values)}d", *values))
+
+
+def game_result(sim, seed, timestamp=None):
+    """
+    Собирает итог законченной игры.
+
+    Аргументы:
+        sim (Simulation): Симуляция после окончания игры.
+        seed (int): Начальное значение генераторов игры.
+        timestamp (float): Время окончания (по умолчанию текущее).
+
+    Возвращает:
+        GameResult: Итог игры.
+    """
+    return GameResult(
+        time.time() if timestamp is None else timestamp, seed, config_hash(sim), sim.score, sim.tick,
+        sim.score - INITIAL_SCORE,  # Каждое попадание ракеты дает одно очко
+        max(0, LIVES - sim.lives),
+    )
+
+
+class ConfigStats:
+    """
+    Класс ConfigStats — итоги игр с одним набором параметров.
+
+    Атрибуты:
+        games (int): Количество игр.
+        score_sum (int): Сумма счета.
+        best_score (int): Лучший счет.
+        duration_sum (int): Сумма длительностей (тики).
+        destroyed_sum (int): Сумма уничтоженных астероидов.
+        lives_lost_sum (int): Сумма потерянных жизней.
+    """
+
+    def __init__(self, games=0, score_sum=0, best_score=0, duration_sum=0, destroyed_sum=0, lives_lost_sum=0):
+        """
+        Инициализация объекта ConfigStats.
+
+        Аргументы:
+            games (int): Количество игр.
+            score_sum (int): Сумма счета.
+            best_score (int): Лучший счет.
+            duration_sum (int): Сумма длительностей.
+            destroyed_sum (int): Сумма уничтоженных астероидов.
+            lives_lost_sum (int): Сумма потерянных жизней.
+        """
+        self.games = games
+        self.score_sum = score_sum
+        self.best_score = best_score
+        self.duration_sum = duration_sum
+        self.destroyed_sum = destroyed_sum
+        self.lives_lost_sum = lives_lost_sum
+
+    def add(self, result):
+        """Учитывает результат игры."""
+        if not self.games or result.score > self.best_score:
+            self.best_score = result.score
+        self.games += 1
+        self.score_sum += result.score
+        self.duration_sum += result.duration
+        self.destroyed_sum += result.asteroids_destroyed
+        self.lives_lost_sum += result.lives_lost
+
+    @property
+    def mean_score(self):
+        """Средний счет."""
+        return self.score_sum / self.games if self.games else 0.0
+
+    @property
+    def mean_duration(self):
+        """Средняя длительность игры (секунды)."""
+        return self.duration_sum / self.games / TICK_RATE if self.games else 0.0
+
+
+class ResultsStore:
+    """
+    Класс ResultsStore — хранилище результатов игр: файл, в который записи только дописываются.
+
+    Записи имеют фиксированный размер, поэтому запись с номером n лежит по смещению
+    HEADER.size + n * RECORD.size и читается через mmap без просмотра файла. Рядом лежит
+    небольшой индекс (файл с суффиксом ".idx"): номера top_size записей с лучшим счетом
+    и итоги по каждому набору параметров, а также количество учтенных записей. Таблица
+    лучших и статистика читаются из индекса; если записей больше, чем учтено (например,
+    индекс не успели сохранить), учитываются только недостающие записи в конце файла.
+    Индекс перезаписывается целиком через временный файл, поэтому всегда цел.
+
+    Хранилищем пользуется один поток (см. ResultsWriter).
+
+    Атрибуты:
+        path (str): Путь к файлу результатов.
+        index_path (str): Путь к индексу.
+        top_size (int): Количество лучших записей в индексе.
+        count (int): Количество записей.
+        top (list): Лучшие записи: пары (минус счет, номер записи) по возрастанию.
+        configs (dict): Итоги ConfigStats по хешу параметров.
+        indexed (int): Количество записей, учтенных в индексе.
+    """
+
+    def __init__(self, path=RESULTS_PATH, top_size=RESULTS_INDEX_TOP):
+        """
+        Инициализация объекта ResultsStore. Открывает (или создает) файл результатов и загружает индекс.
+
+        Аргументы:
+            path (str): Путь к файлу результатов.
+            top_size (int): Количество лучших записей в индексе.
+        """
+        self.path = path
+        self.index_path = path + ".idx"
+        self.top_size = top_size
+        self.file = open(path, "a+b")  # Запись всегда идет в конец файла
+        self.map = None
+        size = os.fstat(self.file.fileno()).st_size
+        if size == 0:
+            self.file.write(HEADER.pack(RESULTS_MAGIC, RESULTS_VERSION, RECORD.size))
+            self.file.flush()
+            size = HEADER.size
+        else:
+            self.file.seek(0)
+            magic, version, record_size = HEADER.unpack(self.file.read(HEADER.size))
+            if magic != RESULTS_MAGIC or version != RESULTS_VERSION or record_size != RECORD.size:
+                self.file.close()
+                raise ValueError(f"{path} is not a results file of version {RESULTS_VERSION}")
+        self.count, partial = divmod(size - HEADER.size, RECORD.size)
+        if partial:
+            self.file.truncate(size - partial)  # Последняя запись не дописана (сбой во время записи)
+
+        self.top = []
+        self.configs = {}
+        self.indexed = 0
+        if not self.load_index():
+            self.top = []
+            self.configs = {}
+            self.indexed = 0
+        if self.indexed < self.count:
+            for number, result in enumerate(self.records(self.indexed), self.indexed):
+                self.add_to_index(number, result)
+            self.indexed = self.count
+            self.save_index()
+
+    def load_index(self):
+        """
+        Загружает индекс.
+
+        Возвращает:
+            bool: True, если индекс прочитан и соответствует файлу результатов.
+        """
+        try:
+            with open(self.index_path, "rb") as file:
+                data = file.read()
+            magic, version, top_size, indexed, top_count, config_count = INDEX_HEADER.unpack_from(data)
+        except (OSError, struct.error):
+            return False
+        expected = INDEX_HEADER.size + top_count * TOP_ENTRY.size + config_count * CONFIG_ENTRY.size
+        if (magic != INDEX_MAGIC or version != RESULTS_VERSION or top_size != self.top_size
+                or indexed > self.count or len(data) != expected):
+            return False
+        offset = INDEX_HEADER.size
+        for score, number in TOP_ENTRY.iter_unpack(data[offset:offset + top_count * TOP_ENTRY.size]):
+            self.top.append((-score, number))
+        offset += top_count * TOP_ENTRY.size
+        for key, *values in CONFIG_ENTRY.iter_unpack(data[offset:]):
+            self.configs[key] = ConfigStats(*values)
+        self.indexed = indexed
+        return True
+
+    def save_index(self):
+        """Сохраняет индекс через временный файл."""
+        out = bytearray(INDEX_HEADER.pack(INDEX_MAGIC, RESULTS_VERSION, self.top_size, self.indexed,
+                                          len(self.top), len(self.configs)))
+        for score, number in self.top:
+            out += TOP_ENTRY.pack(-score, number)
+        for key, stats in self.configs.items():
+            out += CONFIG_ENTRY.pack(key, stats.games, stats.score_sum, stats.best_score, stats.duration_sum,
+                                     stats.destroyed_sum, stats.lives_lost_sum)
+        temporary = self.index_path + ".tmp"
+        with open(temporary, "wb") as file:
+            file.write(out)
+        os.replace(temporary, self.index_path)
+
+    def rebuild_index(self):
+        """Строит индекс заново просмотром всего файла."""
+        self.top = []
+        self.configs = {}
+        for number, result in enumerate(self.records()):
+            self.add_to_index(number, result)
+        self.indexed = self.count
+        self.save_index()
+
+    def add_to_index(self, number, result):
+        """Учитывает запись в таблице лучших и в итогах по параметрам."""
+        stats = self.configs.get(result.config_hash)
+        if stats is None:
+            stats = self.configs[result.config_hash] = ConfigStats()
+        stats.add(result)
+        top = self.top
+        entry = (-result.score, number)
+        if len(top) < self.top_size or entry < top[-1]:
+            bisect.insort(top, entry)
+            if len(top) > self.top_size:
+                top.pop()
+
+    def append(self, result):
+        """
+        Дописывает результат игры. Индекс сохраняется отдельно (save_index).
+
+        Аргументы:
+            result (GameResult): Результат.
+
+        Возвращает:
+            int: Номер записи.
+        """
+        self.extend([result])
+        return self.count - 1
+
+    def extend(self, results):
+        """
+        Дописывает несколько результатов одной записью в файл. Индекс сохраняется отдельно (save_index).
+
+        Аргументы:
+            results (list): Результаты GameResult.
+        """
+        self.file.write(b"".join(result.pack() for result in results))
+        self.file.flush()
+        for result in results:
+            self.add_to_index(self.count, result)
+            self.count += 1
+        self.indexed = self.count
+
+    def mapped(self, end):
+        """Возвращает отображение файла в память, покрывающее первые end байт (отображает заново при росте)."""
+        if self.map is None or len(self.map) < end:
+            if self.map is not None:
+                self.map.close()
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self.map
+
+    def record(self, number):
+        """
+        Читает запись по номеру.
+
+        Аргументы:
+            number (int): Номер записи (0..count - 1).
+
+        Возвращает:
+            GameResult: Результат.
+        """
+        if not 0 <= number < self.count:
+            raise IndexError(f"record {number} out of range 0..{self.count - 1}")
+        offset = HEADER.size + number * RECORD.size
+        return GameResult(*RECORD.unpack_from(self.mapped(offset + RECORD.size), offset))
+
+    def records(self, start=0, stop=None):
+        """
+        Перебирает записи по порядку, читая файл кусками по SCAN_CHUNK записей.
+
+        Аргументы:
+            start (int): Номер первой записи.
+            stop (int): Номер записи после последней (по умолчанию до конца).
+        """
+        stop = self.count if stop is None else min(stop, self.count)
+        if start >= stop:
+            return
+        data = self.mapped(HEADER.size + stop * RECORD.size)
+        for first in range(start, stop, SCAN_CHUNK):
+            last = min(first + SCAN_CHUNK, stop)
+            chunk = data[HEADER.size + first * RECORD.size:HEADER.size + last * RECORD.size]
+            for values in RECORD.iter_unpack(chunk):
+                yield GameResult(*values)
+
+    def top_results(self, count=RESULTS_LEADERBOARD_SIZE):
+        """
+        Возвращает лучшие результаты по счету (при равенстве — более ранние).
+
+        Пока count не больше top_size, читаются только записи из индекса; иначе
+        просматривается весь файл.
+
+        Аргументы:
+            count (int): Количество результатов.
+
+        Возвращает:
+            list: Результаты GameResult по убыванию счета.
+        """
+        if count <= self.top_size or len(self.top) == self.count:
+            return [self.record(number) for _, number in self.top[:count]]
+        best = heapq.nsmallest(count, ((-result.score, number) for number, result in enumerate(self.records())))
+        return [self.record(number) for _, number in best]
+
+    def stats(self, key=None):
+        """
+        Возвращает итоги игр с набором параметров key (см. config_hash) или итоги по всем наборам.
+
+        Возвращает:
+            ConfigStats | dict: Итоги набора (None, если игр не было) или словарь итогов по хешу.
+        """
+        if key is None:
+            return dict(self.configs)
+        return self.configs.get(key)
+
+    def close(self):
+        """Закрывает файл результатов."""
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        self.file.close()
+
+
+class ResultsWriter:
+    """
+    Класс ResultsWriter дописывает результаты игр в ResultsStore в фоновом потоке,
+    чтобы запись на диск не задерживала поток Tk.
+
+    Поток открывает хранилище (при необходимости догоняя индекс), публикует таблицу
+    лучших результатов и ждет новых результатов. Накопившиеся результаты дописываются
+    одной записью, после чего сохраняется индекс и обновляется таблица.
+
+    Атрибуты:
+        path (str): Путь к файлу результатов.
+        leaderboard_size (int): Размер таблицы лучших результатов.
+        queue (queue.Queue): Результаты, ожидающие записи (None — остановить поток).
+        ready (threading.Event): Устанавливается, когда таблица прочитана (или открыть хранилище не удалось).
+        leaderboard (list): Лучшие результаты GameResult (None до чтения).
+        error (Exception): Ошибка открытия или записи хранилища (None, если ошибок нет).
+        written (int): Количество записанных результатов.
+        thread (threading.Thread): Фоновый поток (None до запуска).
+    """
+
+    def __init__(self, path=RESULTS_PATH, leaderboard_size=RESULTS_LEADERBOARD_SIZE):
+        """
+        Инициализация объекта ResultsWriter.
+
+        Аргументы:
+            path (str): Путь к файлу результатов.
+            leaderboard_size (int): Размер таблицы лучших результатов.
+        """
+        self.path = path
+        self.leaderboard_size = leaderboard_size
+        self.queue = queue.Queue()
+        self.ready = threading.Event()
+        self.leaderboard = None
+        self.error = None
+        self.written = 0
+        self.thread = None
+
+    def start(self):
+        """Запускает фоновый поток."""
+        self.thread = threading.Thread(target=self.run, name="results-writer", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        """Тело фонового потока."""
+        try:
+            store = ResultsStore(self.path)
+            self.leaderboard = store.top_results(self.leaderboard_size)
+        except (OSError, ValueError) as error:
+            self.error = error
+            return
+        finally:
+            self.ready.set()
+
+        try:
+            stopping = False
+            while not stopping:
+                batch = [self.queue.get()]
+                while True:
+                    try:
+                        batch.append(self.queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if None in batch:
+                    stopping = True
+                    batch = [result for result in batch if result is not None]
+                if batch:
+                    store.extend(batch)
+                    store.save_index()
+                    self.leaderboard = store.top_results(self.leaderboard_size)
+                    self.written += len(batch)
+        except OSError as error:
+            self.error = error
+        finally:
+            store.close()
+
+    def submit(self, result):
+        """
+        Ставит результат в очередь на запись (не блокирует).
+
+        Аргументы:
+            result (GameResult): Результат игры.
+        """
+        self.queue.put(result)
+
+    def close(self):
+        """Дописывает результаты из очереди и останавливает поток."""
+        if self.thread is None:
+            return
+        self.queue.put(None)
+        self.thread.join()
+        self.thread = None
+
+
+def format_leaderboard(results):
+    """
+    Форматирует таблицу лучших результатов для стартового экрана.
+
+    Аргументы:
+        results (list): Результаты GameResult по убыванию счета.
+
+    Возвращает:
+        str: Текст таблицы.
+    """
+    if not results:
+        return "No games played yet"
+    lines = [f"TOP {len(results)}"]
+    for rank, result in enumerate(results, 1):
+        played = time.strftime("%Y-%m-%d", time.localtime(result.timestamp))
+        lines.append(f"{rank:>2}. {result.score:>6}  {result.duration / TICK_RATE:>6.1f}s  {played}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Таблица лучших результатов и статистика по параметрам")
+    parser.add_argument("path", nargs="?", default=RESULTS_PATH, help="Файл результатов")
+    parser.add_argument("--top", type=int, default=RESULTS_LEADERBOARD_SIZE, help="Размер таблицы")
+    parser.add_argument("--stats", action="store_true", help="Вывести итоги по наборам параметров")
+    parser.add_argument("--rebuild-index", action="store_true", help="Построить индекс заново")
+    args = parser.parse_args()
+
+    results_store = ResultsStore(args.path)
+    if args.rebuild_index:
+        results_store.rebuild_index()
+    print(f"{results_store.count} game(s)")
+    print(format_leaderboard(results_store.top_results(args.top)))
+    if args.stats:
+        print(f"{'config':>10}{'games':>10}{'mean':>10}{'best':>8}{'seconds':>10}{'destroyed':>11}{'lives':>7}")
+        for key, config in sorted(results_store.stats().items(), key=lambda item: -item[1].games):
+            print(f"{key:>10x}{config.games:>10}{config.mean_score:>10.1f}{config.best_score:>8}"
+                  f"{config.mean_duration:>10.1f}{config.destroyed_sum / config.games:>11.1f}"
+                  f"{config.lives_lost_sum / config.games:>7.2f}")
+    results_store.close()
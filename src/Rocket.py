@@ -1,16 +1,17 @@
 import math
-from PIL import Image, ImageTk
-import os
+
+from src.EntityStore import FLAG_EXPIRED, FLAG_MORTAL, store_view
 from src.config import *
 
 
 class Rocket:
     """
     Класс Rocket представляет ракету, которая движется в заданном направлении
-    с ограниченным временем жизни.
+    с ограниченным временем жизни. Класс хранит только состояние симуляции;
+    отрисовкой занимается Game.
 
     Атрибуты:
-        canvas (Canvas): Холст для отображения ракеты.
+        id (int): Идентификатор ракеты, назначаемый симуляцией.
         x (float): Текущая координата x ракеты.
         y (float): Текущая координата y ракеты.
         angle (float): Угол направления движения ракеты в градусах.
@@ -18,21 +19,36 @@ class Rocket:
         velocity_y (float): Скорость ракеты по оси y.
         lifetime (int): Время жизни ракеты в кадрах.
         expired (bool): Флаг, указывающий, истекло ли время жизни ракеты.
-        image (ImageTk.PhotoImage): Изображение ракеты.
-        sprite_id (int): Идентификатор спрайта ракеты на холсте.
+        store (EntityStore): Хранилище, в строке которого лежит состояние (None — в самом объекте).
+        row (int): Номер строки в хранилище.
+        owner (int): Номер игрока, выпустившего ракету, в сетевой игре (None — в одиночной).
     """
 
-    def __init__(self, canvas, x, y, angle):
+    store = None
+    row = None
+    owner = None
+
+    def __init__(self, x, y, angle):
         """
         Инициализация объекта Rocket.
 
         Аргументы:
-            canvas (Canvas): Холст для отрисовки ракеты.
             x (float): Начальная координата x.
             y (float): Начальная координата y.
             angle (float): Угол движения ракеты в градусах.
         """
-        self.canvas = canvas
+        self.id = None
+        self.reset(x, y, angle)
+
+    def reset(self, x, y, angle):
+        """
+        Заново инициализирует ракету для повторного использования (см. RingPool).
+
+        Аргументы:
+            x (float): Начальная координата x.
+            y (float): Начальная координата y.
+            angle (float): Угол движения ракеты в градусах.
+        """
         self.x = x
         self.y = y
         self.angle = angle
@@ -41,28 +57,37 @@ class Rocket:
         self.lifetime = ROCKET_LIFETIME
         self.expired = False
 
-        # Загрузка и вращение изображения ракеты
-        original_rocket_image = Image.open(os.path.join(SPRITE_FOLDER, "rocket.png"))
-        rotated_image = original_rocket_image.rotate(angle)
-        self.image = ImageTk.PhotoImage(rotated_image)
+    def update(self, dt=1):
+        """
+        Обновляет положение ракеты и проверяет её время жизни. Шаг в несколько тиков
+        выполняется по тикам, чтобы координаты точно совпадали с пошаговым прогоном.
 
-        # Создание спрайта на холсте
-        self.sprite_id = self.canvas.create_image(self.x, self.y, image=self.image)
+        Если ракета привязана к EntityStore, позиция и время жизни уже обновлены хранилищем.
 
-    def update(self):
-        """
-        Обновляет положение ракеты, проверяет её время жизни и удаляет с холста, если срок истёк.
+        Аргументы:
+            dt (int): Длительность шага в тиках.
         """
-        # Обновление позиции с учётом границ экрана
-        self.x = (self.x + self.velocity_x) % SCREEN_WIDTH
-        self.y = (self.y + self.velocity_y) % SCREEN_HEIGHT
-        self.canvas.coords(self.sprite_id, self.x, self.y)
-
-        # Уменьшение времени жизни
-        self.lifetime -= 1
-
-        # Проверка истечения времени жизни
-        if self.lifetime <= 0:
-            self.expired = True
-            self.canvas.delete(self.sprite_id)
+        if self.store is None:
+            # Обновление позиции с учётом границ экрана
+            x, y = self.x, self.y
+            for _ in range(dt):
+                x = (x + self.velocity_x) % SCREEN_WIDTH
+                y = (y + self.velocity_y) % SCREEN_HEIGHT
+            self.x, self.y = x, y
+
+            # Уменьшение времени жизни
+            self.lifetime -= dt
+
+            # Проверка истечения времени жизни
+            if self.lifetime <= 0:
+                self.expired = True
+
+
+# Ракета, состояние которой хранится в строке EntityStore
+RocketView = store_view(
+    Rocket,
+    ("x", "y", "velocity_x", "velocity_y", "angle", "lifetime"),
+    {"expired": FLAG_EXPIRED},
+    row_flags=FLAG_MORTAL,
+)
 
@@ -0,0 +1,158 @@
+from collections import OrderedDict
+
+from src.config import *
+
+
+class RotationCache:
+    """
+    Класс RotationCache хранит заранее повернутые кадры спрайтов, общие для всех объектов.
+
+    Кадры строятся лениво при первом запросе и ключуются по имени спрайта, размеру
+    и квантованному углу. Общий объем кадров ограничен бюджетом памяти: при его
+    превышении вытесняются давно не использованные кадры (LRU).
+
+    Атрибуты:
+        budget (int): Бюджет памяти кэша в байтах.
+        used (int): Текущий объем памяти, занятый кадрами, в байтах.
+        hits (int): Количество запросов, обслуженных из кэша.
+        misses (int): Количество запросов, потребовавших построения нового кадра.
+        evictions (int): Количество вытесненных кадров.
+        frames (OrderedDict): Кадры кэша в порядке последнего использования.
+    """
+
+    def __init__(self, budget=ROTATION_CACHE_BUDGET):
+        """
+        Инициализация объекта RotationCache.
+
+        Аргументы:
+            budget (int): Бюджет памяти кэша в байтах.
+        """
+        self.budget = budget
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.frames = OrderedDict()
+
+    @staticmethod
+    def quantize(angle, step):
+        """
+        Квантует угол до ближайшего кратного шагу значения.
+
+        Аргументы:
+            angle (float): Угол в градусах.
+            step (float): Шаг квантования в градусах.
+
+        Возвращает:
+            int: Номер кадра в диапазоне [0, 360 / step).
+        """
+        return int(round(angle / step)) % int(round(360 / step))
+
+    def get_frame(self, image, sprite_key, angle, step=ASTEROID_ROTATION_STEP):
+        """
+        Возвращает повернутый кадр спрайта, строя его при необходимости.
+
+        Аргументы:
+            image (PIL.Image): Исходное (уже масштабированное) изображение спрайта.
+            sprite_key (str): Имя спрайта, по которому различаются изображения.
+            angle (float): Угол поворота в градусах.
+            step (float): Шаг квантования угла в градусах.
+
+        Возвращает:
+            ImageTk.PhotoImage: Повернутый кадр.
+        """
+        key = self.frame_key(image, sprite_key, angle, step)
+        frame = self.frames.get(key)
+        if frame is not None:
+            self.hits += 1
+            self.frames.move_to_end(key)
+            return frame
+
+        self.misses += 1
+        return self.add_frame(key, self.rotate(image, key))
+
+    def frame_key(self, image, sprite_key, angle, step=ASTEROID_ROTATION_STEP):
+        """Возвращает ключ кадра: (спрайт, размер, шаг, номер квантованного угла)."""
+        return sprite_key, image.size, step, self.quantize(angle, step)
+
+    @staticmethod
+    def rotate(image, key):
+        """
+        Поворачивает изображение на угол кадра. Не обращается к Tk, поэтому
+        может выполняться в фоновом потоке (см. Preloader).
+
+        Аргументы:
+            image (PIL.Image): Исходное (уже масштабированное) изображение спрайта.
+            key (tuple): Ключ кадра (см. frame_key).
+
+        Возвращает:
+            PIL.Image: Повернутое изображение.
+        """
+        from PIL import Image  # PIL импортируется при первой загрузке, а не при старте игры
+
+        sprite_key, size, step, index = key
+        return image.rotate(index * step, resample=Image.Resampling.BICUBIC)
+
+    def add_frame(self, key, rotated_image):
+        """
+        Создает PhotoImage повернутого изображения и добавляет его в кэш.
+        Вызывается только из потока Tk.
+
+        Аргументы:
+            key (tuple): Ключ кадра (см. frame_key).
+            rotated_image (PIL.Image): Повернутое изображение.
+
+        Возвращает:
+            ImageTk.PhotoImage: Кадр.
+        """
+        from PIL import ImageTk
+
+        frame = ImageTk.PhotoImage(rotated_image)
+        self.frames[key] = frame
+        self.used += self.frame_size(rotated_image)
+        self.evict()
+        return frame
+
+    @staticmethod
+    def frame_size(image):
+        """Оценивает объем памяти одного кадра в байтах (RGBA)."""
+        width, height = image.size
+        return width * height * 4
+
+    def evict(self):
+        """Вытесняет давно не использованные кадры, пока кэш превышает бюджет."""
+        # Последний добавленный кадр не вытесняется, даже если он один больше бюджета
+        while self.used > self.budget and len(self.frames) > 1:
+            (sprite_key, (width, height), step, index), frame = self.frames.popitem(last=False)
+            self.used -= width * height * 4
+            self.evictions += 1
+
+    def clear(self):
+        """Очищает кэш и сбрасывает счетчики."""
+        self.frames.clear()
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        """
+        Возвращает статистику работы кэша.
+
+        Возвращает:
+            dict: Счетчики попаданий, промахов, вытеснений и занятую память.
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+            "frames": len(self.frames),
+            "used_bytes": self.used,
+            "budget_bytes": self.budget,
+        }
+
+
+# Общий кэш повернутых кадров для всех объектов игры
+rotation_cache = RotationCache()
@@ -0,0 +1,308 @@
+import struct
+import time
+from collections import deque
+
+from src.ObjectPool import RingPool
+from src.Ship import Ship
+from src.Simulation import Simulation, rocket_finished
+from src.config import *
+
+STATE_MAGIC = b"ASTS"
+STATE_VERSION = 2
+
+# Заголовок: сигнатура, версия, флаги, тиков за шаг, тик, жизни, счет, попадания, последний идентификатор,
+# тик последнего выстрела, параметры симуляции (MIN_ASTEROIDS, MAX_ASTEROIDS, ASTEROID_SPAWN_INTERVAL,
+# ROCKET_FIRE_COOLDOWN, ASTEROID_SPEED, ROCKET_LIFETIME, SHIP_THRUST), вместимость и очередной слот
+# кольцевого буфера ракет, количество астероидов и ракет
+HEADER = struct.Struct("<4sBBHqqqqqqqqqqdddHHHH")
+FLAG_RUNNING = 1  # Игра идет
+FLAG_GAME_OVER = 2  # Жизни кончились, доигрываются взрывы
+FLAG_FINISHED = 4  # Игра завершена
+FLAG_SHIP = 8  # Есть корабль
+FLAG_SHOT = 16  # Был выстрел (тик последнего выстрела задан)
+FLAG_SWEPT = 32  # Проверка столкновений по пути объектов
+
+# Генератор случайных чисел: версия, есть ли сохраненное значение gauss, само значение, затем внутреннее состояние
+RNG_HEADER = struct.Struct("<B?d")
+RNG_STATE = struct.Struct("<625I")
+SHIP = struct.Struct("<6d?")  # x, y, угол, скорость x, скорость y, ускорение, тяга
+ASTEROID = struct.Struct("<q6dHiB")  # Идентификатор, x, y, скорость x, скорость y, угол, скорость вращения,
+                                     # радиус, таймер взрыва, флаги
+ROCKET = struct.Struct("<q6dH")  # Идентификатор, x, y, угол, скорость x, скорость y, время жизни, слот буфера
+ASTEROID_EXPLODING = 1
+ASTEROID_DESTROYED = 2
+
+
+def save_state(sim):
+    """
+    Упаковывает состояние одиночной игры в компактный двоичный буфер.
+
+    Сохраняется только состояние симуляции: счет, попадания, жизни, корабль, астероиды и ракеты
+    с точными координатами, скоростями, углами и таймерами, параметры, слоты кольцевого
+    буфера ракет и состояние генератора случайных чисел. Поэтому игра, восстановленная
+    из буфера, продолжается так же, как продолжилась бы исходная (совпадают контрольные суммы).
+    Элементы холста и изображения не сохраняются: их заново создает способ отрисовки.
+
+    Аргументы:
+        sim (Simulation): Симуляция (сетевая игра не поддерживается).
+
+    Возвращает:
+        bytes: Состояние (несколько КБ).
+    """
+    if hasattr(sim, "players"):
+        raise ValueError("multiplayer simulations can not be saved")
+    ship = sim.ship
+    flags = ((FLAG_RUNNING if sim.running else 0) | (FLAG_GAME_OVER if sim.game_over_in_progress else 0)
+             | (FLAG_FINISHED if sim.finished else 0) | (FLAG_SHIP if ship is not None else 0)
+             | (FLAG_SHOT if sim.last_shot_tick is not None else 0) | (FLAG_SWEPT if sim.swept else 0))
+    pool = sim.rocket_pool
+    out = bytearray(HEADER.pack(
+        STATE_MAGIC, STATE_VERSION, flags, sim.dt, sim.tick, sim.lives, sim.score, sim.hits, sim.next_id,
+        sim.last_shot_tick or 0, sim.min_asteroids, sim.max_asteroids, sim.spawn_interval, sim.fire_cooldown,
+        sim.asteroid_speed, sim.rocket_lifetime, sim.ship_thrust, len(pool.slots), pool.head,
+        len(sim.asteroids), len(sim.rockets)
+    ))
+
+    version, internal, gauss = sim.rng.getstate()
+    out += RNG_HEADER.pack(version, gauss is not None, gauss or 0.0)
+    out += RNG_STATE.pack(*internal)
+    if ship is not None:
+        out += SHIP.pack(ship.x, ship.y, ship.angle, ship.velocity_x, ship.velocity_y, ship.thrust, ship.thrusting)
+
+    for asteroid in sim.asteroids:
+        out += ASTEROID.pack(
+            asteroid.id, asteroid.x, asteroid.y, asteroid.velocity_x, asteroid.velocity_y, asteroid.angle,
+            asteroid.angular_speed, int(asteroid.radius), int(asteroid.explosion_timer),
+            (ASTEROID_EXPLODING if asteroid.exploding else 0) | (ASTEROID_DESTROYED if asteroid.destroyed else 0)
+        )
+    slots = {rocket: index for index, rocket in enumerate(pool.slots) if rocket is not None}
+    for rocket in sim.rockets:
+        out += ROCKET.pack(rocket.id, rocket.x, rocket.y, rocket.angle, rocket.velocity_x, rocket.velocity_y,
+                           rocket.lifetime, slots[rocket])
+    return bytes(out)
+
+
+def load_state(data, sim=None):
+    """
+    Восстанавливает состояние, сохраненное save_state.
+
+    Состояние загружается в переданную симуляцию на месте: ее астероиды возвращаются в пул,
+    а восстановленные объекты берутся из пулов, поэтому способ отрисовки повторно использует
+    уже созданные элементы холста. Хранилища NumPy остаются такими, какими были у симуляции.
+
+    Аргументы:
+        data (bytes): Состояние.
+        sim (Simulation): Симуляция, в которую загружается состояние (None — создать новую).
+
+    Возвращает:
+        Simulation: Симуляция с восстановленным состоянием.
+    """
+    (magic, version, flags, dt, tick, lives, score, hits, next_id, last_shot_tick, min_asteroids, max_asteroids,
+     spawn_interval, fire_cooldown, asteroid_speed, rocket_lifetime, ship_thrust, capacity, head,
+     asteroid_count, rocket_count) = HEADER.unpack_from(data)
+    if magic != STATE_MAGIC:
+        raise ValueError("not a saved game state")
+    if version != STATE_VERSION:
+        raise ValueError(f"unsupported game state version {version}")
+    swept = bool(flags & FLAG_SWEPT)
+    if sim is None:
+        sim = Simulation(rocket_capacity=capacity, dt=dt, swept=swept)
+    clear_objects(sim)
+
+    sim.dt = dt
+    sim.swept = swept
+    sim.tick = tick
+    sim.lives = lives
+    sim.score = score
+    sim.hits = hits
+    sim.next_id = next_id
+    sim.last_shot_tick = last_shot_tick if flags & FLAG_SHOT else None
+    sim.running = bool(flags & FLAG_RUNNING)
+    sim.game_over_in_progress = bool(flags & FLAG_GAME_OVER)
+    sim.finished = bool(flags & FLAG_FINISHED)
+    sim.min_asteroids = min_asteroids
+    sim.max_asteroids = max_asteroids
+    sim.spawn_interval = spawn_interval
+    sim.fire_cooldown = fire_cooldown
+    sim.asteroid_speed = asteroid_speed
+    sim.rocket_lifetime = int(rocket_lifetime) if rocket_lifetime.is_integer() else rocket_lifetime
+    sim.ship_thrust = ship_thrust
+    offset = HEADER.size
+
+    rng_version, has_gauss, gauss = RNG_HEADER.unpack_from(data, offset)
+    offset += RNG_HEADER.size
+    internal = RNG_STATE.unpack_from(data, offset)
+    offset += RNG_STATE.size
+
+    if flags & FLAG_SHIP:
+        ship = sim.ship or Ship(0, 0)  # Тот же корабль остается с тем же спрайтом
+        (ship.x, ship.y, ship.angle, ship.velocity_x, ship.velocity_y, ship.thrust,
+         ship.thrusting) = SHIP.unpack_from(data, offset)
+        offset += SHIP.size
+        sim.ship = ship
+    else:
+        sim.ship = None
+
+    # Астероиды берутся из пула; случайные размер и вращение, выбранные при выдаче,
+    # сразу заменяются сохраненными, а состояние генератора восстанавливается в конце
+    for _ in range(asteroid_count):
+        (entity, x, y, velocity_x, velocity_y, angle, angular_speed, radius, explosion_timer,
+         state) = ASTEROID.unpack_from(data, offset)
+        offset += ASTEROID.size
+        asteroid = sim.asteroid_pool.acquire(x, y, velocity_x, velocity_y, sim.rng)
+        if sim.asteroid_store is None:
+            sim.asteroids.append(asteroid)
+        asteroid.id = entity
+        asteroid.angle = angle
+        asteroid.angular_speed = angular_speed
+        asteroid.radius = radius
+        asteroid.explosion_timer = explosion_timer
+        asteroid.exploding = bool(state & ASTEROID_EXPLODING)
+        asteroid.destroyed = bool(state & ASTEROID_DESTROYED)
+
+    # Ракеты занимают те же слоты кольцевого буфера, что и при сохранении: от этого
+    # зависит, будет ли отказано в следующих выстрелах
+    pool = sim.rocket_pool
+    if len(pool.slots) != capacity:
+        pool = sim.rocket_pool = RingPool(pool.factory, capacity, rocket_finished)
+    for _ in range(rocket_count):
+        entity, x, y, angle, velocity_x, velocity_y, lifetime, slot = ROCKET.unpack_from(data, offset)
+        offset += ROCKET.size
+        rocket = pool.slots[slot]
+        if rocket is None:
+            rocket = pool.slots[slot] = pool.factory(x, y, angle)
+        else:
+            rocket.reset(x, y, angle)
+        if sim.rocket_store is None:
+            sim.rockets.append(rocket)
+        rocket.id = entity
+        rocket.velocity_x = velocity_x
+        rocket.velocity_y = velocity_y
+        rocket.lifetime = int(lifetime) if lifetime.is_integer() else lifetime
+    pool.head = head
+
+    sim.rng.setstate((rng_version, internal, gauss if has_gauss else None))
+    return sim
+
+
+def clear_objects(sim):
+    """Убирает из симуляции астероиды (возвращая их в пул) и ракеты (освобождая их слоты)."""
+    for rocket in sim.rockets:
+        rocket.expired = True
+    asteroids = list(sim.asteroids)
+    if sim.asteroid_store is not None:
+        sim.asteroid_store.clear()
+        sim.rocket_store.clear()
+    sim.asteroids.clear()
+    sim.rockets.clear()
+    for asteroid in asteroids:
+        sim.asteroid_pool.release(asteroid)
+
+
+def write_state(path, sim):
+    """Сохраняет состояние симуляции в файл."""
+    with open(path, "wb") as file:
+        file.write(save_state(sim))
+
+
+def read_state(path, sim=None):
+    """Загружает состояние из файла (см. load_state)."""
+    with open(path, "rb") as file:
+        return load_state(file.read(), sim)
+
+
+class RewindBuffer:
+    """
+    Класс RewindBuffer — кольцо состояний последних секунд игры для перемотки назад.
+
+    Состояние сохраняется раз в interval тиков; самые старые вытесняются новыми.
+
+    Атрибуты:
+        interval (int): Период сохранения состояний (тики).
+        states (collections.deque): Пары (тик, состояние) в порядке тиков.
+    """
+
+    def __init__(self, seconds=REWIND_SECONDS, interval=REWIND_INTERVAL):
+        """
+        Инициализация объекта RewindBuffer.
+
+        Аргументы:
+            seconds (float): Сколько секунд игры хранится.
+            interval (int): Период сохранения состояний (тики).
+        """
+        self.interval = interval
+        self.states = deque(maxlen=max(1, int(seconds * TICK_RATE / interval)))
+
+    def record(self, sim):
+        """
+        Сохраняет состояние, если с предыдущего прошло не меньше interval тиков.
+
+        Аргументы:
+            sim (Simulation): Симуляция после тика.
+        """
+        states = self.states
+        if states and states[-1][0] > sim.tick:
+            states.clear()  # Началась новая игра или состояние загружено
+        if not states or sim.tick - states[-1][0] >= self.interval:
+            states.append((sim.tick, save_state(sim)))
+
+    def rewind(self, tick):
+        """
+        Находит последнее состояние не позже тика tick и забывает более поздние.
+
+        Аргументы:
+            tick (int): Тик, к которому нужно вернуться.
+
+        Возвращает:
+            bytes: Состояние (самое раннее из хранящихся, если такого нет; None, если кольцо пусто).
+        """
+        states = self.states
+        while len(states) > 1 and states[-1][0] > tick:
+            states.pop()
+        return states[-1][1] if states else None
+
+    def clear(self):
+        """Забывает все состояния."""
+        self.states.clear()
+
+
+if __name__ == "__main__":
+    import argparse
+    import random
+    import statistics
+
+    from src.Simulation import random_policy
+
+    parser = argparse.ArgumentParser(description="Подготовка состояния игры в середине партии (для бенчмарков)")
+    parser.add_argument("--seed", type=int, default=0, help="Начальное значение генераторов")
+    parser.add_argument("--ticks", type=int, default=1800, help="Тик, на котором сохраняется состояние")
+    parser.add_argument("--asteroids", type=int, help="Количество астероидов на поле")
+    parser.add_argument("--out", help="Файл для состояния")
+    args = parser.parse_args()
+
+    simulation = Simulation(seed=args.seed)
+    if args.asteroids:
+        simulation.set_params({"MIN_ASTEROIDS": args.asteroids, "MAX_ASTEROIDS": args.asteroids})
+    simulation.run(args.ticks, random_policy(random.Random(args.seed)))
+    if not simulation.running:
+        parser.error(f"the game finished at tick {simulation.tick}; try fewer ticks or another seed")
+
+    data = save_state(simulation)
+    if args.out:
+        with open(args.out, "wb") as file:
+            file.write(data)
+    save_times = []
+    load_times = []
+    restored = Simulation()
+    for _ in range(200):
+        started = time.perf_counter()
+        save_state(simulation)
+        save_times.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        load_state(data, restored)
+        load_times.append(time.perf_counter() - started)
+    if restored.checksum() != simulation.checksum():
+        raise SystemExit("restored state differs from the saved one")
+    print(f"Tick {simulation.tick}: {len(simulation.asteroids)} asteroid(s), {len(simulation.rockets)} rocket(s), "
+          f"{len(data)} bytes; save {statistics.median(save_times) * 1e6:.0f} us, "
+          f"load {statistics.median(load_times) * 1e6:.0f} us")
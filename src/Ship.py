@@ -1,6 +1,4 @@
 import math
-from PIL import Image, ImageTk
-import os
 
 from src.Rocket import Rocket
 from src.config import *
@@ -8,10 +6,10 @@ from src.config import *
 
 class Ship:
     """
-    Класс Ship представляет космический корабль игрока.
+    Класс Ship представляет космический корабль игрока. Класс хранит только
+    состояние симуляции; отрисовкой занимается Game.
 
     Атрибуты:
-        canvas (Canvas): Холст, на котором отрисовывается корабль.
         x (float): Координата x текущего положения корабля.
         y (float): Координата y текущего положения корабля.
         angle (float): Угол поворота корабля (в градусах).
@@ -19,24 +17,17 @@ class Ship:
         velocity_x (float): Горизонтальная скорость корабля.
         velocity_y (float): Вертикальная скорость корабля.
         thrusting (bool): Указывает, включен ли режим тяги.
-        sprites (dict): Словарь с графическими ресурсами для спрайтов.
-        original_static_ship (PIL.Image): Изображение неподвижного корабля.
-        original_thrusting_ship (PIL.Image): Изображение корабля с включенной тягой.
-        current_image (ImageTk.PhotoImage): Текущее изображение корабля для отображения.
-        sprite_id (int): Идентификатор спрайта на холсте (создается динамически).
+        thrust (float): Ускорение корабля при включенной тяге.
     """
 
-    def __init__(self, canvas, x, y, sprites):
+    def __init__(self, x, y):
         """
         Инициализация объекта Ship.
 
         Аргументы:
-            canvas (Canvas): Холст, на котором будет отображаться корабль.
             x (float): Начальная координата x.
             y (float): Начальная координата y.
-            sprites (dict): Словарь с графическими ресурсами для корабля.
         """
-        self.canvas = canvas
         self.x = x
         self.y = y
         self.angle = 270  # Угол поворота, изначально направлен вверх.
@@ -44,50 +35,28 @@ class Ship:
         self.velocity_x = 0
         self.velocity_y = 0
         self.thrusting = False
-        self.sprites = sprites
-        # Загружаем изображения корабля
-        self.original_static_ship = Image.open(os.path.join(SPRITE_FOLDER, "new_static_ship.png")).resize(
-            (60, 60), Image.Resampling.LANCZOS
-        )
-        self.original_thrusting_ship = Image.open(os.path.join(SPRITE_FOLDER, "new_thrusting_ship.png")).resize(
-            (60, 60), Image.Resampling.LANCZOS
-        )
-        self.current_image = None
-        self.update_image()  # Устанавливаем начальный спрайт
+        self.thrust = SHIP_THRUST
 
-    def update_image(self):
-        """
-        Обновляет изображение корабля в зависимости от угла поворота и режима тяги.
-        """
-        sprite_to_use = (
-            self.original_thrusting_ship if self.thrusting else self.original_static_ship
-        )
-        rotated_image = sprite_to_use.rotate(-(self.angle - 90), resample=Image.BICUBIC)  # Корректируем угол
-        self.current_image = ImageTk.PhotoImage(rotated_image)
-        if hasattr(self, 'sprite_id'):
-            self.canvas.itemconfig(self.sprite_id, image=self.current_image)
-        else:
-            self.sprite_id = self.canvas.create_image(self.x, self.y, image=self.current_image)
-
-    def update(self):
+    def update(self, dt=1):
         """
         Обновляет состояние корабля: применяет тягу, трение и изменяет координаты.
+
+        Аргументы:
+            dt (int): Длительность шага в тиках.
         """
         if self.thrusting:
             # Применяем ускорение в направлении корабля
-            self.velocity_x += SHIP_THRUST * math.cos(math.radians(self.angle))
-            self.velocity_y += SHIP_THRUST * math.sin(math.radians(self.angle))
+            self.velocity_x += self.thrust * math.cos(math.radians(self.angle)) * dt
+            self.velocity_y += self.thrust * math.sin(math.radians(self.angle)) * dt
         else:
             # Применяем трение для снижения скорости
-            self.velocity_x *= 0.99
-            self.velocity_y *= 0.99
+            friction = 0.99 ** dt
+            self.velocity_x *= friction
+            self.velocity_y *= friction
 
         # Обновляем координаты с учетом циклической границы экрана
-        self.x = (self.x + self.velocity_x) % SCREEN_WIDTH
-        self.y = (self.y + self.velocity_y) % SCREEN_HEIGHT
-
-        self.update_image()  # Обновляем изображение корабля
-        self.canvas.coords(self.sprite_id, self.x, self.y)
+        self.x = (self.x + self.velocity_x * dt) % SCREEN_WIDTH
+        self.y = (self.y + self.velocity_y * dt) % SCREEN_HEIGHT
 
     def rotate(self, angle):
         """
@@ -98,17 +67,22 @@ class Ship:
         """
         self.angle = (self.angle + angle) % 360
 
-    def shoot(self):
+    def shoot(self, pool=None):
         """
         Выпускает ракету из носа корабля.
 
+        Аргументы:
+            pool (RingPool): Кольцевой буфер ракет; если задан, ракета берется из него.
+
         Возвращает:
-            Rocket: Объект ракеты, выпущенной из корабля.
+            Rocket: Объект ракеты, выпущенной из корабля (None, если буфер заполнен).
         """
         # Вычисляем координаты носа корабля
         nose_x = self.x + self.radius * math.cos(math.radians(self.angle))
         nose_y = self.y + self.radius * math.sin(math.radians(self.angle))
-        return Rocket(self.canvas, nose_x, nose_y, self.angle)
+        if pool is not None:
+            return pool.acquire(nose_x, nose_y, self.angle)
+        return Rocket(nose_x, nose_y, self.angle)
 
     def respawn(self):
         """
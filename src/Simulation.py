@@ -0,0 +1,907 @@
+import copy
+import math
+import random
+import struct
+import time
+import zlib
+
+from src.Asteroid import Asteroid, AsteroidView
+from src.EntityStore import EntityStore, FLAG_DESTROYED, FLAG_EXPIRED, FLAG_EXPLODING, numpy_available
+from src.Log import DEBUG, INFO, add_log_arguments, log
+from src.ObjectPool import ObjectPool, RingPool
+from src.Rocket import Rocket, RocketView
+from src.Ship import Ship
+from src.SpatialHash import SpatialHash, first_hit_tick, swept_hit_time, wrap_delta, wrapped_distance_sq
+from src.config import *
+
+# Биты управления игрока за один тик симуляции
+INPUT_LEFT = 1  # Поворот влево
+INPUT_RIGHT = 2  # Поворот вправо
+INPUT_THRUST = 4  # Тяга
+INPUT_SHOOT = 8  # Выстрел
+
+# Запас (пиксели), с которым ищется ближайшее столкновение при шаге в несколько тиков: округление
+# положений, посчитанных сразу на несколько тиков вперед, не должно скрыть столкновение
+EVENT_TOLERANCE = 1e-6
+
+collision_log = log.channel("collision")
+game_log = log.channel("game")
+
+
+class Simulation:
+    """
+    Класс Simulation содержит правила игры без привязки к tkinter: корабль, астероиды,
+    ракеты, столкновения, счет, жизни и появление астероидов.
+
+    Симуляция продвигается вызовами step(inputs) и не зависит от реального времени,
+    поэтому может работать без дисплея и быстрее реального времени. Один шаг может
+    охватывать несколько тиков (dt) для быстрого анализа: шаг делится на части по ближайшим
+    событиям (выстрел, столкновение, окончание взрыва, появление астероида), между которыми
+    объекты движутся без помех, поэтому результат совпадает с пошаговым прогоном.
+
+    Атрибуты:
+        rng (random.Random): Генератор случайных чисел симуляции.
+        tick (int): Номер текущего тика.
+        dt (int): Количество тиков за один шаг.
+        swept (bool): Проверять столкновения непрерывно по пути объектов за шаг, а не только
+                      по положениям в конце тиков (COLLISION_SWEPT).
+        lives (int): Текущее количество жизней игрока.
+        score (int): Текущий счет игрока.
+        hits (int): Количество попаданий ракет в астероиды с начала игры.
+        running (bool): Флаг, указывающий, идет ли игра.
+        game_over_in_progress (bool): Флаг, указывающий, что жизни кончились и
+                                      доигрываются последние взрывы.
+        finished (bool): Флаг, указывающий, что игра полностью завершена.
+        ship (Ship): Корабль игрока (None, если корабль уничтожен).
+        asteroids (list): Список астероидов.
+        rockets (list): Список ракет.
+        collision_grid (SpatialHash): Сетка для поиска столкновений с астероидами.
+        brute_force (bool): Проверять столкновения перебором всех пар (эталонный режим).
+        min_asteroids (int): Минимальное количество астероидов на экране.
+        max_asteroids (int): Максимальное количество астероидов на экране.
+        spawn_interval (int): Период появления новых астероидов (тики).
+        asteroid_speed (float): Максимальная скорость новых астероидов по каждой оси.
+        rocket_lifetime (int): Время жизни новых ракет (тики).
+        ship_thrust (float): Ускорение корабля при включенной тяге.
+        fire_cooldown (int): Минимальный интервал между выстрелами (тики).
+        last_shot_tick (int): Тик последнего выстрела (None, если выстрелов не было).
+        asteroid_pool (ObjectPool): Пул астероидов для повторного использования.
+        rocket_pool (RingPool): Кольцевой буфер ракет фиксированной вместимости.
+        asteroid_store (EntityStore): Хранилище астероидов (None, если не используется).
+        rocket_store (EntityStore): Хранилище ракет (None, если не используется).
+        profiler (FrameProfiler): Профилировщик фаз тика (None, если профилирование выключено).
+    """
+
+    # Параметры config.py, которые можно переопределить для отдельной симуляции, и их атрибуты
+    PARAMETERS = {
+        "ASTEROID_SPEED": "asteroid_speed",
+        "MIN_ASTEROIDS": "min_asteroids",
+        "MAX_ASTEROIDS": "max_asteroids",
+        "ASTEROID_SPAWN_INTERVAL": "spawn_interval",
+        "ROCKET_LIFETIME": "rocket_lifetime",
+        "ROCKET_FIRE_COOLDOWN": "fire_cooldown",
+        "SHIP_THRUST": "ship_thrust",
+    }
+
+    def __init__(self, seed=None, use_store=USE_ENTITY_STORE, rocket_capacity=ROCKET_CAPACITY, dt=1,
+                 swept=COLLISION_SWEPT):
+        """
+        Инициализация объекта Simulation.
+
+        Аргументы:
+            seed (int): Начальное значение генератора случайных чисел.
+            use_store (bool): Хранить астероиды и ракеты в EntityStore (если установлен NumPy).
+            rocket_capacity (int): Максимальное количество ракет в полете.
+            dt (int): Количество тиков за один шаг.
+            swept (bool): Проверять столкновения непрерывно по пути объектов за шаг (COLLISION_SWEPT).
+        """
+        if dt < 1:
+            raise ValueError(f"dt must be a positive number of ticks, got {dt}")
+        self.rng = random.Random(seed)
+        self.tick = 0
+        self.dt = dt
+        self.swept = swept
+        self.lives = LIVES
+        self.score = INITIAL_SCORE
+        self.hits = 0
+        self.running = False
+        self.game_over_in_progress = False
+        self.finished = False
+        self.next_id = 0
+
+        self.ship = None
+        self.asteroids = []
+        self.rockets = []
+        self.collision_grid = SpatialHash()
+        self.brute_force = COLLISION_BRUTE_FORCE
+        self.min_asteroids = MIN_ASTEROIDS
+        self.max_asteroids = MAX_ASTEROIDS
+        self.spawn_interval = ASTEROID_SPAWN_INTERVAL
+        self.asteroid_speed = ASTEROID_SPEED
+        self.rocket_lifetime = ROCKET_LIFETIME
+        self.ship_thrust = SHIP_THRUST
+        self.fire_cooldown = ROCKET_FIRE_COOLDOWN
+        self.last_shot_tick = None
+        self.profiler = None
+
+        # Хранилища NumPy для пакетного обновления (списки объектов становятся их строками)
+        self.asteroid_store = None
+        self.rocket_store = None
+        if use_store and numpy_available():
+            self.asteroid_store = EntityStore()
+            self.rocket_store = EntityStore()
+            self.asteroids = self.asteroid_store.entities
+            self.rockets = self.rocket_store.entities
+
+        # Повторное использование объектов: астероиды возвращаются в пул после взрыва,
+        # ракеты занимают слоты кольцевого буфера, пока не истечет их время жизни
+        if self.asteroid_store is not None:
+            self.asteroid_pool = ObjectPool(lambda *args: AsteroidView(self.asteroid_store, *args), MAX_ASTEROIDS)
+            self.rocket_pool = RingPool(lambda *args: RocketView(self.rocket_store, *args), rocket_capacity,
+                                        rocket_finished)
+        else:
+            self.asteroid_pool = ObjectPool(Asteroid, MAX_ASTEROIDS)
+            self.rocket_pool = RingPool(Rocket, rocket_capacity, rocket_finished)
+
+    def set_params(self, params):
+        """
+        Переопределяет параметры config.py для этой симуляции.
+
+        Аргументы:
+            params (dict): Значения по именам из PARAMETERS (например, {"ASTEROID_SPEED": 3}).
+        """
+        for name, value in params.items():
+            if name not in self.PARAMETERS:
+                raise ValueError(f"unknown simulation parameter: {name}")
+            setattr(self, self.PARAMETERS[name], value)
+
+    def start(self):
+        """Начинает новую игру: сбрасывает счет и жизни, создает корабль и астероиды."""
+        if self.running:
+            return
+        self.running = True
+        self.game_over_in_progress = False
+        self.finished = False
+        self.lives = LIVES
+        self.score = INITIAL_SCORE
+        self.hits = 0
+        self.ship = Ship(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        self.ship.thrust = self.ship_thrust
+        self.spawn_asteroids()
+
+    def step(self, inputs=0):
+        """
+        Продвигает симуляцию на один шаг (dt тиков). Биты управления действуют весь шаг,
+        но выстрел за шаг возможен только один — в первом тике.
+
+        Без непрерывной проверки шаг в несколько тиков проходится частями до ближайшего
+        события (next_event_tick) и дает тот же результат, что dt шагов по одному тику.
+
+        Аргументы:
+            inputs (int): Битовая маска управления (INPUT_LEFT, INPUT_RIGHT, INPUT_THRUST, INPUT_SHOOT).
+        """
+        if not self.running:
+            return
+        if self.dt == 1 or self.swept:
+            self.advance(inputs)
+            return
+        dt = self.dt
+        remaining = dt
+        try:
+            while remaining and self.running:
+                # На время части шага dt равно ее длине
+                self.dt = self.next_event_tick(inputs, remaining)
+                self.advance(inputs)
+                remaining -= self.dt
+                inputs = self.without_shots(inputs)
+        finally:
+            self.dt = dt
+
+    def advance(self, inputs):
+        """
+        Продвигает все объекты на dt тиков и проверяет столкновения в конце (или по пути, если
+        включена непрерывная проверка), затем удаляет завершившиеся объекты и добавляет астероиды.
+
+        Аргументы:
+            inputs (int): Битовая маска управления.
+        """
+        dt = self.dt
+        self.tick += dt
+        profiler = self.profiler
+        if profiler:
+            profiler.restart()
+
+        # Обновление состояния корабля
+        self.update_ships(inputs)
+        if profiler:
+            profiler.mark("ship")
+
+        # Обновление объектов
+        self.update_rockets()
+        if profiler:
+            profiler.mark("rockets")
+        self.update_asteroids()
+        if profiler:
+            profiler.mark("asteroids")
+        self.check_collisions()
+        if profiler:
+            profiler.mark("collisions")
+        self.cleanup_objects()
+        if profiler:
+            profiler.mark("cleanup")
+
+        if self.game_over_in_progress:
+            # Ждем завершения взрывов перед окончанием игры
+            if not any(asteroid.exploding for asteroid in self.asteroids):
+                self.finalize_game_over()
+        elif self.tick % self.spawn_interval < dt:
+            # Генерация дополнительных астероидов (раз в spawn_interval тиков)
+            self.spawn_asteroids()
+        if profiler:
+            profiler.mark("spawn")
+
+    def run(self, ticks, policy=None):
+        """
+        Прогоняет симуляцию заданное число тиков или до окончания игры.
+
+        Аргументы:
+            ticks (int): Максимальное количество тиков (округляется вверх до целого числа шагов).
+            policy (callable): Функция policy(simulation), возвращающая биты управления;
+                               по умолчанию управление не подается.
+
+        Возвращает:
+            int: Количество выполненных тиков.
+        """
+        self.start()
+        done = 0
+        while done < ticks and self.running:
+            self.step(policy(self) if policy else 0)
+            done += self.dt
+        return done
+
+    def without_shots(self, inputs):
+        """
+        Возвращает биты управления без выстрела (для тиков шага после первого).
+
+        Аргументы:
+            inputs (int): Битовая маска управления.
+        """
+        return inputs & ~INPUT_SHOOT
+
+    def ship_paths(self, inputs, ticks):
+        """
+        Находит положения кораблей в конце каждого из ближайших тиков, не меняя сами корабли.
+
+        Аргументы:
+            inputs (int): Битовая маска управления.
+            ticks (int): Количество тиков.
+
+        Возвращает:
+            list: Пути кораблей — списки положений (x, y).
+        """
+        if self.ship is None:
+            return []
+        return [ship_path(self.ship, inputs, ticks)]
+
+    def update_ships(self, inputs):
+        """
+        Применяет биты управления к кораблю и продвигает его на шаг.
+
+        Аргументы:
+            inputs (int): Битовая маска управления.
+        """
+        if self.ship:
+            if inputs & INPUT_SHOOT:
+                self.shoot_rocket()
+            apply_ship_inputs(self.ship, inputs, self.dt)
+
+    def checksum(self):
+        """
+        Вычисляет контрольную сумму состояния симуляции для проверки детерминированности
+        (например, при воспроизведении записи). Учитываются точные значения координат.
+
+        Возвращает:
+            int: CRC32 состояния.
+        """
+        crc = zlib.crc32(struct.pack("<qqqq", self.tick, self.score, self.lives, self.next_id))
+        ship = self.ship
+        if ship is not None:
+            crc = zlib.crc32(struct.pack("<5d", ship.x, ship.y, ship.angle, ship.velocity_x, ship.velocity_y), crc)
+        for asteroid in self.asteroids:
+            crc = zlib.crc32(struct.pack(
+                "<q4d??q", asteroid.id, asteroid.x, asteroid.y, asteroid.angle, asteroid.radius,
+                asteroid.exploding, asteroid.destroyed, int(asteroid.explosion_timer)
+            ), crc)
+        for rocket in self.rockets:
+            crc = zlib.crc32(struct.pack("<q3d", rocket.id, rocket.x, rocket.y, rocket.lifetime), crc)
+        return crc
+
+    def new_id(self):
+        """Возвращает новый идентификатор объекта."""
+        self.next_id += 1
+        return self.next_id
+
+    def shoot_rocket(self):
+        """
+        Выстреливает ракету из корабля, если прошел интервал между выстрелами
+        и в кольцевом буфере есть свободный слот.
+
+        Возвращает:
+            Rocket: Выпущенная ракета или None, если выстрел не состоялся.
+        """
+        if self.last_shot_tick is not None and self.tick - self.last_shot_tick < self.fire_cooldown:
+            return None
+        rocket = self.ship.shoot(self.rocket_pool)  # В режиме хранилища ракета добавляется в него сама
+        if rocket is None:
+            return None
+        if self.rocket_store is None:
+            self.rockets.append(rocket)
+        rocket.id = self.new_id()
+        rocket.lifetime = self.rocket_lifetime
+        self.last_shot_tick = self.tick
+        return rocket
+
+    def update_rockets(self):
+        """
+        Обновляет положение ракет и удаляет истёкшие.
+
+        При проверке столкновений по пути ракеты, истекшие за шаг, удаляются только после
+        проверки: до истечения они еще могли попасть в астероид.
+        """
+        if self.rocket_store is not None:
+            # Перемещение и время жизни всех ракет обновляются векторными операциями
+            self.rocket_store.step(dt=self.dt)
+        else:
+            for rocket in self.rockets:
+                rocket.update(self.dt)
+        if self.swept:
+            return
+        # Удаляем ракеты, которые истекли (их слоты в кольцевом буфере освобождаются)
+        if self.rocket_store is not None:
+            self.rocket_store.compact(self.rocket_store.removable(FLAG_EXPIRED))
+        else:
+            remove_finished(self.rockets, rocket_finished)
+
+    def update_asteroids(self):
+        """Обновляет положение астероидов и удаляет завершившие взрыв."""
+        if self.asteroid_store is not None:
+            # Перемещение, вращение и таймеры взрыва всех астероидов обновляются векторными операциями
+            self.asteroid_store.step(dt=self.dt)
+        else:
+            for asteroid in self.asteroids:
+                asteroid.update(self.dt)
+        # Удаляем астероиды, только если они разрушены и взрыв завершился
+        self.remove_finished_asteroids()
+
+    def remove_finished_asteroids(self):
+        """Удаляет разрушенные астероиды с завершившимся взрывом и возвращает их в пул."""
+        if self.asteroid_store is not None:
+            removed = self.asteroid_store.compact(self.asteroid_store.removable(FLAG_DESTROYED, absent=FLAG_EXPLODING))
+            for asteroid in removed:
+                self.asteroid_pool.release(asteroid)
+        else:
+            remove_finished(self.asteroids, asteroid_finished, self.asteroid_pool)
+
+    def cleanup_objects(self):
+        """Удаляет объекты, которые больше не нужны."""
+        if self.rocket_store is not None:
+            # Пакетное удаление строк хранилища с сохранением порядка оставшихся
+            self.rocket_store.compact(self.rocket_store.removable(FLAG_EXPIRED))
+        else:
+            remove_finished(self.rockets, rocket_finished)
+        self.remove_finished_asteroids()
+
+    def check_collisions(self):
+        """Проверяет столкновения между объектами."""
+        # В режиме хранилища столкновения по конечным положениям ищутся векторными
+        # операциями сразу по всем астероидам, и сетка не нужна
+        batched = self.asteroid_store is not None and not self.swept
+        grid = None if self.brute_force or batched else self.build_collision_grid()
+        if self.swept:
+            rocket_hits = self.find_rocket_hits_swept(grid)
+        elif batched:
+            rocket_hits = self.find_rocket_hits_batched()
+        else:
+            rocket_hits = self.find_rocket_hits(grid)
+
+        # Проверка столкновений ракета-астероид
+        for rocket, asteroid in rocket_hits:
+            if collision_log.level <= INFO:
+                collision_log.info("Collision detected: Rocket %s hit Asteroid %s", rocket.id, asteroid.id)
+            rocket.expired = True
+            if not asteroid.exploding:
+                if collision_log.level <= DEBUG:
+                    collision_log.debug("Asteroid %s starts explosion", asteroid.id)
+                asteroid.start_explosion()
+            self.hits += 1
+            self.award_hit(rocket)
+
+        # Проверка столкновений корабль-астероид
+        self.check_ship_collisions(grid)
+
+    def award_hit(self, rocket):
+        """
+        Начисляет очко за попадание ракеты в астероид.
+
+        Аргументы:
+            rocket (Rocket): Попавшая ракета.
+        """
+        self.score += 1
+
+    def check_ship_collisions(self, grid):
+        """
+        Проверяет столкновения корабля с астероидами: каждое столкновение отнимает жизнь
+        и возвращает корабль в центр, а потеря последней жизни завершает игру.
+
+        Аргументы:
+            grid (SpatialHash): Сетка столкновений или None для перебора всех астероидов.
+        """
+        start = 0
+        swept = self.swept
+        while self.ship:
+            index = self.find_ship_hit_swept(grid) if swept else self.find_ship_hit(grid, start)
+            if index is None:
+                break
+            asteroid = self.asteroids[index]
+            if collision_log.level <= INFO:
+                collision_log.info("Collision detected: Ship collided with Asteroid %s", asteroid.id)
+            asteroid.start_explosion(mark_as_killer=True)
+            self.lives -= 1
+            if self.lives <= 0:
+                self.game_over()
+                return
+            else:
+                self.ship.respawn()
+            # После возрождения проверяются только оставшиеся астероиды, и только в конечном
+            # положении: возрожденный корабль в этом шаге не двигался
+            start = index + 1
+            swept = False
+
+    def next_event_tick(self, inputs, ticks):
+        """
+        Находит, через сколько тиков произойдет ближайшее событие: выстрел, попадание ракеты,
+        столкновение корабля, окончание взрыва или появление астероида. До него объекты
+        движутся без помех, поэтому часть шага до события можно пройти сразу и проверить
+        столкновения только в ее конце.
+
+        Аргументы:
+            inputs (int): Битовая маска управления.
+            ticks (int): Сколько тиков осталось в шаге.
+
+        Возвращает:
+            int: Количество тиков до события включительно (ticks, если событий нет).
+        """
+        if inputs != self.without_shots(inputs):
+            return 1  # Выстрел делается в первом тике, как при пошаговом прогоне
+        first = ticks
+        for asteroid in self.asteroids:
+            if asteroid.exploding:
+                first = min(first, ASTEROID_EXPLOSION_TICKS - int(asteroid.explosion_timer))
+        if len(self.asteroids) < self.min_asteroids and not self.game_over_in_progress:
+            first = min(first, self.spawn_interval - self.tick % self.spawn_interval)
+        if first > 1:
+            # Столкновение в тике самого события роли не играет: он все равно проверяется
+            hit_tick = self.first_collision_tick(inputs, first - 1)
+            if hit_tick is not None:
+                first = hit_tick
+        return first
+
+    def first_collision_tick(self, inputs, ticks):
+        """
+        Находит первый из ближайших тиков, в конце которого ракета или корабль окажутся внутри
+        астероида. Положения считаются от текущих с запасом EVENT_TOLERANCE, поэтому найденный
+        тик может оказаться ложной тревогой, но столкновение не пропускается.
+
+        Аргументы:
+            inputs (int): Битовая маска управления.
+            ticks (int): Количество проверяемых тиков.
+
+        Возвращает:
+            int: Номер тика (от 1 до ticks) или None, если столкновений нет.
+        """
+        asteroids = self.asteroids
+        grid = None if self.brute_force else self.build_collision_grid(ahead=ticks)
+        first = ticks + 1
+        for rocket in self.rockets:
+            # Ракета проверяется только на тиках, пока она летит
+            window = min(first - 1, int(rocket.lifetime) - 1)
+            if window <= 0:
+                continue
+            x, y, velocity_x, velocity_y = rocket.x, rocket.y, rocket.velocity_x, rocket.velocity_y
+            if grid is None:
+                candidates = range(len(asteroids))
+            else:
+                candidates = grid.query_segment(x, y, x + velocity_x * window, y + velocity_y * window)
+            for index in candidates:
+                asteroid = asteroids[index]
+                relative_x, relative_y = velocity_x, velocity_y
+                if not asteroid.exploding:  # Взрывающиеся астероиды не движутся
+                    relative_x -= asteroid.velocity_x
+                    relative_y -= asteroid.velocity_y
+                hit_tick = first_hit_tick(wrap_delta(x - asteroid.x, SCREEN_WIDTH),
+                                          wrap_delta(y - asteroid.y, SCREEN_HEIGHT), relative_x, relative_y,
+                                          asteroid.radius + EVENT_TOLERANCE, window)
+                if hit_tick is not None and hit_tick < first:
+                    first = window = hit_tick
+        for path in self.ship_paths(inputs, first - 1):
+            if grid is None:
+                candidates = range(len(asteroids))
+            else:
+                candidates = set().union(*(grid.query(x, y) for x, y in path))
+            for index in candidates:
+                asteroid = asteroids[index]
+                if asteroid.exploding:
+                    continue
+                radius_sq = (asteroid.radius + EVENT_TOLERANCE) ** 2
+                for tick, (x, y) in enumerate(path[:first - 1], 1):
+                    if wrapped_distance_sq(x, y, asteroid.x + asteroid.velocity_x * tick,
+                                           asteroid.y + asteroid.velocity_y * tick) < radius_sq:
+                        first = tick
+                        break
+        return first if first <= ticks else None
+
+    def build_collision_grid(self, ahead=0):
+        """
+        Заполняет сетку столкновений индексами астероидов.
+
+        При проверке по пути астероид занимает в сетке круг, описанный вокруг всего
+        его пути за шаг (или за ahead тиков вперед при поиске ближайшего события).
+
+        Аргументы:
+            ahead (int): На сколько тиков вперед от текущих положений занимается путь (0 — путь за шаг).
+
+        Возвращает:
+            SpatialHash: Заполненная сетка.
+        """
+        grid = self.collision_grid
+        grid.clear()
+        if ahead:
+            half, margin = ahead / 2, EVENT_TOLERANCE
+        else:
+            half, margin = (-self.dt / 2 if self.swept else 0), 0
+        for index, asteroid in enumerate(self.asteroids):
+            if half and not asteroid.exploding:
+                half_x = asteroid.velocity_x * half
+                half_y = asteroid.velocity_y * half
+                grid.insert(index, asteroid.x + half_x, asteroid.y + half_y,
+                            asteroid.radius + math.hypot(half_x, half_y) + margin)
+            else:
+                grid.insert(index, asteroid.x, asteroid.y, asteroid.radius + margin)
+        return grid
+
+    def candidate_asteroids(self, grid, x, y):
+        """
+        Возвращает индексы астероидов, которые могут содержать точку, в порядке списка.
+
+        Аргументы:
+            grid (SpatialHash): Сетка столкновений или None для перебора всех астероидов.
+            x (float): Координата x точки.
+            y (float): Координата y точки.
+        """
+        if grid is None:
+            return range(len(self.asteroids))
+        return sorted(grid.query(x, y))
+
+    def candidate_asteroids_on_path(self, grid, x, y, velocity_x, velocity_y):
+        """
+        Возвращает индексы астероидов, которые могут встретиться на пути точки за шаг, в порядке списка.
+
+        Аргументы:
+            grid (SpatialHash): Сетка столкновений или None для перебора всех астероидов.
+            x (float): Координата x точки в конце шага.
+            y (float): Координата y точки в конце шага.
+            velocity_x (float): Скорость точки по x.
+            velocity_y (float): Скорость точки по y.
+        """
+        if grid is None:
+            return range(len(self.asteroids))
+        return sorted(grid.query_segment(x - velocity_x * self.dt, y - velocity_y * self.dt, x, y))
+
+    def time_of_impact(self, x, y, velocity_x, velocity_y, asteroid, window=None):
+        """
+        Находит момент столкновения точки, двигавшейся весь шаг с постоянной скоростью, с астероидом.
+
+        Аргументы:
+            x (float): Координата x точки в конце шага.
+            y (float): Координата y точки в конце шага.
+            velocity_x (float): Скорость точки по x.
+            velocity_y (float): Скорость точки по y.
+            asteroid (Asteroid): Астероид.
+            window (int): Сколько первых тиков шага проверяется (по умолчанию весь шаг).
+
+        Возвращает:
+            float: Время от начала шага до столкновения (тики) или None, если столкновения нет.
+        """
+        if not asteroid.exploding:  # Взрывающиеся астероиды в этом шаге не двигались
+            velocity_x -= asteroid.velocity_x
+            velocity_y -= asteroid.velocity_y
+        dx = wrap_delta(x - asteroid.x, SCREEN_WIDTH)
+        dy = wrap_delta(y - asteroid.y, SCREEN_HEIGHT)
+        if window is None or window >= self.dt:
+            window = self.dt
+        else:
+            # Смещение в конце проверяемой части шага
+            dx -= velocity_x * (self.dt - window)
+            dy -= velocity_y * (self.dt - window)
+        return swept_hit_time(dx, dy, velocity_x, velocity_y, asteroid.radius, window)
+
+    def find_rocket_hits(self, grid=None):
+        """
+        Находит попадания ракет в астероиды. Каждая ракета попадает не более
+        чем в один астероид — первый по порядку списка.
+
+        Аргументы:
+            grid (SpatialHash): Сетка столкновений или None для перебора всех пар.
+
+        Возвращает:
+            list: Пары (ракета, астероид).
+        """
+        hits = []
+        for rocket in self.rockets:
+            for index in self.candidate_asteroids(grid, rocket.x, rocket.y):
+                asteroid = self.asteroids[index]
+                if wrapped_distance_sq(rocket.x, rocket.y, asteroid.x, asteroid.y) < asteroid.radius ** 2:
+                    hits.append((rocket, asteroid))
+                    break
+        return hits
+
+    def find_rocket_hits_swept(self, grid=None):
+        """
+        Находит попадания ракет в астероиды по пути ракет и астероидов за шаг. Каждая ракета
+        попадает не более чем в один астероид — в тот, которого достигает раньше (при равенстве —
+        в первый по порядку списка).
+
+        Ракета, истекшая за шаг, проверяется только на тех тиках, когда она еще летела
+        и при пошаговом прогоне проверялась бы.
+
+        Аргументы:
+            grid (SpatialHash): Сетка столкновений или None для перебора всех пар.
+
+        Возвращает:
+            list: Пары (ракета, астероид).
+        """
+        hits = []
+        asteroids = self.asteroids
+        for rocket in self.rockets:
+            window = min(self.dt, rocket.lifetime + self.dt - 1)
+            if window <= 0:
+                continue  # Ракета истекла, не пролетев ни одного проверяемого тика
+            x, y, velocity_x, velocity_y = rocket.x, rocket.y, rocket.velocity_x, rocket.velocity_y
+            first = None
+            first_time = None
+            for index in self.candidate_asteroids_on_path(grid, x, y, velocity_x, velocity_y):
+                hit_time = self.time_of_impact(x, y, velocity_x, velocity_y, asteroids[index], window)
+                if hit_time is not None and (first_time is None or hit_time < first_time):
+                    first, first_time = asteroids[index], hit_time
+            if first is not None:
+                hits.append((rocket, first))
+        return hits
+
+    def find_rocket_hits_batched(self):
+        """
+        Находит попадания ракет в астероиды одной векторной операцией над хранилищами.
+
+        Возвращает:
+            list: Пары (ракета, астероид), как в find_rocket_hits.
+        """
+        store = self.rocket_store
+        rows = self.asteroid_store.first_hits(store.arrays["x"][:store.count], store.arrays["y"][:store.count])
+        return [(self.rockets[i], self.asteroids[row]) for i, row in enumerate(rows.tolist()) if row >= 0]
+
+    def find_ship_hit(self, grid=None, start=0, ship=None):
+        """
+        Находит первый невзрывающийся астероид с индексом не меньше start,
+        с которым столкнулся корабль.
+
+        Аргументы:
+            grid (SpatialHash): Сетка столкновений или None для перебора всех астероидов.
+            start (int): Индекс, с которого начинается поиск.
+            ship (Ship): Проверяемый корабль (по умолчанию корабль игрока).
+
+        Возвращает:
+            int: Индекс астероида или None, если столкновения нет.
+        """
+        ship = ship or self.ship
+        if grid is None and self.asteroid_store is not None:
+            # Перебор всех астероидов одной векторной операцией над хранилищем
+            row = self.asteroid_store.first_hits([ship.x], [ship.y], skip=FLAG_EXPLODING, start=start)[0]
+            return int(row) if row >= 0 else None
+        for index in self.candidate_asteroids(grid, ship.x, ship.y):
+            if index < start:
+                continue
+            asteroid = self.asteroids[index]
+            # Пропускает астероиды, которые ещё взрываются
+            if asteroid.exploding:
+                continue
+            if wrapped_distance_sq(ship.x, ship.y, asteroid.x, asteroid.y) < asteroid.radius ** 2:
+                return index
+        return None
+
+    def find_ship_hit_swept(self, grid=None, ship=None):
+        """
+        Находит невзрывающийся астероид, с которым корабль столкнулся за шаг раньше остальных
+        (при равенстве — первый по порядку списка).
+
+        Аргументы:
+            grid (SpatialHash): Сетка столкновений или None для перебора всех астероидов.
+            ship (Ship): Проверяемый корабль (по умолчанию корабль игрока).
+
+        Возвращает:
+            int: Индекс астероида или None, если столкновения нет.
+        """
+        ship = ship or self.ship
+        first = None
+        first_time = None
+        for index in self.candidate_asteroids_on_path(grid, ship.x, ship.y, ship.velocity_x, ship.velocity_y):
+            asteroid = self.asteroids[index]
+            if asteroid.exploding:
+                continue
+            hit_time = self.time_of_impact(ship.x, ship.y, ship.velocity_x, ship.velocity_y, asteroid)
+            if hit_time is not None and (first_time is None or hit_time < first_time):
+                first, first_time = index, hit_time
+        return first
+
+    def spawn_asteroids(self):
+        """Генерирует астероиды, чтобы их общее количество на экране было сбалансированным."""
+        if not self.running or self.game_over_in_progress:  # Предотвращение спавна при завершении игры
+            return
+
+        # Рассчитываем, сколько астероидов нужно добавить
+        num_to_spawn = max(0, self.min_asteroids - len(self.asteroids))
+        for _ in range(num_to_spawn):
+            self.spawn_asteroid()
+
+        # Ограничиваем общее количество астероидов максимальным значением
+        if self.asteroid_store is None and len(self.asteroids) > self.max_asteroids:
+            for asteroid in self.asteroids[self.max_asteroids:]:
+                self.asteroid_pool.release(asteroid)
+            del self.asteroids[self.max_asteroids:]
+
+    def spawn_asteroid(self):
+        """
+        Создает (или берет из пула) один астероид в случайном месте со случайной скоростью.
+
+        Возвращает:
+            Asteroid: Созданный астероид.
+        """
+        x = self.rng.randint(0, SCREEN_WIDTH)  # Случайная координата x
+        y = self.rng.randint(0, SCREEN_HEIGHT)  # Случайная координата y
+        dx = self.rng.uniform(-self.asteroid_speed, self.asteroid_speed)  # Случайная скорость по x
+        dy = self.rng.uniform(-self.asteroid_speed, self.asteroid_speed)  # Случайная скорость по y
+        asteroid = self.asteroid_pool.acquire(x, y, dx, dy, self.rng)
+        if self.asteroid_store is None:
+            self.asteroids.append(asteroid)  # В режиме хранилища астероид добавляется в него сам
+        asteroid.id = self.new_id()
+        return asteroid
+
+    def game_over(self):
+        """Обрабатывает потерю последней жизни: убирает корабль и все астероиды, кроме "убийцы"."""
+        game_log.info("Game Over! Finalizing animations...")
+        self.game_over_in_progress = True
+        self.ship = None
+
+        if self.asteroid_store is not None:
+            for asteroid in self.asteroid_store.compact(self.asteroid_store.removable(0, absent=FLAG_EXPLODING)):
+                self.asteroid_pool.release(asteroid)
+        else:
+            remove_finished(self.asteroids, lambda asteroid: not asteroid.exploding, self.asteroid_pool)
+
+    def finalize_game_over(self):
+        """Убирает оставшиеся объекты и завершает игру."""
+        for rocket in self.rockets:
+            rocket.expired = True  # Освобождает слоты кольцевого буфера
+        for asteroid in self.asteroids:
+            self.asteroid_pool.release(asteroid)
+        if self.asteroid_store is not None:
+            self.asteroid_store.clear()
+            self.rocket_store.clear()
+        self.asteroids.clear()
+        self.rockets.clear()
+        self.running = False
+        self.finished = True
+        game_log.info("Game Over sequence completed.")
+
+
+def apply_ship_inputs(ship, inputs, dt=1):
+    """
+    Поворачивает корабль, включает или выключает тягу по битам управления и продвигает его на шаг.
+    Выстрел обрабатывает симуляция. Шаг в несколько тиков выполняется по тикам, чтобы
+    положение точно совпадало с пошаговым прогоном.
+
+    Аргументы:
+        ship (Ship): Корабль.
+        inputs (int): Битовая маска управления.
+        dt (int): Длительность шага в тиках.
+    """
+    ship.thrusting = bool(inputs & INPUT_THRUST)
+    for _ in range(dt):
+        if inputs & INPUT_LEFT:
+            ship.rotate(-SHIP_ROTATION_SPEED)
+        if inputs & INPUT_RIGHT:
+            ship.rotate(SHIP_ROTATION_SPEED)
+        ship.update()
+
+
+def ship_path(ship, inputs, ticks):
+    """
+    Находит положения корабля в конце каждого из ближайших тиков, не меняя сам корабль.
+
+    Аргументы:
+        ship (Ship): Корабль.
+        inputs (int): Битовая маска управления.
+        ticks (int): Количество тиков.
+
+    Возвращает:
+        list: Положения (x, y).
+    """
+    probe = copy.copy(ship)
+    path = []
+    for _ in range(ticks):
+        apply_ship_inputs(probe, inputs)
+        path.append((probe.x, probe.y))
+    return path
+
+
+def rocket_finished(rocket):
+    """Проверяет, что ракета больше не участвует в игре."""
+    return rocket.expired
+
+
+def asteroid_finished(asteroid):
+    """Проверяет, что астероид разрушен и его взрыв завершился."""
+    return asteroid.destroyed and not asteroid.exploding
+
+
+def remove_finished(objects, finished, pool=None):
+    """
+    Удаляет из списка завершившиеся объекты на месте, сохраняя порядок оставшихся.
+
+    Аргументы:
+        objects (list): Список объектов симуляции.
+        finished (callable): Функция finished(obj), проверяющая, нужно ли удалить объект.
+        pool (ObjectPool): Пул, в который возвращаются удаленные объекты (None — не возвращать).
+    """
+    kept = 0
+    for obj in objects:
+        if finished(obj):
+            if pool is not None:
+                pool.release(obj)
+        else:
+            objects[kept] = obj
+            kept += 1
+    del objects[kept:]
+
+
+def random_policy(rng):
+    """
+    Создает политику управления, выбирающую случайные биты управления каждый тик.
+
+    Аргументы:
+        rng (random.Random): Генератор случайных чисел политики.
+
+    Возвращает:
+        callable: Функция policy(simulation).
+    """
+    def policy(simulation):
+        return rng.getrandbits(4)
+    return policy
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Запуск симуляции Asteroids без дисплея")
+    parser.add_argument("--ticks", type=int, default=10000, help="Максимальное количество тиков")
+    parser.add_argument("--seed", type=int, default=0, help="Начальное значение генератора")
+    parser.add_argument("--dt", type=int, default=1, help="Количество тиков за один шаг (ускоренная перемотка)")
+    add_log_arguments(parser)
+    args = parser.parse_args()
+    log.configure(args)
+
+    simulation = Simulation(seed=args.seed, dt=args.dt)
+    started = time.perf_counter()
+    ticks = simulation.run(args.ticks, random_policy(random.Random(args.seed)))
+    elapsed = time.perf_counter() - started
+    log.stop()
+    print(f"Ticks: {ticks}, score: {simulation.score}, lives: {simulation.lives}, "
+          f"ticks/sec: {ticks / elapsed:.0f}")
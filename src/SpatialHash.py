@@ -0,0 +1,195 @@
+from src.config import *
+
+
+def wrap_delta(delta, size):
+    """
+    Приводит разность координат к кратчайшей с учетом циклической границы экрана.
+
+    Аргументы:
+        delta (float): Разность координат.
+        size (float): Размер экрана по этой оси.
+
+    Возвращает:
+        float: Разность в диапазоне [-size / 2, size / 2].
+    """
+    delta %= size
+    if delta > size / 2:
+        delta -= size
+    return delta
+
+
+def wrapped_distance_sq(x1, y1, x2, y2, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+    """
+    Вычисляет квадрат расстояния между двумя точками на торе (экран с переходом через края).
+
+    Возвращает:
+        float: Квадрат кратчайшего расстояния.
+    """
+    dx = wrap_delta(x2 - x1, width)
+    dy = wrap_delta(y2 - y1, height)
+    return dx * dx + dy * dy
+
+
+def swept_hit_time(dx, dy, vx, vy, radius, dt):
+    """
+    Находит момент, когда точка, движущаяся относительно круга, впервые оказывается внутри него
+    (непрерывная проверка столкновения за шаг вместо проверки только конечного положения).
+
+    Смещение задается для конца шага по кратчайшему пути через края экрана; путь за шаг
+    считается непрерывным, поэтому он должен быть короче половины экрана.
+
+    Аргументы:
+        dx (float): Смещение точки относительно центра круга по x в конце шага.
+        dy (float): Смещение точки относительно центра круга по y в конце шага.
+        vx (float): Скорость точки относительно круга по x (пиксели за тик).
+        vy (float): Скорость точки относительно круга по y (пиксели за тик).
+        radius (float): Радиус круга (для двух кругов — сумма радиусов).
+        dt (float): Длительность шага (тики).
+
+    Возвращает:
+        float: Время от начала шага до столкновения (от 0 до dt) или None, если столкновения нет.
+    """
+    # Смещение в начале шага и квадратное уравнение |start + v * t|^2 = radius^2
+    start_x = dx - vx * dt
+    start_y = dy - vy * dt
+    c = start_x * start_x + start_y * start_y - radius * radius
+    if c < 0:
+        return 0.0  # Точка внутри круга уже в начале шага
+    b = start_x * vx + start_y * vy
+    if b >= 0:
+        return None  # Точка не приближается к кругу
+    a = vx * vx + vy * vy
+    discriminant = b * b - a * c
+    if discriminant < 0:
+        return None  # Путь проходит мимо круга
+    hit_time = (-b - discriminant ** 0.5) / a
+    return hit_time if hit_time <= dt else None
+
+
+def first_hit_tick(dx, dy, vx, vy, radius, ticks):
+    """
+    Находит первый тик, в конце которого точка, движущаяся относительно круга, находится внутри него.
+    Так столкновения проверяются при пошаговом прогоне: касания между тиками не учитываются.
+
+    Аргументы:
+        dx (float): Смещение точки относительно центра круга по x сейчас.
+        dy (float): Смещение точки относительно центра круга по y сейчас.
+        vx (float): Скорость точки относительно круга по x (пиксели за тик).
+        vy (float): Скорость точки относительно круга по y (пиксели за тик).
+        radius (float): Радиус круга.
+        ticks (int): Сколько тиков проверяется.
+
+    Возвращает:
+        int: Номер тика (от 1 до ticks) или None, если столкновения нет.
+    """
+    # Непрерывная проверка отсекает пути, которые не касаются круга совсем
+    hit_time = swept_hit_time(dx + vx * ticks, dy + vy * ticks, vx, vy, radius, ticks)
+    if hit_time is None:
+        return None
+    radius_sq = radius * radius
+    for tick in range(max(1, int(hit_time)), ticks + 1):
+        x = dx + vx * tick
+        y = dy + vy * tick
+        if x * x + y * y < radius_sq:
+            return tick
+    return None
+
+
+class SpatialHash:
+    """
+    Класс SpatialHash представляет равномерную сетку на торе для быстрого поиска
+    объектов, находящихся рядом с точкой (широкая фаза проверки столкновений).
+
+    Атрибуты:
+        cols (int): Количество столбцов сетки.
+        rows (int): Количество строк сетки.
+        cell_width (float): Ширина ячейки в пикселях.
+        cell_height (float): Высота ячейки в пикселях.
+        cells (dict): Списки объектов по ключу (столбец, строка).
+    """
+
+    def __init__(self, cell_size=COLLISION_CELL_SIZE, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        """
+        Инициализация объекта SpatialHash.
+
+        Ячейки подгоняются так, чтобы сетка целиком покрывала экран без остатка.
+
+        Аргументы:
+            cell_size (float): Желаемый размер ячейки в пикселях.
+            width (float): Ширина экрана.
+            height (float): Высота экрана.
+        """
+        self.cols = max(1, int(width // cell_size))
+        self.rows = max(1, int(height // cell_size))
+        self.cell_width = width / self.cols
+        self.cell_height = height / self.rows
+        self.cells = {}
+
+    def clear(self):
+        """Удаляет все объекты из сетки."""
+        self.cells.clear()
+
+    def cell_of(self, x, y):
+        """
+        Возвращает ячейку, в которую попадает точка.
+
+        Возвращает:
+            tuple: Ключ ячейки (столбец, строка).
+        """
+        return int(x // self.cell_width) % self.cols, int(y // self.cell_height) % self.rows
+
+    def insert(self, item, x, y, radius):
+        """
+        Добавляет круглый объект во все ячейки, которые пересекает его описанный квадрат.
+
+        Аргументы:
+            item: Добавляемый объект (например, индекс астероида).
+            x (float): Координата x центра.
+            y (float): Координата y центра.
+            radius (float): Радиус объекта.
+        """
+        first_col = int((x - radius) // self.cell_width)
+        last_col = int((x + radius) // self.cell_width)
+        first_row = int((y - radius) // self.cell_height)
+        last_row = int((y + radius) // self.cell_height)
+        # Ячейки считаются по модулю, поэтому крупный объект не попадает в одну ячейку дважды
+        cols = {col % self.cols for col in range(first_col, last_col + 1)}
+        rows = {row % self.rows for row in range(first_row, last_row + 1)}
+        for col in cols:
+            for row in rows:
+                self.cells.setdefault((col, row), []).append(item)
+
+    def query(self, x, y):
+        """
+        Возвращает объекты, которые могут содержать точку.
+
+        Возвращает:
+            list: Объекты из ячейки, в которую попадает точка.
+        """
+        return self.cells.get(self.cell_of(x, y), [])
+
+    def query_segment(self, x1, y1, x2, y2):
+        """
+        Возвращает объекты, которые могут пересекать отрезок: все объекты ячеек,
+        которые пересекает описанный вокруг отрезка прямоугольник.
+
+        Аргументы:
+            x1 (float): Координата x начала отрезка (может лежать за краем экрана).
+            y1 (float): Координата y начала отрезка.
+            x2 (float): Координата x конца отрезка.
+            y2 (float): Координата y конца отрезка.
+
+        Возвращает:
+            set: Объекты без повторов.
+        """
+        first_col = int(min(x1, x2) // self.cell_width)
+        last_col = int(max(x1, x2) // self.cell_width)
+        first_row = int(min(y1, y2) // self.cell_height)
+        last_row = int(max(y1, y2) // self.cell_height)
+        cols = {col % self.cols for col in range(first_col, last_col + 1)}
+        rows = {row % self.rows for row in range(first_row, last_row + 1)}
+        found = set()
+        for col in cols:
+            for row in rows:
+                found.update(self.cells.get((col, row), ()))
+        return found
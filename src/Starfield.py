@@ -0,0 +1,190 @@
+from collections import deque
+
+from src.AssetManager import assets
+from src.config import *
+
+
+class StarfieldLayer:
+    """
+    Класс StarfieldLayer — один слой звездного поля: звезды и астероиды, которые
+    движутся влево с общей скоростью.
+
+    Слой сдвигается одним вызовом canvas.move по своему тегу. Все элементы слоя
+    движутся одинаково, поэтому их порядок по x сохраняется, и элементы хранятся
+    в очереди от левого к правому: за левый край выходят только элементы из начала
+    очереди. Такие элементы переносятся вправо на ширину полосы и встают в конец очереди.
+    Координата элемента хранится без общего сдвига слоя, поэтому кадр обходится
+    без перебора всех элементов.
+
+    Атрибуты:
+        tag (str): Тег элементов слоя на холсте.
+        speed (float): Скорость слоя (пиксели в секунду).
+        star_size (int): Размер звезд (пиксели).
+        color (str): Цвет звезд.
+        margin (float): Запас за краями экрана (половина размера самого крупного элемента).
+        span (float): Ширина полосы, по которой элементы переходят с левого края на правый.
+        stars (list): Звезды: пары (x, y).
+        rocks (list): Астероиды: кортежи (x, y, размер).
+        items (collections.deque): Элементы холста от левого к правому: списки [x без сдвига, идентификатор].
+        shift (float): Общий сдвиг слоя (пиксели).
+    """
+
+    def __init__(self, index, speed, star_size, color, margin):
+        """
+        Инициализация объекта StarfieldLayer.
+
+        Аргументы:
+            index (int): Номер слоя (от дальнего к ближнему).
+            speed (float): Скорость слоя (пиксели в секунду).
+            star_size (int): Размер звезд (пиксели).
+            color (str): Цвет звезд.
+            margin (float): Запас за краями экрана (пиксели).
+        """
+        self.tag = f"{STARFIELD_TAG}{index}"
+        self.speed = speed
+        self.star_size = star_size
+        self.color = color
+        self.margin = margin
+        self.span = SCREEN_WIDTH + 2 * margin
+        self.stars = []
+        self.rocks = []
+        self.items = deque()
+        self.shift = 0.0
+
+    def add_items(self, created):
+        """
+        Добавляет созданные элементы в очередь, сохраняя порядок по x.
+
+        Аргументы:
+            created (list): Пары (x, идентификатор): элементы, созданные в точке x на экране.
+        """
+        entries = list(self.items) + [[x - self.shift, item] for x, item in created]
+        entries.sort(key=lambda entry: entry[0])
+        self.items = deque(entries)
+
+    def advance(self, canvas, elapsed):
+        """
+        Сдвигает слой за прошедшее время и переносит вышедшие за левый край элементы.
+
+        Аргументы:
+            canvas (tk.Canvas): Холст.
+            elapsed (float): Прошедшее время (секунды).
+        """
+        dx = -self.speed * elapsed
+        if not self.items or dx == 0:
+            return
+        canvas.move(self.tag, dx, 0)
+        self.shift += dx
+
+        items = self.items
+        limit = -self.margin - self.shift
+        while items[0][0] < limit:
+            entry = items.popleft()
+            entry[0] += self.span
+            canvas.move(entry[1], self.span, 0)
+            items.append(entry)
+
+
+class Starfield:
+    """
+    Класс Starfield рисует фон с параллаксом: несколько слоев звезд и астероидов
+    (STARFIELD_LAYERS в config.py), которые движутся с разной скоростью.
+
+    Звезды — прямоугольники холста и создаются сразу. Астероидам нужны изображения,
+    поэтому они создаются в add_rocks, когда изображения загружены (их размеры
+    возвращает rock_sizes). Каждый слой за кадр сдвигается одним вызовом canvas.move
+    по тегу; отдельно перемещаются только элементы, перешедшие через левый край.
+
+    Атрибуты:
+        canvas (tk.Canvas): Холст.
+        layers (list): Слои StarfieldLayer от дальнего к ближнему.
+        last_update (float): Время последнего сдвига (None до первого вызова update).
+        rocks_added (bool): Флаг, указывающий, что астероиды уже созданы.
+    """
+
+    def __init__(self, canvas, rng, layers=STARFIELD_LAYERS, density=STARFIELD_DENSITY):
+        """
+        Инициализация объекта Starfield: раскладывает звезды и астероиды и создает звезды.
+
+        Аргументы:
+            canvas (tk.Canvas): Холст.
+            rng (random.Random): Генератор случайных чисел для раскладки.
+            layers (tuple): Описания слоев от дальнего к ближнему (см. STARFIELD_LAYERS).
+            density (float): Множитель количества звезд и астероидов.
+        """
+        self.canvas = canvas
+        self.layers = []
+        self.last_update = None
+        self.rocks_added = False
+        for index, spec in enumerate(layers):
+            low, high = spec.get("rock_sizes", (0, 0))
+            margin = max(spec["star_size"], high) / 2
+            layer = StarfieldLayer(index, spec["speed"], spec["star_size"], spec["color"], margin)
+            for _ in range(int(spec["stars"] * density)):
+                x = rng.uniform(-margin, SCREEN_WIDTH + margin)
+                layer.stars.append((x, rng.uniform(0, SCREEN_HEIGHT)))
+            for _ in range(int(spec.get("rocks", 0) * density)):
+                # Размер кратен шагу привязки, чтобы астероиды слоя делили немногие изображения
+                bucket = max(1, ASTEROID_RADIUS_BUCKET)
+                size = max(bucket, rng.randint(low, high) // bucket * bucket)
+                x = rng.uniform(-margin, SCREEN_WIDTH + margin)
+                layer.rocks.append((x, rng.uniform(0, SCREEN_HEIGHT), size))
+            self.layers.append(layer)
+        self.add_stars()
+
+    def rock_sizes(self):
+        """Возвращает размеры астероидов всех слоев (для загрузки изображений)."""
+        return sorted({size for layer in self.layers for x, y, size in layer.rocks})
+
+    def add_stars(self):
+        """Создает звезды всех слоев."""
+        for layer in self.layers:
+            size = layer.star_size
+            layer.add_items([
+                (x, self.canvas.create_rectangle(x, y, x + size, y + size, fill=layer.color, outline="",
+                                                 tags=(STARFIELD_TAG, layer.tag)))
+                for x, y in layer.stars
+            ])
+        self.restack()
+
+    def add_rocks(self):
+        """Создает астероиды всех слоев (их изображения должны быть загружены)."""
+        if self.rocks_added:
+            return
+        self.rocks_added = True
+        for layer in self.layers:
+            layer.add_items([
+                (x, self.canvas.create_image(x, y, image=assets.get_photo(ASTEROID_SPRITE, (size, size)),
+                                             tags=(STARFIELD_TAG, layer.tag)))
+                for x, y, size in layer.rocks
+            ])
+        self.restack()
+
+    def restack(self):
+        """Опускает слои под все остальные элементы холста: дальний слой — в самый низ."""
+        for layer in reversed(self.layers):
+            self.canvas.tag_lower(layer.tag)
+
+    def update(self, now, interval=0.0):
+        """
+        Сдвигает слои на расстояние, пройденное с предыдущего сдвига.
+
+        Аргументы:
+            now (float): Текущее время (секунды, time.perf_counter).
+            interval (float): Минимальный период сдвигов (секунды); более частые вызовы пропускаются.
+        """
+        if self.last_update is None:
+            self.last_update = now
+            return
+        elapsed = now - self.last_update
+        if elapsed < interval:
+            return
+        self.last_update = now
+        for layer in self.layers:
+            layer.advance(self.canvas, elapsed)
+
+    def remove(self):
+        """Удаляет все элементы звездного поля с холста."""
+        self.canvas.delete(STARFIELD_TAG)
+        for layer in self.layers:
+            layer.items.clear()
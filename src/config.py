@@ -9,11 +9,121 @@ SHIP_THRUST = 0.1  # Ускорение корабля при движении 
 SHIP_ROTATION_SPEED = 3  # Скорость вращения корабля (градусы за кадр)
 ROCKET_SPEED = 8  # Скорость ракеты (пиксели за кадр)
 ROCKET_LIFETIME = 50  # Время жизни ракеты (в кадрах)
+ROCKET_CAPACITY = 16  # Максимальное количество ракет в полете (размер кольцевого буфера)
+ROCKET_FIRE_COOLDOWN = 4  # Минимальный интервал между выстрелами (тики)
+ASTEROID_EXPLOSION_TICKS = 20  # Длительность анимации взрыва астероида (тики)
 MIN_ASTEROIDS = 5  # Минимальное количество астероидов на экране
 MAX_ASTEROIDS = 10  # Максимальное количество астероидов на экране
+ASTEROID_SPAWN_INTERVAL = 1  # Период появления новых астероидов (тики)
+ASTEROID_ROTATION_STEP = 5  # Шаг квантования угла поворота астероида (градусы)
+ROTATION_CACHE_BUDGET = 32 * 1024 * 1024  # Бюджет памяти кэша повернутых кадров (байты)
+COLLISION_CELL_SIZE = 80  # Размер ячейки сетки для поиска столкновений (пиксели)
+TICK_RATE = 60  # Частота тиков симуляции (тиков в секунду)
+RENDER_RATE = 60  # Частота отрисовки (кадров в секунду)
+MAX_TICKS_PER_FRAME = 5  # Максимум тиков симуляции за кадр (защита от лавинообразного отставания)
+INTERPOLATION_SNAP_DISTANCE = 100  # Перемещение за тик, начиная с которого объект не интерполируется (пиксели)
+PROFILER_WINDOW = 600  # Количество последних кадров для расчета перцентилей профилировщика
+PROFILER_OVERLAY_INTERVAL = 15  # Период обновления оверлея профилировщика (кадры)
+PROFILER_HOTKEY = "<F3>"  # Клавиша включения оверлея профилировщика
+MEMORY_HOTKEY = "<F4>"  # Клавиша включения оверлея памяти (MemoryMonitor)
+MEMORY_SAMPLE_INTERVAL = 60  # Период замеров памяти (кадры)
+MEMORY_HISTORY = 3600  # Количество хранимых замеров памяти
+MEMORY_DUMP_INTERVAL = 10  # Период сохранения замеров памяти в JSON (замеры)
+MEMORY_TOP_ALLOCATIONS = 10  # Количество мест с наибольшими выделениями памяти в отчете (tracemalloc)
+MEMORY_WARMUP_SAMPLES = 5  # Замеры до базового: в начале игры заполняются кэши и пулы
+MEMORY_SOAK_LIMITS = {  # Допустимый рост счетчиков памяти относительно базового замера
+    "tk_images": 64,  # Живые изображения Tk
+    "canvas_items": 256,  # Элементы холста
+    "sprites": 128,  # Спрайты способа отрисовки "canvas" (включая скрытые в запасе)
+    "python_objects": 50000,  # Объекты под наблюдением сборщика мусора
+    "traced_kb": 16384,  # Память, выделенная Python (КБ; только с tracemalloc)
+}
+PRELOAD_POLL_INTERVAL = 15  # Период опроса очереди фоновой загрузки спрайтов (миллисекунды)
+PRELOAD_FRAME_BUDGET = 0.004  # Время потока Tk на создание загруженных изображений за один опрос (секунды)
+RENDERER = "canvas"  # Способ отрисовки: "canvas" (элемент холста на объект), "framebuffer" (один кадр-изображение), "null"
+CANVAS_BATCH_COMMANDS = True  # Отправлять команды холста способа "canvas" одним вызовом Tcl за кадр
+QUALITY_LEVEL = "high"  # Начальный уровень качества (имя из QUALITY_LEVELS)
+QUALITY_ADAPTIVE = True  # Понижать и повышать качество по времени кадра (QualityGovernor)
+QUALITY_WINDOW = 30  # Количество кадров, по которым принимается решение о смене качества
+QUALITY_HEADROOM = 0.6  # Доля бюджета кадра, при которой качество повышается
+QUALITY_LEVELS = ("low", "medium", "high")  # Уровни качества от низкого к высокому
+QUALITY_PRESETS = {  # Параметры уровней качества
+    "high": {
+        "rotation_interval": 1,  # Период обновления угла спрайтов астероидов (кадры)
+        "rotation_min_radius": 0,  # Спрайты астероидов меньшего радиуса не вращаются
+        "rotation_max_distance": None,  # Спрайты астероидов дальше от корабля не вращаются (None — все вращаются)
+        "starfield_interval": 0,  # Минимальный период сдвига звездного поля (миллисекунды; 0 — каждый кадр)
+        "explosion_frames": 2,  # Количество кадров анимации взрыва
+        "spawn_interval": 1,  # Период появления новых астероидов (тики)
+    },
+    "medium": {
+        "rotation_interval": 2,
+        "rotation_min_radius": 25,
+        "rotation_max_distance": 400,
+        "starfield_interval": 33,
+        "explosion_frames": 2,
+        "spawn_interval": 1,
+    },
+    "low": {
+        "rotation_interval": 4,
+        "rotation_min_radius": 35,
+        "rotation_max_distance": 250,
+        "starfield_interval": 100,
+        "explosion_frames": 1,
+        "spawn_interval": 30,
+    },
+}
+STARFIELD_TAG = "starfield"  # Тег элементов звездного поля на холсте (слои получают тег с номером)
+STARFIELD_DENSITY = 1.0  # Множитель количества звезд и астероидов звездного поля
+STARFIELD_LAYERS = (  # Слои звездного поля от дальнего к ближнему
+    # speed — скорость (пиксели в секунду), stars — количество звезд, star_size — размер звезды (пиксели),
+    # color — цвет звезд, rocks — количество астероидов, rock_sizes — диапазон их размеров (пиксели)
+    {"speed": 8, "stars": 300, "star_size": 1, "color": "#5a5a5a"},
+    {"speed": 20, "stars": 150, "star_size": 1, "color": "#9a9a9a", "rocks": 6, "rock_sizes": (20, 35)},
+    {"speed": 45, "stars": 60, "star_size": 2, "color": "#ffffff", "rocks": 8, "rock_sizes": (30, 60)},
+)
+HUD_TAG = "hud"  # Тег слоя интерфейса на холсте (сердечки, счет, индикаторы)
+REPLAY_CHECKSUM_INTERVAL = 60  # Период записи контрольных сумм состояния в запись игры (тики)
+QUICKSAVE_PATH = "quicksave.state"  # Файл быстрого сохранения состояния игры
+QUICKSAVE_HOTKEY = "<F5>"  # Клавиша быстрого сохранения
+QUICKLOAD_HOTKEY = "<F9>"  # Клавиша быстрой загрузки
+REWIND_HOTKEY = "<BackSpace>"  # Клавиша перемотки назад
+REWIND_SECONDS = 10  # Сколько последних секунд игры можно перемотать назад
+REWIND_INTERVAL = 15  # Период сохранения состояний для перемотки (тики)
+REWIND_STEP = 2  # Перемотка за одно нажатие (секунды)
+RESULTS_PATH = "results.dat"  # Файл результатов игр (индекс рядом, с суффиксом .idx)
+RESULTS_INDEX_TOP = 100  # Количество лучших результатов в индексе (больше — просмотр всего файла)
+RESULTS_LEADERBOARD_SIZE = 10  # Размер таблицы лучших результатов на стартовом экране
+RESULTS_POLL_INTERVAL = 50  # Период проверки, прочитана ли таблица лучших результатов (миллисекунды)
+ENV_OBSERVATION = "nearest"  # Вид наблюдения сред обучения: "nearest" (ближайшие астероиды) или "grid" (сетка)
+ENV_NEAREST_ASTEROIDS = 5  # Количество ближайших астероидов в наблюдении
+ENV_GRID_SIZE = (12, 16)  # Размер сетки занятости в наблюдении (строки, столбцы)
+ENV_LIFE_PENALTY = 10  # Штраф к награде за потерянную жизнь
+ENV_MAX_TICKS = 36000  # Максимальная длительность эпизода среды (тики)
+USE_ENTITY_STORE = False  # Хранить астероиды и ракеты в массивах NumPy (если NumPy установлен)
+COLLISION_BRUTE_FORCE = False  # Проверять все пары объектов без сетки (эталонный режим для сравнения)
+COLLISION_SWEPT = False  # Проверять столкновения по пути объектов за тик, а не только по конечным положениям
+NET_HOST = "127.0.0.1"  # Адрес сервера сетевой игры по умолчанию
+NET_PORT = 47800  # UDP-порт сервера сетевой игры
+NET_MAX_PLAYERS = 8  # Максимальное количество игроков сетевой игры
+NET_SNAPSHOT_INTERVAL = 2  # Период отправки снимков состояния клиентам (тики)
+NET_HISTORY = 64  # Количество хранимых снимков, относительно которых можно сжимать новые
+NET_INPUT_REDUNDANCY = 4  # Количество последних команд управления в каждом пакете клиента (на случай потерь)
+NET_INTERPOLATION_DELAY = 4  # Отставание отрисовки чужих объектов от последнего снимка (тики)
+NET_POSITION_SCALE = 8  # Точность передачи координат (доли пикселя)
+NET_CLIENT_TIMEOUT = 5.0  # Время без пакетов, после которого клиент отключается (секунды)
+LOG_LEVEL = "WARNING"  # Уровень журнала по умолчанию (DEBUG, INFO, WARNING, ERROR, OFF)
+LOG_CATEGORY_LEVELS = {}  # Уровни отдельных категорий журнала, например {"collision": "DEBUG"}
+LOG_BUFFER_SIZE = 4096  # Размер кольцевого буфера журнала (записи)
+LOG_FLUSH_INTERVAL = 0.25  # Период вывода записей журнала фоновым потоком (секунды)
 
-SPRITE_FOLDER = "public"  # Папка, где хранятся файлы спрайтов
+SPRITE_FOLDER = "public"  # Папка, где хранятся файлы спрайтов (относительно папки src)
 HEART_IMAGE_SIZE = 32  # Размер изображения сердца (пиксели)
 HEART_IMAGE_FILENAME = f"heart pixel art {HEART_IMAGE_SIZE}x{HEART_IMAGE_SIZE}.png"  # Имя файла изображения сердца
-STATIC_SHIP_SPRITE = "static_ship.png"  # Имя файла спрайта корабля в статическом состоянии
-THRUSTING_SHIP_SPRITE = "thrusting_ship.png"  # Имя файла спрайта корабля при ускорении
+STATIC_SHIP_SPRITE = "new_static_ship.png"  # Имя файла спрайта корабля в статическом состоянии
+THRUSTING_SHIP_SPRITE = "new_thrusting_ship.png"  # Имя файла спрайта корабля при ускорении
+SHIP_IMAGE_SIZE = 60  # Размер изображения корабля (пиксели)
+ASTEROID_SPRITE = "asteroid_old.png"  # Имя файла спрайта астероида
+EXPLOSION_SPRITES = ("explosion1.png", "explosion2.png")  # Имена файлов кадров анимации взрыва
+ROCKET_SPRITE = "rocket.png"  # Имя файла спрайта ракеты
+ASTEROID_RADIUS_BUCKET = 5  # Шаг привязки размеров спрайтов астероидов к общим вариантам (0 — без привязки); радиус столкновений не меняется
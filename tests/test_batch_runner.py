@@ -0,0 +1,25 @@
+"""Показатели игр пакетного прогона."""
+import random
+
+from src.BatchRunner import RESULT_COLUMNS, run_game
+from src.MultiplayerSimulation import MultiplayerSimulation
+from src.config import *
+
+
+def test_run_game_reports_rocket_hits():
+    row = run_game({"MIN_ASTEROIDS": 12}, 3, "spin", 3000)
+    assert set(RESULT_COLUMNS) <= set(row)
+    assert row["hits"] > 0
+    assert row["hits"] == row["score"] - INITIAL_SCORE  # В одиночной игре каждое попадание дает очко
+
+
+def test_hits_are_counted_in_multiplayer_games():
+    sim = MultiplayerSimulation(seed=5)
+    sim.add_player()
+    sim.add_player()
+    sim.start()
+    rng = random.Random(5)
+    while sim.running and sim.tick < 3000:
+        sim.step({number: rng.getrandbits(4) for number in sim.players})
+    assert sim.hits > 0
+    assert sim.hits == sum(player.score - INITIAL_SCORE for player in sim.players.values())
@@ -0,0 +1,104 @@
+"""
+Дифференциальная проверка сетки столкновений: симуляция с сеткой и симуляция с перебором
+всех пар (эталонный режим brute_force) с одинаковыми начальными значениями должны совпадать
+по контрольной сумме после каждого шага — и в обычных играх, и для пар объектов
+по разные стороны края экрана.
+"""
+import random
+
+import pytest
+
+from src.Simulation import Simulation, random_policy
+from src.config import *
+
+# Режимы проверки столкновений: (dt, непрерывная проверка)
+MODES = {
+    "discrete": (1, False),
+    "continuous": (1, True),
+    "multi-tick": (4, False),
+}
+
+
+def make_simulation(seed, mode, brute_force, **params):
+    """Создает симуляцию в списковом режиме (сетка используется только в нем)."""
+    dt, swept = MODES[mode]
+    sim = Simulation(seed=seed, use_store=False, dt=dt, swept=swept)
+    sim.brute_force = brute_force
+    sim.set_params(params)
+    return sim
+
+
+def assert_same_every_step(grid_sim, brute_sim, steps, policy_seed):
+    """Прогоняет обе симуляции с одинаковым управлением и сравнивает их после каждого шага."""
+    grid_policy = random_policy(random.Random(policy_seed))
+    brute_policy = random_policy(random.Random(policy_seed))
+    for _ in range(steps):
+        if not grid_sim.running:
+            break
+        grid_sim.step(grid_policy(grid_sim))
+        brute_sim.step(brute_policy(brute_sim))
+        assert grid_sim.checksum() == brute_sim.checksum(), f"diverged at tick {grid_sim.tick}"
+    assert grid_sim.running == brute_sim.running
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("seed", range(5))
+def test_grid_matches_brute_force(seed, mode):
+    params = {"MIN_ASTEROIDS": 25, "MAX_ASTEROIDS": 25, "ASTEROID_SPEED": 4}
+    grid_sim = make_simulation(seed, mode, False, **params)
+    brute_sim = make_simulation(seed, mode, True, **params)
+    grid_sim.start()
+    brute_sim.start()
+    assert_same_every_step(grid_sim, brute_sim, 2000 // grid_sim.dt, seed)
+    assert grid_sim.score > 0
+
+
+def place_asteroid(sim, x, y, dx=0.0, dy=0.0):
+    """Добавляет астероид в заданное место с заданной скоростью."""
+    asteroid = sim.spawn_asteroid()
+    asteroid.x, asteroid.y, asteroid.velocity_x, asteroid.velocity_y = x, y, dx, dy
+    return asteroid
+
+
+def place_rocket(sim, x, y, angle):
+    """Добавляет ракету в заданное место с заданным направлением."""
+    rocket = sim.rocket_pool.acquire(x, y, angle)
+    sim.rockets.append(rocket)
+    rocket.id = sim.new_id()
+    rocket.lifetime = sim.rocket_lifetime
+    return rocket
+
+
+def edge_scene(sim):
+    """
+    Расставляет пары объектов по разные стороны краев экрана: ракеты долетают до астероидов
+    только через край, а корабль касается астероида в противоположном углу.
+    """
+    sim.start()
+    sim.asteroids.clear()
+    sim.ship.x, sim.ship.y = SCREEN_WIDTH - 4, SCREEN_HEIGHT - 3
+    place_asteroid(sim, 3, 2)  # Корабль в противоположном углу
+    place_asteroid(sim, 2, SCREEN_HEIGHT / 2, dx=-1.5)  # Уходит за левый край
+    place_asteroid(sim, SCREEN_WIDTH - 1, 150)
+    place_asteroid(sim, SCREEN_WIDTH / 2, SCREEN_HEIGHT - 2, dy=1.5)  # Уходит за нижний край
+    place_asteroid(sim, 400, 1)
+    place_rocket(sim, SCREEN_WIDTH - 30, SCREEN_HEIGHT / 2, 0)  # Вправо через край
+    place_rocket(sim, 25, 150, 180)  # Влево через край
+    place_rocket(sim, SCREEN_WIDTH / 2, 25, 270)  # Вверх через край
+    place_rocket(sim, 400, SCREEN_HEIGHT - 25, 90)  # Вниз через край
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_grid_matches_brute_force_across_screen_edges(mode):
+    params = {"MIN_ASTEROIDS": 0}
+    grid_sim = make_simulation(0, mode, False, **params)
+    brute_sim = make_simulation(0, mode, True, **params)
+    edge_scene(grid_sim)
+    edge_scene(brute_sim)
+    assert grid_sim.checksum() == brute_sim.checksum()
+    for _ in range(40 // grid_sim.dt):
+        grid_sim.step()
+        brute_sim.step()
+        assert grid_sim.checksum() == brute_sim.checksum(), f"diverged at tick {grid_sim.tick}"
+    assert grid_sim.score == 4  # Все ракеты попали через край
+    assert grid_sim.lives == LIVES - 1  # Корабль столкнулся через угол
@@ -0,0 +1,47 @@
+"""Чтение кольцевого буфера журнала."""
+import io
+
+from src.Log import INFO, Log
+
+
+def fill(log, count):
+    for number in range(count):
+        log.record(INFO, "game", "record %s", (number,))
+
+
+def test_recent_keeps_full_buffer_without_concurrent_writes():
+    log = Log(capacity=8)
+    fill(log, 5)
+    assert log.recent() == (0, log.records[:5])
+    fill(log, 15)
+    start, batch = log.recent()
+    assert start == 12
+    assert [record[4] for record in batch] == [(number,) for number in range(7, 15)]
+
+
+def test_concurrent_read_skips_slot_being_overwritten():
+    log = Log(capacity=8)
+    fill(log, 20)
+    start, batch = log.recent(concurrent=True)
+    assert start == 13
+    assert len(batch) == 7
+
+
+def test_flush_outside_writer_thread_keeps_full_buffer():
+    log = Log(capacity=8)
+    log.stream = io.StringIO()  # Вывод без фонового потока, как после stop
+    fill(log, 20)
+    log.flush()
+    assert log.dropped == 12
+    assert len(log.stream.getvalue().splitlines()) == 8
+
+
+def test_dump_keeps_full_buffer(tmp_path):
+    path = tmp_path / "crash.log"
+    log = Log(capacity=8)
+    fill(log, 20)
+    log.dump(str(path))
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "... 12 earlier record(s) not kept"
+    assert len(lines) == 9
+    assert lines[-1].endswith("record 19")
@@ -0,0 +1,28 @@
+"""Повторное использование спрайтов CanvasRenderer при смене объектов слоя."""
+from benchmarks.stubs import StubCanvas
+from src.Renderer import CanvasRenderer
+
+
+def visible_items(canvas):
+    return {item for item, options in canvas.items.items() if options.get("state") != "hidden"}
+
+
+def test_removed_objects_are_hidden_when_replaced_by_new_ones(monkeypatch):
+    monkeypatch.setattr(CanvasRenderer, "photo", staticmethod(lambda frame: frame))
+    canvas = StubCanvas()
+    renderer = CanvasRenderer(canvas, batch=False)
+    first, second, third = object(), object(), object()
+
+    renderer.draw_layer("asteroids", [(first, 10, 10, "a"), (second, 20, 20, "a")])
+    assert len(visible_items(canvas)) == 2
+
+    # Один объект удален, другой появился: число спрайтов не изменилось
+    renderer.draw_layer("asteroids", [(second, 20, 20, "a"), (third, 30, 30, "b")])
+    assert len(canvas.items) == 2  # Спрайт удаленного объекта достался новому
+    assert len(visible_items(canvas)) == 2
+    assert set(renderer.layers["asteroids"]) == {second, third}
+    assert canvas.items[renderer.layers["asteroids"][third][0]]["coords"] == (30, 30)
+
+    renderer.draw_layer("asteroids", [(third, 31, 31, "b")])
+    assert len(visible_items(canvas)) == 1
+    assert renderer.spares["asteroids"]
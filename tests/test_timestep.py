@@ -0,0 +1,65 @@
+"""
+Сравнение шага в несколько тиков с пошаговым прогоном: полные игры с несколькими начальными
+значениями, десятком астероидов, стрельбой и маневрами корабля.
+
+Управление постоянно в пределах блока из BLOCK тиков, а выстрел делается только в первом
+тике блока, поэтому одно и то же управление можно подать и по одному тику, и шагами по 2, 4
+или 8 тиков. Шаг в несколько тиков должен давать в точности тот же результат: счет, жизни
+и контрольная сумма (включая координаты) совпадают в конце каждого блока.
+"""
+import random
+
+import pytest
+
+from src.EntityStore import numpy_available
+from src.Simulation import INPUT_SHOOT, Simulation
+
+SEEDS = range(6)
+BLOCK = 8  # Длина блока с постоянным управлением (тики), кратна всем проверяемым dt
+TICKS = 3000  # Предел длины игры (тики)
+
+
+def block_inputs(seed, block):
+    """Возвращает случайные биты управления для блока с номером block."""
+    return random.Random(seed * 100003 + block).getrandbits(4)
+
+
+def play(seed, dt, use_store=False, brute_force=False):
+    """
+    Прогоняет игру шагами по dt тиков.
+
+    Возвращает:
+        dict: (счет, жизни, контрольная сумма) в конце каждого блока по номеру тика.
+    """
+    sim = Simulation(seed=seed, use_store=use_store, dt=dt)
+    sim.set_params({"MIN_ASTEROIDS": 12, "MAX_ASTEROIDS": 12})
+    sim.brute_force = brute_force
+    sim.start()
+    results = {}
+    while sim.tick < TICKS and sim.running:
+        inputs = block_inputs(seed, sim.tick // BLOCK)
+        if sim.tick % BLOCK:
+            inputs &= ~INPUT_SHOOT
+        sim.step(inputs)
+        if sim.tick % BLOCK == 0 or not sim.running:
+            results[sim.tick] = (sim.score, sim.lives, sim.checksum())
+    return results
+
+
+@pytest.mark.parametrize("dt", [2, 4, 8])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_multi_tick_step_matches_single_ticks(seed, dt):
+    reference = play(seed, 1)
+    assert reference[max(reference)][1] == 0  # Игра доиграна до конца, жизни потеряны
+    assert play(seed, dt) == reference
+
+
+@pytest.mark.skipif(not numpy_available(), reason="NumPy is not installed")
+@pytest.mark.parametrize("seed", SEEDS)
+def test_multi_tick_step_matches_single_ticks_with_store(seed):
+    assert play(seed, 8, use_store=True) == play(seed, 1, use_store=True)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_multi_tick_step_matches_single_ticks_brute_force(seed):
+    assert play(seed, 8, brute_force=True) == play(seed, 1)